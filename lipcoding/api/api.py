@@ -1,13 +1,15 @@
 import logging
+from datetime import datetime
 from typing import List
 
-from django.http import HttpRequest, JsonResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from ninja import NinjaAPI, Router
 from ninja.errors import ValidationError
 from ninja.security import HttpBearer
 import jwt
 from django.conf import settings
 
+from .middleware import precompressed_response
 from .models import User
 from .schemas import (
     LoginSchema,
@@ -16,21 +18,39 @@ from .schemas import (
     TokenSchema,
     MatchRequestCreateSchema,
     MatchRequestResponseSchema,
+    MatchRequestListItemSchema,
     ErrorResponseSchema,
+    SkillFacetsResponseSchema,
+    BulkMatchRequestActionSchema,
+    BulkMatchRequestResponseSchema,
+    EventTicketSchema,
+    MatchEventChangesSchema,
+    MatchStatsSchema,
+    RecommendedMentorSchema,
+    MatchSolveSchema,
+    MatchSolveResultSchema,
 )
 from .services import (
     AuthService,
+    DataVersionService,
+    EventTicketService,
+    MatchEventService,
+    MatchRequestArchiveService,
+    MatchStatsService,
     ProfileService,
     MentorService,
     MatchRequestService,
+    MatchSolverService,
 )
 
 logger = logging.getLogger(__name__)
+auth_logger = logging.getLogger("api.auth")
 
 
 class GlobalAuth(HttpBearer):
     def authenticate(self, request, token):
-        logger.debug(f"Attempting authentication with token: {token}")
+        # 매 요청마다 호출되므로 %-인자로 넘겨 출력 시점(리스너 스레드)에 포맷하고,
+        # 토큰 자체는 남기지 않는다. 성공 로그는 LOGGING의 sample 비율로 표본 추출
         try:
             payload = jwt.decode(
                 token,
@@ -38,25 +58,26 @@ class GlobalAuth(HttpBearer):
                 algorithms=["HS256"],
                 audience="lipcoding-users",
             )
-            logger.debug(f"Decoded JWT payload: {payload}")
             user_id = payload.get("sub")
             if not user_id:
-                logger.warning("JWT payload is missing 'sub' claim.")
+                auth_logger.warning("JWT payload is missing 'sub' claim.")
                 return None
             user = User.objects.get(id=user_id)
-            logger.info(f"Successfully authenticated user: {user.email}")
+            auth_logger.info("Authenticated user %s", user.id)
             return user
         except jwt.ExpiredSignatureError:
-            logger.warning("Authentication failed: Expired signature.")
+            auth_logger.warning("Authentication failed: Expired signature.")
             return None
         except jwt.InvalidTokenError as e:
-            logger.warning(f"Authentication failed: Invalid token. Error: {e}")
+            auth_logger.warning("Authentication failed: Invalid token. Error: %s", e)
             return None
         except User.DoesNotExist:
-            logger.warning("Authentication failed: User does not exist.")
+            auth_logger.warning("Authentication failed: User does not exist.")
             return None
         except Exception as e:
-            logger.error(f"An unexpected error occurred during authentication: {e}")
+            auth_logger.error(
+                "An unexpected error occurred during authentication: %s", e
+            )
             return None
 
 
@@ -138,7 +159,9 @@ def update_profile(request: HttpRequest):
         return 400, {"error": str(e)}
 
 
-@router.get("/images/{role}/{user_id}", response={200: None, 400: dict, 404: dict, 401: dict})
+@router.get(
+    "/images/{role}/{user_id}", response={200: None, 400: dict, 404: dict, 401: dict}
+)
 def get_profile_image(request: HttpRequest, role: str, user_id: int):
     """프로필 이미지 조회 API (DB에서 이미지 데이터 반환)"""
     from django.http import HttpResponse
@@ -155,23 +178,74 @@ def get_profile_image(request: HttpRequest, role: str, user_id: int):
             return 404, {"error": error_message}
 
 
+def _not_modified(request, response: HttpResponse, etag: str):
+    """ETag 설정 후 If-None-Match가 일치하면 304 응답 반환"""
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    if_none_match = request.headers.get("If-None-Match", "")
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if etag in candidates or "*" in candidates:
+        not_modified = HttpResponse(status=304)
+        not_modified["ETag"] = etag
+        not_modified["Cache-Control"] = response["Cache-Control"]
+        return not_modified
+    return None
+
+
+def _parse_skills(skills: str = None) -> List[str]:
+    """콤마로 구분된 스킬 목록 파싱"""
+    if not skills:
+        return []
+    return [name.strip() for name in skills.split(",") if name.strip()]
+
+
 @api.get(
     "/mentors",
     response={
         200: List[ProfileResponseSchema],
+        400: ErrorResponseSchema,
         403: ErrorResponseSchema,
         404: ErrorResponseSchema,
     },
     description="멘토 전체 리스트 조회 (멘티 전용)",
 )
-def get_mentors(request, skill: str = None, order_by: str = None):
+def get_mentors(
+    request,
+    response: HttpResponse,
+    skill: str = None,
+    order_by: str = None,
+    available: bool = None,
+    skills: str = None,
+    match: str = "all",
+):
     """멘토 리스트 조회 - 멘티만 접근 가능"""
     try:
         # 멘티만 접근 가능
         if request.auth.role != "mentee":
             return 403, {"error": "Only mentees can view mentor list"}
 
-        mentor_list = MentorService.get_mentors(skill=skill, order_by=order_by)
+        if match not in ("all", "any"):
+            return 400, {"error": "match 값은 all 또는 any만 허용됩니다."}
+
+        # 멘토 디렉터리 버전이 같으면 목록 조회 없이 304
+        etag = DataVersionService.etag(
+            DataVersionService.MENTORS, request.GET.urlencode()
+        )
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+        # 같은 버전/조건의 압축된 목록이 캐시에 있으면 조회/직렬화 없이 반환
+        cached = precompressed_response(request, etag)
+        if cached:
+            return cached
+
+        mentor_list = MentorService.get_mentors(
+            skill=skill,
+            order_by=order_by,
+            available=available,
+            skills=_parse_skills(skills),
+            match=match,
+        )
         return 200, mentor_list
 
     except Exception as e:
@@ -179,6 +253,63 @@ def get_mentors(request, skill: str = None, order_by: str = None):
         return 500, {"error": "Internal server error"}
 
 
+@api.get(
+    "/mentors/recommended",
+    response={
+        200: List[RecommendedMentorSchema],
+        400: ErrorResponseSchema,
+        403: ErrorResponseSchema,
+        503: ErrorResponseSchema,
+    },
+    description="내 프로필과 요청 이력 기반 멘토 추천 (멘티 전용)",
+)
+def get_recommended_mentors(request, limit: int = 10):
+    """멘토 추천 - 멘티만 접근 가능"""
+    try:
+        # 멘티만 접근 가능
+        if request.auth.role != "mentee":
+            return 403, {"error": "Only mentees can view mentor list"}
+
+        return 200, MentorService.recommend_mentors(request.auth, limit=limit)
+
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    except RuntimeError as e:
+        return 503, {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error recommending mentors: {e}")
+        return 500, {"error": "Internal server error"}
+
+
+@api.get(
+    "/mentors/facets",
+    response={
+        200: SkillFacetsResponseSchema,
+        400: ErrorResponseSchema,
+        403: ErrorResponseSchema,
+    },
+    description="스킬별 멘토 수 조회 (멘티 전용)",
+)
+def get_mentor_facets(request, skills: str = None, match: str = "all"):
+    """스킬 facet 조회 - 멘티만 접근 가능"""
+    try:
+        # 멘티만 접근 가능
+        if request.auth.role != "mentee":
+            return 403, {"error": "Only mentees can view mentor list"}
+
+        if match not in ("all", "any"):
+            return 400, {"error": "match 값은 all 또는 any만 허용됩니다."}
+
+        facets = MentorService.get_skill_facets(
+            skills=_parse_skills(skills), match=match
+        )
+        return 200, facets
+
+    except Exception as e:
+        logger.error(f"Error getting mentor facets: {e}")
+        return 500, {"error": "Internal server error"}
+
+
 @api.post(
     "/match-requests",
     response={
@@ -209,19 +340,44 @@ def create_match_request(request, payload: MatchRequestCreateSchema):
 
 @api.get(
     "/match-requests/incoming",
-    response={200: List[MatchRequestResponseSchema], 403: ErrorResponseSchema},
+    response={
+        200: List[MatchRequestListItemSchema],
+        400: ErrorResponseSchema,
+        403: ErrorResponseSchema,
+    },
     description="나에게 들어온 요청 목록 (멘토 전용)",
 )
-def get_incoming_match_requests(request):
+def get_incoming_match_requests(
+    request,
+    response: HttpResponse,
+    status: str = None,
+    limit: int = None,
+    cursor: str = None,
+    since: datetime = None,
+):
     """들어온 매칭 요청 목록 조회 - 멘토만 접근 가능"""
     try:
         # 멘토만 접근 가능
         if request.auth.role != "mentor":
             return 403, {"error": "Only mentors can view incoming match requests"}
 
-        request_list = MatchRequestService.get_incoming_match_requests(request.auth)
+        etag = DataVersionService.etag(
+            DataVersionService.incoming_key(request.auth.id), request.GET.urlencode()
+        )
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+
+        request_list = MatchRequestService.get_incoming_match_requests(
+            request.auth, status=status, limit=limit, cursor=cursor, since=since
+        )
+        next_cursor = MatchRequestService.next_cursor(request_list, limit)
+        if next_cursor:
+            response["X-Next-Cursor"] = next_cursor
         return 200, request_list
 
+    except ValueError as e:
+        return 400, {"error": str(e)}
     except Exception as e:
         logger.error(f"Error getting incoming match requests: {e}")
         return 500, {"error": "Internal server error"}
@@ -229,28 +385,125 @@ def get_incoming_match_requests(request):
 
 @api.get(
     "/match-requests/outgoing",
-    response={200: List[MatchRequestResponseSchema], 403: ErrorResponseSchema},
+    response={
+        200: List[MatchRequestListItemSchema],
+        400: ErrorResponseSchema,
+        403: ErrorResponseSchema,
+    },
     description="내가 보낸 요청 목록 (멘티 전용)",
 )
-def get_outgoing_match_requests(request):
+def get_outgoing_match_requests(
+    request,
+    response: HttpResponse,
+    status: str = None,
+    limit: int = None,
+    cursor: str = None,
+    since: datetime = None,
+):
     """보낸 매칭 요청 목록 조회 - 멘티만 접근 가능"""
     try:
         # 멘티만 접근 가능
         if request.auth.role != "mentee":
             return 403, {"error": "Only mentees can view outgoing match requests"}
 
-        request_list = MatchRequestService.get_outgoing_match_requests(request.auth)
+        etag = DataVersionService.etag(
+            DataVersionService.outgoing_key(request.auth.id), request.GET.urlencode()
+        )
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+
+        request_list = MatchRequestService.get_outgoing_match_requests(
+            request.auth, status=status, limit=limit, cursor=cursor, since=since
+        )
+        next_cursor = MatchRequestService.next_cursor(request_list, limit)
+        if next_cursor:
+            response["X-Next-Cursor"] = next_cursor
         return 200, request_list
 
+    except ValueError as e:
+        return 400, {"error": str(e)}
     except Exception as e:
         logger.error(f"Error getting outgoing match requests: {e}")
         return 500, {"error": "Internal server error"}
 
 
+@api.get(
+    "/match-requests/stats",
+    response={200: MatchStatsSchema},
+    description="내 매칭 요청 상태별 개수",
+)
+def get_match_request_stats(request):
+    """매칭 요청 통계 조회 - 상태 전이 때 갱신된 카운터를 그대로 반환"""
+    return 200, MatchStatsService.get_stats(request.auth)
+
+
+@api.get(
+    "/match-requests/history",
+    response={200: List[MatchRequestListItemSchema], 400: ErrorResponseSchema},
+    description="보관된 지난 요청 이력 (거절/취소 후 오래된 요청)",
+)
+def get_match_request_history(
+    request,
+    response: HttpResponse,
+    status: str = None,
+    limit: int = None,
+    cursor: str = None,
+):
+    """보관된 매칭 요청 이력 조회 - 멘토는 받은 요청, 멘티는 보낸 요청"""
+    try:
+        request_list = MatchRequestArchiveService.get_archived_match_requests(
+            request.auth, limit=limit, cursor=cursor, status=status
+        )
+        next_cursor = MatchRequestService.next_cursor(request_list, limit)
+        if next_cursor:
+            response["X-Next-Cursor"] = next_cursor
+        return 200, request_list
+
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error getting match request history: {e}")
+        return 500, {"error": "Internal server error"}
+
+
+@api.get(
+    "/match-requests/changes",
+    response={200: MatchEventChangesSchema, 400: ErrorResponseSchema},
+    description="after 이후 나와 관련된 매칭 요청 변경분 (증분 동기화)",
+)
+def get_match_request_changes(request, after: int = None, limit: int = None):
+    """매칭 요청 변경 로그 조회 - after 없이 호출하면 현재 위치(lastSeq)만 반환"""
+    try:
+        return 200, MatchEventService.get_changes(request.auth, after, limit)
+
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error getting match request changes: {e}")
+        return 500, {"error": "Internal server error"}
+
+
+@api.post(
+    "/match-requests/events/ticket",
+    response={200: EventTicketSchema},
+    description="이벤트 스트림(/match-requests/events?ticket=) 연결용 1회용 티켓 발급",
+)
+def issue_match_request_events_ticket(request):
+    """EventSource는 Authorization 헤더를 못 붙이므로 JWT 대신 단기 티켓을 쓴다"""
+    try:
+        return 200, EventTicketService.issue(request.auth)
+
+    except Exception as e:
+        logger.error(f"Error issuing event stream ticket: {e}")
+        return 500, {"error": "Internal server error"}
+
+
 @api.put(
     "/match-requests/{int:request_id}/accept",
     response={
         200: MatchRequestResponseSchema,
+        400: ErrorResponseSchema,
         404: ErrorResponseSchema,
         403: ErrorResponseSchema,
     },
@@ -269,7 +522,10 @@ def accept_match_request(request, request_id: int):
         return 200, response_data
 
     except ValueError as e:
-        return 404, {"error": str(e)}
+        error_message = str(e)
+        if "not found" in error_message:
+            return 404, {"error": error_message}
+        return 400, {"error": error_message}
     except Exception as e:
         logger.error(f"Error accepting match request: {e}")
         return 500, {"error": "Internal server error"}
@@ -331,4 +587,61 @@ def cancel_match_request(request, request_id: int):
         return 500, {"error": "Internal server error"}
 
 
+@api.post(
+    "/match-requests/bulk",
+    response={
+        200: BulkMatchRequestResponseSchema,
+        400: ErrorResponseSchema,
+        403: ErrorResponseSchema,
+    },
+    description="요청 일괄 수락/거절(멘토 전용)/취소(멘티 전용)",
+)
+def bulk_match_requests(request, payload: BulkMatchRequestActionSchema):
+    """매칭 요청 일괄 처리 - 수락/거절은 멘토, 취소는 멘티만 가능"""
+    try:
+        required_role = "mentee" if payload.action == "cancel" else "mentor"
+        if payload.action in ("accept", "reject", "cancel") and (
+            request.auth.role != required_role
+        ):
+            return 403, {
+                "error": f"Only {required_role}s can {payload.action} match requests"
+            }
+
+        results = MatchRequestService.bulk_transition(
+            request.auth, payload.ids, payload.action
+        )
+        return 200, {"results": results}
+
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error processing bulk match requests: {e}")
+        return 500, {"error": "Internal server error"}
+
+
+@api.post(
+    "/admin/match-requests/solve",
+    response={
+        200: MatchSolveResultSchema,
+        400: ErrorResponseSchema,
+        403: ErrorResponseSchema,
+    },
+    description="대기 중인 요청 전체를 최대 매칭으로 일괄 배정 (관리자 전용)",
+)
+def solve_match_requests(request, payload: MatchSolveSchema):
+    """코호트 일괄 배정 - 기본은 dry run, dryRun=false일 때 한 트랜잭션으로 반영"""
+    if not request.auth.is_staff:
+        return 403, {"error": "Only staff can solve match requests"}
+    try:
+        return 200, MatchSolverService.solve(
+            since=payload.since, dry_run=payload.dryRun
+        )
+
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error solving match requests: {e}")
+        return 500, {"error": "Internal server error"}
+
+
 api.add_router("/", router)
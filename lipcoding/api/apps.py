@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from . import db, recommender, skill_index
+
+        connection_created.connect(
+            db.configure_connection, dispatch_uid="api_sqlite_pragmas"
+        )
+        skill_index.connect_signals()
+        recommender.connect_signals()
@@ -0,0 +1,141 @@
+"""
+시그널을 거치지 않는 대량 입력 도구 (manage.py seed, loadtest --prepare)
+
+ORM 인스턴스 대신 준비된 값 튜플을 청크 단위 executemany로 넣는다. 계정은
+사용자 + 프로필 + 멘토 스킬을 청크마다 한 트랜잭션으로 넣고, 비밀번호 해시는
+한 번만 계산해서 모든 계정에 재사용한다. 다 넣은 뒤에는 finish_bulk_load()로
+멘토 디렉터리 버전과 인메모리 인덱스를 갱신한다.
+"""
+
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import NamedTuple
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Profile, User
+from .recommender import recommender
+from .services import DataVersionService
+from .skill_index import skill_index
+
+DEFAULT_CHUNK_SIZE = 20_000
+
+
+class Account(NamedTuple):
+    email: str
+    name: str
+    role: str
+    bio: str = ""
+    skill_ids: Sequence[int] = ()
+    image: bytes | None = None
+
+
+def chunks(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class Inserter:
+    """모델 테이블에 값 튜플을 executemany로 넣는다 (상수 열은 한 번만 변환)"""
+
+    def __init__(self, model, columns: Sequence[str], constants: dict | None = None):
+        meta = model._meta
+        constants = constants or {}
+        names = list(columns) + list(constants)
+        quoted = ", ".join(
+            connection.ops.quote_name(meta.get_field(name).column) for name in names
+        )
+        placeholders = ", ".join(["%s"] * len(names))
+        self.sql = f"INSERT INTO {connection.ops.quote_name(meta.db_table)} ({quoted}) VALUES ({placeholders})"
+        self.constants = tuple(
+            meta.get_field(name).get_db_prep_save(value, connection)
+            for name, value in constants.items()
+        )
+        self.count = 0
+
+    def insert_chunk(self, rows: list[tuple]) -> None:
+        """호출한 쪽 트랜잭션 안에서 한 번의 executemany로 넣는다"""
+        constants = self.constants
+        with connection.cursor() as cursor:
+            cursor.executemany(self.sql, [row + constants for row in rows])
+        self.count += len(rows)
+
+    def insert(self, rows: Iterable[tuple], chunk_size: int) -> int:
+        """chunk_size개씩 트랜잭션 하나로 넣고 지금까지 넣은 행 수 반환"""
+        for chunk in chunks(rows, chunk_size):
+            with transaction.atomic():
+                self.insert_chunk(chunk)
+        return self.count
+
+
+def _next_id(model) -> int:
+    return (model.objects.order_by("-id").values_list("id", flat=True).first() or 0) + 1
+
+
+def create_accounts(
+    accounts: Iterable[Account],
+    password: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    now: datetime | None = None,
+) -> range:
+    """계정(사용자 + 프로필 + 멘토 스킬)을 넣고 새 사용자 id 범위 반환 (입력 순서대로)
+
+    id를 직접 이어 붙여 넣으므로 다른 쓰기가 없는 상태에서 실행한다.
+    """
+    user_start, profile_start = _next_id(User), _next_id(Profile)
+    users = Inserter(
+        User,
+        ["id", "email", "name", "role"],
+        {
+            "password": make_password(password),
+            "is_superuser": False,
+            "is_staff": False,
+            "is_active": True,
+            "first_name": "",
+            "last_name": "",
+            "date_joined": now or timezone.now(),
+        },
+    )
+    profiles = Inserter(
+        Profile,
+        ["id", "user", "bio", "image_url", "image_data"],
+        {"image_content_type": "image/jpeg", "image_version": 0, "is_available": True},
+    )
+    skills = Inserter(Profile.skills.through, ["profile", "skill"])
+    default_image_url = Profile._meta.get_field("image_url").default
+
+    offset = 0
+    for chunk in chunks(accounts, chunk_size):
+        user_rows, profile_rows, skill_rows = [], [], []
+        for index, account in enumerate(chunk, offset):
+            user_id, profile_id = user_start + index, profile_start + index
+            user_rows.append((user_id, account.email, account.name, account.role))
+            image_url = (
+                f"/images/{account.role}/{user_id}"
+                if account.image
+                else default_image_url
+            )
+            profile_rows.append(
+                (profile_id, user_id, account.bio, image_url, account.image)
+            )
+            skill_rows.extend((profile_id, skill_id) for skill_id in account.skill_ids)
+        with transaction.atomic():
+            users.insert_chunk(user_rows)
+            profiles.insert_chunk(profile_rows)
+            if skill_rows:
+                skills.insert_chunk(skill_rows)
+        offset += len(chunk)
+    return range(user_start, user_start + offset)
+
+
+def finish_bulk_load() -> None:
+    """시그널을 거치지 않은 입력 뒤 멘토 디렉터리 버전과 같은 프로세스의 인덱스 갱신"""
+    DataVersionService.bump(
+        DataVersionService.MENTORS, DataVersionService.MENTOR_SKILLS
+    )
+    skill_index.reset()
+    recommender.reset()
@@ -0,0 +1,9 @@
+import pytest
+
+from .query_budget import QueryBudget
+
+
+@pytest.fixture
+def query_budget(db):
+    """쿼리 예산 검사 팩토리: with query_budget(3, "GET /api/mentors"): ..."""
+    return QueryBudget
@@ -0,0 +1,155 @@
+"""
+SQLite 운영 프로필
+
+connection_created 시그널로 새 연결마다 PRAGMA를 적용하고,
+SQLITE_SERIALIZE_WRITES가 켜져 있으면 프로세스 안의 쓰기 트랜잭션을
+도착 순서대로 하나씩 실행해서 파일 잠금을 두고 경쟁하지 않게 한다.
+읽기만 하는 트랜잭션은 read_transaction()으로 쓰기 잠금 없이 시작한다.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+
+# busy_timeout을 먼저 적용해야 journal_mode 변경이 잠금을 기다릴 수 있다
+DEFAULT_PRAGMAS = {
+    "busy_timeout": 5000,  # ms
+    "journal_mode": "WAL",  # 읽기와 쓰기가 서로 막지 않음
+    "synchronous": "NORMAL",  # WAL에서는 체크포인트 때만 fsync
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -20000,  # 음수는 KiB 단위 (약 20MB)
+    "temp_store": "MEMORY",
+}
+
+
+def apply_pragmas(execute: Callable[[str], Any], pragmas: dict[str, Any]) -> None:
+    """PRAGMA를 순서대로 실행 (execute는 sqlite3 연결이나 커서의 execute)"""
+    for name, value in pragmas.items():
+        execute(f"PRAGMA {name}={value}")
+
+
+def configured_pragmas() -> dict[str, Any]:
+    """settings.SQLITE_PRAGMAS가 있으면 그 값, 없으면 DEFAULT_PRAGMAS"""
+    return getattr(settings, "SQLITE_PRAGMAS", DEFAULT_PRAGMAS)
+
+
+def configure_connection(sender, connection, **kwargs) -> None:
+    """새 SQLite 연결에 설정된 PRAGMA 적용"""
+    if connection.vendor != "sqlite":
+        return
+    pragmas = configured_pragmas()
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor.execute, pragmas)
+
+
+class WriteQueueTimeout(OperationalError):
+    """쓰기 대기열에서 제한 시간 안에 차례가 오지 않음"""
+
+
+class WriteQueue:
+    """번호표 순서(FIFO)로 쓰기 트랜잭션을 하나씩 실행하는 프로세스 내 대기열"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        self._abandoned = set()  # 기다리다 포기한 번호표
+        self._local = threading.local()
+
+    def _advance(self) -> None:
+        self._serving += 1
+        while self._serving in self._abandoned:
+            self._abandoned.discard(self._serving)
+            self._serving += 1
+
+    @contextmanager
+    def slot(self, timeout: float | None = None):
+        """차례가 올 때까지 기다렸다가 블록을 실행 (같은 스레드의 중첩 호출은 통과)"""
+        if getattr(self._local, "depth", 0):
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            while self._serving != ticket:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._abandoned.add(ticket)
+                    raise WriteQueueTimeout("database is locked (write queue timeout)")
+                self._cond.wait(remaining)
+
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._cond:
+                self._advance()
+                self._cond.notify_all()
+
+    @property
+    def waiting(self) -> int:
+        """현재 실행 중인 것을 포함해 차례를 기다리는 트랜잭션 수"""
+        with self._cond:
+            return self._next_ticket - self._serving - len(self._abandoned)
+
+
+write_queue = WriteQueue()
+
+
+@contextmanager
+def write_transaction(using: str | None = None):
+    """
+    쓰기 트랜잭션 (transaction.atomic 대신 사용, 데코레이터로도 사용 가능)
+
+    SQLite에서 SQLITE_SERIALIZE_WRITES가 켜져 있으면 쓰기 대기열 차례를 받은 뒤
+    트랜잭션을 시작한다.
+    """
+    alias = using or DEFAULT_DB_ALIAS
+    if connections[alias].vendor == "sqlite" and getattr(
+        settings, "SQLITE_SERIALIZE_WRITES", False
+    ):
+        timeout = getattr(settings, "SQLITE_WRITE_QUEUE_TIMEOUT", 5)
+        with write_queue.slot(timeout), transaction.atomic(using=alias):
+            yield
+    else:
+        with transaction.atomic(using=alias):
+            yield
+
+
+@contextmanager
+def read_transaction(using: str | None = None):
+    """
+    읽기 전용 트랜잭션 (여러 조회를 같은 스냅숏에서 읽을 때 사용)
+
+    SQLite에서는 설정된 IMMEDIATE 대신 BEGIN DEFERRED로 시작해서 쓰기 잠금이나
+    쓰기 대기열 차례를 잡지 않는다. 이미 트랜잭션 안이면 그 트랜잭션을 따른다.
+    """
+    alias = using or DEFAULT_DB_ALIAS
+    connection = connections[alias]
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        with transaction.atomic(using=alias):
+            yield
+        return
+
+    mode = connection.transaction_mode
+    connection.transaction_mode = "DEFERRED"
+    try:
+        with transaction.atomic(using=alias):
+            connection.transaction_mode = mode
+            yield
+    finally:
+        connection.transaction_mode = mode
@@ -0,0 +1,247 @@
+"""
+매칭 요청 변경 이벤트 허브 (Server-Sent Events용)
+
+같은 프로세스의 SSE 연결은 EventHub가 사용자별로 관리하고,
+워커 간 전달은 설정으로 교체 가능한 백엔드가 맡는다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class TooManyConnections(Exception):
+    """사용자별 동시 연결 수 초과"""
+
+
+class Subscriber:
+    """SSE 연결 하나에 해당하는 구독자 (이벤트 루프에 묶인 큐를 가진다)"""
+
+    def __init__(self, user_id: int, max_queue: int):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(max_queue)
+        self.overflowed = False
+
+    def deliver(self, event: dict[str, Any]) -> None:
+        """이벤트 루프 스레드에서 호출되어 큐에 이벤트 추가"""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 클라이언트: 쌓인 이벤트를 버리고 다시 조회하라는 이벤트만 남긴다
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+
+class EventHub:
+    """프로세스 내 사용자별 구독자 목록"""
+
+    def __init__(
+        self, max_connections_per_user: int | None = None, max_queue: int = 100
+    ):
+        self.max_connections_per_user = max_connections_per_user
+        self.max_queue = max_queue
+        self._subscribers: dict[int, set[Subscriber]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> Subscriber:
+        """현재 이벤트 루프에서 사용할 구독자 등록"""
+        limit = self.max_connections_per_user
+        if limit is None:
+            limit = getattr(settings, "MATCH_EVENTS_MAX_CONNECTIONS_PER_USER", 3)
+        subscriber = Subscriber(user_id, self.max_queue)
+        with self._lock:
+            subscribers = self._subscribers.setdefault(user_id, set())
+            if len(subscribers) >= limit:
+                raise TooManyConnections(user_id)
+            subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscriber.user_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[subscriber.user_id]
+
+    def connection_count(self, user_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(user_id, ()))
+
+    def dispatch(self, user_ids: Iterable[int], event: dict[str, Any]) -> None:
+        """해당 사용자들의 구독자에게 이벤트 전달 (어느 스레드에서든 호출 가능)"""
+        with self._lock:
+            targets = [
+                subscriber
+                for user_id in set(user_ids)
+                for subscriber in self._subscribers.get(user_id, ())
+            ]
+        for subscriber in targets:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.deliver, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 연결
+                self.unsubscribe(subscriber)
+
+
+class LocalBackend:
+    """같은 프로세스 안에서만 이벤트를 전달하는 백엔드 (단일 워커용)"""
+
+    def __init__(self, hub: EventHub, **options):
+        self.hub = hub
+
+    def start(self) -> None:
+        pass
+
+    def publish(self, user_ids: Iterable[int], event: dict[str, Any]) -> None:
+        self.hub.dispatch(user_ids, event)
+
+
+class SQLitePollingBackend:
+    """
+    여러 워커가 공유하는 SQLite 파일을 폴링해 이벤트를 전달하는 백엔드
+
+    별도 메시지 브로커 없이 멀티 워커에서 쓰기 위한 대용품이다.
+    발행한 워커도 폴링으로 이벤트를 받으므로 중복 전달되지 않는다.
+    """
+
+    def __init__(
+        self,
+        hub: EventHub,
+        path: str | None = None,
+        interval: float = 0.5,
+        retention: float = 300,
+    ):
+        self.hub = hub
+        self.path = path or os.path.join(settings.BASE_DIR, "match_events.sqlite3")
+        self.interval = interval
+        self.retention = retention
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._last_seq = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "user_ids TEXT NOT NULL, payload TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            with self._connect() as conn:
+                row = conn.execute("SELECT MAX(seq) FROM events").fetchone()
+            self._last_seq = row[0] or 0
+            self._thread = threading.Thread(
+                target=self._run, name="match-events-poller", daemon=True
+            )
+            self._thread.start()
+
+    def publish(self, user_ids: Iterable[int], event: dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO events (user_ids, payload, created) VALUES (?, ?, ?)",
+                (json.dumps(sorted(set(user_ids))), json.dumps(event), time.time()),
+            )
+
+    def poll(self) -> int:
+        """새 이벤트를 읽어 허브에 전달하고 전달한 개수 반환"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT seq, user_ids, payload FROM events WHERE seq > ? ORDER BY seq",
+                (self._last_seq,),
+            ).fetchall()
+        for seq, user_ids, payload in rows:
+            self._last_seq = seq
+            self.hub.dispatch(json.loads(user_ids), json.loads(payload))
+        return len(rows)
+
+    def _run(self) -> None:
+        last_cleanup = time.monotonic()
+        while True:
+            try:
+                self.poll()
+                if time.monotonic() - last_cleanup > self.retention:
+                    with self._connect() as conn:
+                        conn.execute(
+                            "DELETE FROM events WHERE created < ?",
+                            (time.time() - self.retention,),
+                        )
+                    last_cleanup = time.monotonic()
+            except sqlite3.Error:
+                logger.exception("매칭 이벤트 폴링 실패")
+            time.sleep(self.interval)
+
+
+hub = EventHub()
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """설정된 백엔드를 처음 사용할 때 생성"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            backend_class = import_string(
+                getattr(settings, "MATCH_EVENTS_BACKEND", "api.events.LocalBackend")
+            )
+            _backend = backend_class(
+                hub, **getattr(settings, "MATCH_EVENTS_BACKEND_OPTIONS", {})
+            )
+        return _backend
+
+
+def publish_match_event(
+    seq: int, request_id: int, status: str, mentor_id: int, mentee_id: int
+) -> None:
+    """매칭 요청 상태 변경을 멘토/멘티에게 알림 (트랜잭션 커밋 이후 발행)"""
+    event = {
+        "type": "match_request",
+        "seq": seq,
+        "id": request_id,
+        "status": status,
+        "mentorId": mentor_id,
+        "menteeId": mentee_id,
+    }
+
+    def send():
+        try:
+            get_backend().publish((mentor_id, mentee_id), event)
+        except Exception:
+            # 알림 실패가 요청 처리 결과에 영향을 주지 않도록
+            logger.exception("매칭 이벤트 발행 실패")
+
+    transaction.on_commit(send)
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """이벤트를 text/event-stream 형식으로 직렬화"""
+    # id는 재연결 시 Last-Event-ID 헤더로 돌아온다
+    event_id = f"id: {event['seq']}\n" if "seq" in event else ""
+    return f"{event_id}event: {event['type']}\ndata: {json.dumps(event)}\n\n"
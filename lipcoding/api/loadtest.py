@@ -0,0 +1,400 @@
+"""
+엔드투엔드 부하 테스트 (manage.py loadtest)
+
+가상 사용자(멘토/멘티)가 프론트엔드 화면과 같은 순서로 API를 호출한다.
+
+    멘티: 로그인 -> /me -> 멘토 목록/facet -> 보낸 요청 -> (대기 요청 취소) -> 요청 생성 -> 변경분
+    멘토: 로그인 -> /me -> 통계 -> 받은 요청 -> 변경분 -> 수락 또는 거절
+
+HTTP 클라이언트 의존성을 추가하지 않도록 asyncio 스트림 위에 keep-alive를
+지원하는 최소한의 HTTP/1.1 클라이언트를 둔다. 결과는 엔드포인트(경로 패턴)별
+요청 수, 상태 코드, p50/p95/p99 지연, 초당 처리량으로 집계한다.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+SKILLS = ["React", "Vue", "Angular", "Django", "Spring", "Go", "Kotlin", "Swift"]
+
+
+def account_email(role: str, index: int) -> str:
+    return f"loadtest-{role}-{index}@example.com"
+
+
+def prepare_accounts(mentors: int, mentees: int, password: str, seed: int = 1) -> int:
+    """부하 테스트용 계정/프로필 생성 (이미 있으면 건너뜀), 새로 만든 사용자 수 반환
+
+    seed 커맨드와 같은 api.bulk.create_accounts로 넣는다.
+    """
+    from .bulk import Account, create_accounts, finish_bulk_load
+    from .models import Skill, User
+
+    rng = random.Random(seed)
+    Skill.objects.bulk_create(
+        [Skill(name=name) for name in SKILLS], ignore_conflicts=True
+    )
+    skill_ids = list(Skill.objects.filter(name__in=SKILLS).values_list("id", flat=True))
+    accounts = [
+        (account_email(role, index), f"{role}{index}", role)
+        for role, count in (("mentor", mentors), ("mentee", mentees))
+        for index in range(count)
+    ]
+    existing = set(
+        User.objects.filter(email__in=[email for email, _, _ in accounts]).values_list(
+            "email", flat=True
+        )
+    )
+    created = create_accounts(
+        (
+            Account(
+                email,
+                name,
+                role,
+                "부하 테스트 계정",
+                rng.sample(skill_ids, rng.randint(1, 3)) if role == "mentor" else (),
+            )
+            for email, name, role in accounts
+            if email not in existing
+        ),
+        password,
+    )
+    finish_bulk_load()
+    return len(created)
+
+
+class HTTPClient:
+    """연결 하나를 재사용하는 asyncio HTTP/1.1 클라이언트 (가상 사용자 하나용)"""
+
+    def __init__(self, base_url: str, timeout: float = 10):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        token: str | None = None,
+    ) -> tuple[int, bytes]:
+        return await asyncio.wait_for(
+            self._request(method, path, body, token), self.timeout
+        )
+
+    async def _request(self, method, path, body, token):
+        payload = b"" if body is None else json.dumps(body).encode()
+        headers = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: application/json",
+            "Connection: keep-alive",
+            f"Content-Length: {len(payload)}",
+        ]
+        if body is not None:
+            headers.append("Content-Type: application/json")
+        if token:
+            headers.append(f"Authorization: Bearer {token}")
+        raw = ("\r\n".join(headers) + "\r\n\r\n").encode() + payload
+
+        # 서버가 keep-alive 연결을 닫았으면 한 번 다시 연결해서 보낸다
+        for attempt in range(2):
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.host, self.port
+                )
+                reused = False
+            else:
+                reused = True
+            try:
+                self._writer.write(raw)
+                await self._writer.drain()
+                return await self._read_response()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if not reused:
+                    raise
+        raise ConnectionError("재연결 실패")
+
+    async def _read_response(self) -> tuple[int, bytes]:
+        status_line = await self._reader.readuntil(b"\r\n")
+        version, status = status_line.split()[:2]
+        headers: dict[str, str] = {}
+        while True:
+            line = await self._reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self._reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                chunk = await self._reader.readexactly(size + 2)
+                if not size:
+                    break
+                chunks.append(chunk[:-2])
+            content = b"".join(chunks)
+        elif "content-length" in headers:
+            content = await self._reader.readexactly(int(headers["content-length"]))
+        else:
+            content = await self._reader.read()
+            headers["connection"] = "close"
+
+        connection = headers.get("connection", "").lower()
+        if connection == "close" or (
+            version == b"HTTP/1.0" and connection != "keep-alive"
+        ):
+            await self.close()
+        return int(status), content
+
+
+class Stats:
+    """엔드포인트별 상태 코드/지연 기록"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.statuses: dict[str, dict[str, int]] = {}
+
+    def record(self, label: str, status: str, latency: float | None) -> None:
+        counts = self.statuses.setdefault(label, {})
+        counts[status] = counts.get(status, 0) + 1
+        if latency is not None:
+            self.latencies.setdefault(label, []).append(latency)
+
+    def summary(self, elapsed: float) -> dict[str, dict[str, Any]]:
+        result = {}
+        for label in sorted(self.statuses):
+            latencies = sorted(self.latencies.get(label, []))
+            statuses = self.statuses[label]
+            count = sum(statuses.values())
+            result[label] = {
+                "requests": count,
+                "errors": sum(
+                    n
+                    for status, n in statuses.items()
+                    if not status.startswith(("2", "3", "4"))
+                ),
+                "statuses": statuses,
+                "rps": count / elapsed if elapsed else 0.0,
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+            }
+        return result
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    """정렬된 값에서 ratio 위치의 값 (초)"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+class VirtualUser:
+    """가상 사용자 하나 (로그인 후 시나리오 반복)"""
+
+    def __init__(self, client: HTTPClient, stats: Stats, rng: random.Random, options):
+        self.client = client
+        self.stats = stats
+        self.rng = rng
+        self.options = options
+        self.token: str | None = None
+        self.last_seq = 0
+
+    async def call(
+        self, method: str, path: str, body: Any = None, label: str | None = None
+    ) -> tuple[int, Any]:
+        label = f"{method} {label or path.split('?')[0]}"
+        started = time.perf_counter()
+        try:
+            status, content = await self.client.request(method, path, body, self.token)
+        except (TimeoutError, OSError, asyncio.IncompleteReadError, ValueError) as e:
+            await self.client.close()
+            self.stats.record(label, type(e).__name__, None)
+            return 0, None
+        self.stats.record(label, str(status), time.perf_counter() - started)
+        try:
+            data = json.loads(content) if content else None
+        except ValueError:
+            data = None
+        return status, data
+
+    async def think(self) -> None:
+        if self.options["think_time"]:
+            await asyncio.sleep(self.rng.uniform(0, 2 * self.options["think_time"]))
+
+    async def login(self, email: str) -> bool:
+        status, data = await self.call(
+            "POST", "/api/login", {"email": email, "password": self.options["password"]}
+        )
+        if status != 200:
+            return False
+        self.token = data["token"]
+        return True
+
+    async def mentee_journey(self) -> None:
+        await self.call("GET", "/api/me")
+        await self.call("GET", "/api/match-requests/stats")
+        await self.think()
+        # 멘토 찾기 화면
+        _, mentors = await self.call("GET", "/api/mentors")
+        skill = self.rng.choice(SKILLS)
+        await self.call("GET", f"/api/mentors/facets?skills={skill}")
+        _, outgoing = await self.call("GET", "/api/match-requests/outgoing")
+        await self.think()
+        # 대기 중인 요청이 있으면 취소하고 새 멘토에게 요청 (멘티당 대기 요청 하나)
+        for item in outgoing or []:
+            if item["status"] == "pending":
+                await self.call(
+                    "DELETE",
+                    f"/api/match-requests/{item['id']}",
+                    label="/api/match-requests/{request_id}",
+                )
+        if mentors:
+            mentor = self.rng.choice(mentors)
+            await self.call(
+                "POST",
+                "/api/match-requests",
+                {
+                    "mentorId": mentor["id"],
+                    "menteeId": 0,
+                    "message": "부하 테스트 요청",
+                },
+            )
+        await self.changes()
+
+    async def mentor_journey(self) -> None:
+        await self.call("GET", "/api/me")
+        await self.call("GET", "/api/match-requests/stats")
+        await self.think()
+        # 요청 관리 화면
+        _, incoming = await self.call("GET", "/api/match-requests/incoming")
+        await self.changes()
+        await self.think()
+        pending = [item for item in incoming or [] if item["status"] == "pending"]
+        if pending:
+            target = self.rng.choice(pending)
+            action = (
+                "accept"
+                if self.rng.random() < self.options["accept_ratio"]
+                else "reject"
+            )
+            await self.call(
+                "PUT",
+                f"/api/match-requests/{target['id']}/{action}",
+                label=f"/api/match-requests/{{request_id}}/{action}",
+            )
+
+    async def changes(self) -> None:
+        status, data = await self.call(
+            "GET", f"/api/match-requests/changes?after={self.last_seq}"
+        )
+        if status == 200:
+            self.last_seq = data["lastSeq"]
+
+
+async def run_load(options: dict[str, Any]) -> dict[str, Any]:
+    """options: base_url, users, duration, iterations, mentor_ratio, accept_ratio,
+    think_time, mentors, mentees, password, seed, timeout"""
+    stats = Stats()
+    mentor_users = round(options["users"] * options["mentor_ratio"])
+    deadline = None
+    if not options["iterations"]:
+        deadline = time.monotonic() + options["duration"]
+
+    async def virtual_user(index: int) -> int:
+        rng = random.Random(options["seed"] * 100003 + index)
+        is_mentor = index < mentor_users
+        role = "mentor" if is_mentor else "mentee"
+        pool = options["mentors"] if is_mentor else options["mentees"]
+        user = VirtualUser(
+            HTTPClient(options["base_url"], options["timeout"]), stats, rng, options
+        )
+        completed = 0
+        try:
+            if not await user.login(account_email(role, index % pool)):
+                return 0
+            journey = user.mentor_journey if is_mentor else user.mentee_journey
+            while True:
+                if options["iterations"] and completed >= options["iterations"]:
+                    break
+                if deadline and time.monotonic() >= deadline:
+                    break
+                await journey()
+                completed += 1
+        finally:
+            await user.client.close()
+        return completed
+
+    started_at = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    started = time.perf_counter()
+    journeys = await asyncio.gather(
+        *(virtual_user(index) for index in range(options["users"]))
+    )
+    elapsed = time.perf_counter() - started
+
+    endpoints = stats.summary(elapsed)
+    total = sum(item["requests"] for item in endpoints.values())
+    return {
+        "meta": {
+            key: options[key]
+            for key in (
+                "base_url",
+                "users",
+                "duration",
+                "iterations",
+                "mentor_ratio",
+                "accept_ratio",
+                "think_time",
+                "seed",
+            )
+        },
+        "startedAt": started_at,
+        "elapsed": elapsed,
+        "journeys": sum(journeys),
+        "requests": total,
+        "errors": sum(item["errors"] for item in endpoints.values()),
+        "rps": total / elapsed if elapsed else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """두 결과의 엔드포인트별 p95/RPS 변화율"""
+    rows = []
+    for label, item in current["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(label)
+        if not before:
+            continue
+        rows.append(
+            {
+                "endpoint": label,
+                "p95": item["p95"],
+                "p95_change": _change(before["p95"], item["p95"]),
+                "rps": item["rps"],
+                "rps_change": _change(before["rps"], item["rps"]),
+            }
+        )
+    return rows
+
+
+def _change(before: float, after: float) -> float | None:
+    return (after - before) / before if before else None
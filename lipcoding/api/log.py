@@ -0,0 +1,218 @@
+"""
+큐 기반 로깅 (LOGGING_CONFIG = "api.log.configure_logging")
+
+요청 스레드의 QueueHandler는 표본 추출(SamplingFilter)만 거친 LogRecord를 큐에 넣고
+바로 돌아온다. 메시지 %-포맷, 토큰 가리기(RedactingFilter), 스트림 출력은 모두
+QueueListener 스레드에서 처리하므로 요청이 로그 I/O를 기다리지 않는다.
+큐가 가득 차면 기록을 버리고 dropped만 센다.
+
+포맷이 나중에 일어나므로 로그 인자로는 바뀌지 않는 값(id, 문자열 등)을 넘긴다.
+
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "filters": ["redact"]},
+        "queue": {
+            "()": "api.log.QueueHandler",
+            "targets": ["console"],
+            "filters": ["sample"],
+        },
+    },
+"""
+
+import atexit
+import logging
+import logging.config
+import logging.handlers
+import os
+import queue
+import random
+import re
+import weakref
+from collections.abc import Iterable
+
+DEFAULT_QUEUE_SIZE = 10000
+
+# JWT(header.payload.signature), Authorization 헤더 값, 접근 로그의 인증 쿼리 파라미터
+_TOKEN_PATTERNS = (
+    (re.compile(r"eyJ[\w-]*\.[\w-]*\.[\w-]*"), "<redacted>"),
+    (re.compile(r"(?i)\b(bearer)\s+[^\s,;'\"]+"), r"\1 <redacted>"),
+    (
+        re.compile(r"([?&](?:token|ticket|__profile)=)[^&#\s'\"]+"),
+        r"\1<redacted>",
+    ),
+)
+
+_queue_handlers: "weakref.WeakSet[QueueHandler]" = weakref.WeakSet()
+
+
+class RedactingFilter(logging.Filter):
+    """메시지와 인자에서 JWT/Bearer 토큰, 인증 쿼리 파라미터를 가린다
+
+    리스너 쪽 핸들러나 접근 로그 로거(uvicorn.access)에 붙인다. 인자 튜플 모양은
+    유지하므로 인자를 직접 쓰는 포매터(uvicorn AccessFormatter)와도 함께 쓸 수 있다.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.msg, str):
+            record.msg = redact(record.msg)
+        if isinstance(record.args, tuple):
+            record.args = tuple(_redact_arg(arg) for arg in record.args)
+        # 형식 문자열과 인자에 걸쳐 있는 토큰("Bearer %s")은 완성된 메시지에서 가린다
+        message = record.getMessage()
+        redacted = redact(message)
+        if redacted != message:
+            record.msg = redacted
+            record.args = None
+        return True
+
+
+def _redact_arg(arg):
+    if isinstance(arg, (int, float)) or arg is None:
+        return arg
+    text = str(arg)
+    redacted = redact(text)
+    # 가릴 것이 없으면 원래 객체를 그대로 둔다 (%r 등 포맷 유지)
+    return arg if redacted == text else redacted
+
+
+class SamplingFilter(logging.Filter):
+    """로거 이름별 비율로 INFO 이하 기록만 표본 추출 (WARNING 이상은 모두 통과)
+
+    rates={"api.auth": 0.01}이면 api.auth와 그 하위 로거의 INFO/DEBUG 기록 중 1%만
+    남긴다. 가장 긴 접두어가 적용되고, 남긴 기록에는 sample_rate를 붙인다.
+    """
+
+    def __init__(self, rates: dict[str, float] | None = None, name: str = ""):
+        super().__init__(name)
+        self.rates = dict(rates or {})
+        self._cache: dict[str, float] = {}
+
+    def rate_for(self, logger_name: str) -> float:
+        rate = self._cache.get(logger_name)
+        if rate is None:
+            rate = 1.0
+            prefix = logger_name
+            while True:
+                if prefix in self.rates:
+                    rate = self.rates[prefix]
+                    break
+                if "." not in prefix:
+                    break
+                prefix = prefix.rsplit(".", 1)[0]
+            self._cache[logger_name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self.rate_for(record.name)
+        if rate >= 1:
+            return True
+        if rate <= 0 or random.random() >= rate:
+            return False
+        record.sample_rate = rate
+        return True
+
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # 큐가 가득 차 있어도 종료 신호는 반드시 넣는다
+        self.queue.put(self._sentinel)
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """기록을 포맷하지 않은 채 큐에 넣고, 리스너 스레드가 targets 핸들러로 내보낸다"""
+
+    def __init__(
+        self,
+        targets: Iterable[str | logging.Handler] = (),
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+    ):
+        super().__init__(queue.Queue(maxsize))
+        self.targets = list(targets)
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.listener: _Listener | None = None
+        _queue_handlers.add(self)
+
+    def handle(self, record: logging.LogRecord):
+        # queue.Queue가 스레드 안전하므로 핸들러 잠금 없이 넣는다
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 여기서 self.format()을 호출한다. 포맷은 리스너 스레드의 몫
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        if self.listener is not None:
+            return
+        handlers = [_resolve_handler(target) for target in self.targets]
+        self.listener = _Listener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """큐에 남은 기록을 모두 내보내고 리스너 스레드를 멈춘다"""
+        listener, self.listener = self.listener, None
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+
+    def close(self) -> None:
+        self.stop()
+        super().close()
+
+    def _after_fork(self) -> None:
+        # 부모의 리스너 스레드는 자식에 없고 큐 잠금이 잡힌 채일 수 있으므로 새로 만든다
+        running = self.listener is not None
+        self.listener = None
+        self.queue = queue.Queue(self.maxsize)
+        if running:
+            self.start()
+
+
+def redact(text: str) -> str:
+    for pattern, replacement in _TOKEN_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def configure_logging(config: dict) -> None:
+    """dictConfig를 적용하고 QueueHandler마다 리스너 스레드를 시작"""
+    logging.config.dictConfig(config)
+    for handler in list(_queue_handlers):
+        handler.start()
+
+
+def stop_queue_logging() -> None:
+    """모든 큐를 비우고 리스너를 멈춘다 (os._exit 전에 호출)"""
+    for handler in list(_queue_handlers):
+        handler.stop()
+
+
+def _resolve_handler(target: str | logging.Handler) -> logging.Handler:
+    if isinstance(target, logging.Handler):
+        return target
+    # logging.getHandlerByName은 Python 3.12부터
+    getter = getattr(logging, "getHandlerByName", None)
+    handler = getter(target) if getter else logging._handlers.get(target)
+    if handler is None:
+        raise ValueError(f"Unknown logging handler: {target}")
+    return handler
+
+
+def _after_fork_in_child() -> None:
+    for handler in list(_queue_handlers):
+        handler._after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(stop_queue_logging)
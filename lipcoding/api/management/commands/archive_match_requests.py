@@ -0,0 +1,83 @@
+"""
+종료된 매칭 요청 보관 커맨드
+
+    python manage.py archive_match_requests --older-than-days 30 --batch-size 500
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api.services import MatchRequestArchiveService
+
+
+class Command(BaseCommand):
+    help = "오래된 거절/취소 매칭 요청을 보관 테이블로 배치 단위로 옮긴다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=getattr(settings, "MATCH_REQUEST_ARCHIVE_AFTER_DAYS", 30),
+            help="마지막 변경 후 이 기간이 지난 요청만 보관 (기본: 설정값)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="트랜잭션 하나에서 옮길 최대 행 수 (쓰기 잠금 유지 시간 상한)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.05,
+            help="배치 사이 대기 시간(초) - 다른 쓰기 요청이 잠금을 얻을 수 있도록",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="이번 실행에서 처리할 최대 배치 수 (남은 행은 다음 실행에서 이어서)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="옮기지 않고 대상 개수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than_days"] < 0:
+            raise CommandError("--older-than-days는 0 이상이어야 합니다.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+
+        if options["dry_run"]:
+            count = MatchRequestArchiveService.count_archivable(cutoff)
+            self.stdout.write(
+                f"보관 대상 요청: {count}개 (기준: {cutoff:%Y-%m-%d %H:%M})"
+            )
+            return
+
+        total = 0
+        batches = 0
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            moved = MatchRequestArchiveService.archive_batch(
+                cutoff, options["batch_size"]
+            )
+            if not moved:
+                break
+            total += moved
+            batches += 1
+            self.stdout.write(f"배치 {batches}: {moved}개 보관 (누적 {total}개)")
+            if moved < options["batch_size"]:
+                break
+            time.sleep(options["pause"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"보관 완료: {total}개 요청, {batches}개 배치")
+        )
@@ -0,0 +1,192 @@
+"""
+SQLite 설정별 동시 읽기/쓰기 처리량 비교 커맨드
+
+    python manage.py benchmark_sqlite --threads 8 --duration 3
+
+임시 파일 DB에 프로필/매칭 요청과 비슷한 테이블을 만들고
+기본 설정, 운영 프로필(WAL 등 + IMMEDIATE 트랜잭션), 운영 프로필 + 쓰기 대기열을
+같은 부하로 돌려 초당 처리량, p50/p99 지연, 실패 수를 출력한다.
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.db import WriteQueue, WriteQueueTimeout, apply_pragmas, configured_pragmas
+
+PROFILES = {
+    # (PRAGMA, BEGIN 방식, 쓰기 대기열 사용 여부)
+    "default": ({}, "BEGIN", False),
+    "wal": (None, "BEGIN IMMEDIATE", False),
+    "wal+queue": (None, "BEGIN IMMEDIATE", True),
+}
+
+
+def _percentile(values, ratio):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+class Command(BaseCommand):
+    help = "SQLite 기본 설정과 운영 프로필의 동시 읽기/쓰기 처리량을 비교한다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--duration", type=float, default=3.0, help="프로필별 초")
+        parser.add_argument(
+            "--write-ratio", type=float, default=0.3, help="전체 작업 중 쓰기 비율"
+        )
+        parser.add_argument("--rows", type=int, default=2000, help="사용자 수")
+        parser.add_argument(
+            "--profile",
+            action="append",
+            choices=list(PROFILES),
+            help="실행할 프로필 (여러 번 지정 가능, 기본: 전체)",
+        )
+
+    def handle(self, *args, **options):
+        if options["threads"] < 1 or options["rows"] < 2:
+            raise CommandError("--threads는 1 이상, --rows는 2 이상이어야 합니다.")
+        if not 0 <= options["write_ratio"] <= 1:
+            raise CommandError("--write-ratio는 0~1 사이여야 합니다.")
+
+        self.stdout.write(
+            f"스레드 {options['threads']}개, 쓰기 비율 {options['write_ratio']:.0%}, "
+            f"프로필별 {options['duration']}초"
+        )
+        self.stdout.write(
+            f"{'profile':<10} {'reads/s':>9} {'writes/s':>9} "
+            f"{'read p99':>9} {'write p50':>10} {'write p99':>10} {'errors':>7}"
+        )
+        for name in options["profile"] or list(PROFILES):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "bench.sqlite3")
+                result = self._run(path, name, options)
+            self.stdout.write(
+                f"{name:<10} {result['reads'] / options['duration']:>9.0f} "
+                f"{result['writes'] / options['duration']:>9.0f} "
+                f"{_percentile(result['read_latency'], 0.99) * 1000:>7.1f}ms "
+                f"{_percentile(result['write_latency'], 0.5) * 1000:>8.1f}ms "
+                f"{_percentile(result['write_latency'], 0.99) * 1000:>8.1f}ms "
+                f"{result['errors']:>7}"
+            )
+
+    def _connect(self, path, pragmas):
+        # Django 설정과 같은 기본 timeout (busy handler)
+        timeout = settings.DATABASES["default"].get("OPTIONS", {}).get("timeout", 5)
+        conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        apply_pragmas(conn.execute, pragmas)
+        return conn
+
+    def _setup(self, path, pragmas, rows):
+        conn = self._connect(path, pragmas)
+        conn.executescript(
+            "CREATE TABLE profile (user_id INTEGER PRIMARY KEY, bio TEXT, "
+            "version INTEGER NOT NULL DEFAULT 0);"
+            "CREATE TABLE match_request (id INTEGER PRIMARY KEY, mentor_id INTEGER, "
+            "mentee_id INTEGER, status TEXT, created REAL);"
+            "CREATE INDEX match_request_mentor ON match_request (mentor_id, status);"
+        )
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO profile (user_id, bio) VALUES (?, ?)",
+            ((i, "소개" * 20) for i in range(rows)),
+        )
+        conn.execute("COMMIT")
+        conn.close()
+
+    def _run(self, path, name, options):
+        pragmas, begin, serialize = PROFILES[name]
+        if pragmas is None:
+            pragmas = configured_pragmas()
+        rows = options["rows"]
+        self._setup(path, pragmas, rows)
+
+        queue = WriteQueue()
+        timeout = getattr(settings, "SQLITE_WRITE_QUEUE_TIMEOUT", 5)
+        deadline = time.monotonic() + options["duration"]
+        lock = threading.Lock()
+        result = {
+            "reads": 0,
+            "writes": 0,
+            "errors": 0,
+            "read_latency": [],
+            "write_latency": [],
+        }
+
+        def worker(seed):
+            rng = random.Random(seed)
+            conn = self._connect(path, pragmas)
+            reads, writes, errors = 0, 0, 0
+            read_latency, write_latency = [], []
+            while time.monotonic() < deadline:
+                user_id = rng.randrange(rows)
+                started = time.perf_counter()
+                try:
+                    if rng.random() < options["write_ratio"]:
+                        slot = queue.slot(timeout) if serialize else nullcontext()
+                        with slot:
+                            # update_profile / create_match_request처럼 읽고 나서 쓴다
+                            conn.execute(begin)
+                            try:
+                                conn.execute(
+                                    "SELECT version FROM profile WHERE user_id = ?",
+                                    (user_id,),
+                                ).fetchone()
+                                conn.execute(
+                                    "UPDATE profile SET version = version + 1, bio = ? "
+                                    "WHERE user_id = ?",
+                                    ("수정" * 20, user_id),
+                                )
+                                conn.execute(
+                                    "INSERT INTO match_request (mentor_id, mentee_id, "
+                                    "status, created) VALUES (?, ?, 'pending', ?)",
+                                    (rng.randrange(rows), user_id, time.time()),
+                                )
+                                conn.execute("COMMIT")
+                            except BaseException:
+                                conn.execute("ROLLBACK")
+                                raise
+                        writes += 1
+                        write_latency.append(time.perf_counter() - started)
+                    else:
+                        conn.execute(
+                            "SELECT p.user_id, p.bio, COUNT(r.id) FROM profile p "
+                            "LEFT JOIN match_request r ON r.mentor_id = p.user_id "
+                            "AND r.status = 'pending' WHERE p.user_id BETWEEN ? AND ? "
+                            "GROUP BY p.user_id",
+                            (user_id, user_id + 20),
+                        ).fetchall()
+                        reads += 1
+                        read_latency.append(time.perf_counter() - started)
+                except (sqlite3.OperationalError, WriteQueueTimeout):
+                    # database is locked / 대기열 제한 시간 초과
+                    errors += 1
+            conn.close()
+            with lock:
+                result["reads"] += reads
+                result["writes"] += writes
+                result["errors"] += errors
+                result["read_latency"].extend(read_latency)
+                result["write_latency"].extend(write_latency)
+
+        threads = [
+            threading.Thread(target=worker, args=(seed,))
+            for seed in range(options["threads"])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return result
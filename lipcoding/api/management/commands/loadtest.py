@@ -0,0 +1,137 @@
+"""
+멘토/멘티 사용 흐름 부하 테스트 커맨드
+
+    python manage.py loadtest --prepare --mentors 50 --mentees 200   # 계정 생성
+    python manage.py loadtest --users 50 --duration 30 --output run.json
+    python manage.py loadtest --users 50 --duration 30 --compare run.json
+
+서버(manage.py serve 등)를 먼저 띄워 두고 실행한다. 계정은 --prepare로 이 설정의 DB에
+만들어 두며, 서버가 같은 DB를 사용해야 한다.
+"""
+
+import asyncio
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api import loadtest
+
+
+class Command(BaseCommand):
+    help = "로그인부터 요청 생성/수락까지의 흐름으로 로컬 서버에 부하를 주고 지연을 측정한다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8080")
+        parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+        parser.add_argument("--duration", type=float, default=30, help="실행 시간(초)")
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=0,
+            help="가상 사용자당 시나리오 반복 횟수 (지정하면 --duration 무시)",
+        )
+        parser.add_argument(
+            "--mentor-ratio", type=float, default=0.3, help="가상 사용자 중 멘토 비율"
+        )
+        parser.add_argument(
+            "--accept-ratio",
+            type=float,
+            default=0.2,
+            help="멘토가 대기 요청을 수락할 확률 (나머지는 거절)",
+        )
+        parser.add_argument(
+            "--think-time",
+            type=float,
+            default=0,
+            help="화면 사이 평균 대기 시간(초)",
+        )
+        parser.add_argument("--mentors", type=int, default=50, help="멘토 계정 수")
+        parser.add_argument("--mentees", type=int, default=200, help="멘티 계정 수")
+        parser.add_argument("--password", default="loadtest-password")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--timeout", type=float, default=10, help="요청 제한 시간(초)"
+        )
+        parser.add_argument(
+            "--prepare",
+            action="store_true",
+            help="부하 테스트 계정만 만들고 종료 (이미 있으면 건너뜀)",
+        )
+        parser.add_argument("--output", help="결과를 JSON 파일로 저장")
+        parser.add_argument("--compare", help="이전 결과 JSON과 p95/RPS 비교")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["mentors"] < 1 or options["mentees"] < 1:
+            raise CommandError("--users, --mentors, --mentees는 1 이상이어야 합니다.")
+        for key in ("mentor_ratio", "accept_ratio"):
+            if not 0 <= options[key] <= 1:
+                raise CommandError(f"--{key.replace('_', '-')}는 0~1 사이여야 합니다.")
+
+        if options["prepare"]:
+            created = loadtest.prepare_accounts(
+                options["mentors"],
+                options["mentees"],
+                options["password"],
+                options["seed"],
+            )
+            self.stdout.write(
+                f"계정 준비: 멘토 {options['mentors']}명, 멘티 {options['mentees']}명 "
+                f"(새로 만든 계정 {created}개)"
+            )
+            return
+
+        baseline = None
+        if options["compare"]:
+            try:
+                with open(options["compare"]) as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"비교할 결과를 읽을 수 없습니다: {e}")
+
+        result = asyncio.run(loadtest.run_load(options))
+        self.stdout.write(
+            f"가상 사용자 {options['users']}명, {result['elapsed']:.1f}초, "
+            f"시나리오 {result['journeys']}회, 요청 {result['requests']}개 "
+            f"({result['rps']:.1f} req/s), 오류 {result['errors']}개"
+        )
+        self.stdout.write(
+            f"{'requests':>8} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>6}"
+            "  endpoint (statuses)"
+        )
+        for label, item in result["endpoints"].items():
+            statuses = ", ".join(
+                f"{k}:{v}" for k, v in sorted(item["statuses"].items())
+            )
+            self.stdout.write(
+                f"{item['requests']:>8} {item['rps']:>8.1f} "
+                f"{item['p50'] * 1000:>6.1f}ms {item['p95'] * 1000:>6.1f}ms "
+                f"{item['p99'] * 1000:>6.1f}ms {item['errors']:>6}  {label} ({statuses})"
+            )
+
+        if not result["journeys"]:
+            raise CommandError(
+                f"{options['base_url']}에서 시나리오를 마친 가상 사용자가 없습니다. "
+                "서버 실행 여부와 --prepare로 만든 계정을 확인하세요."
+            )
+
+        if baseline is not None:
+            self.stdout.write("")
+            self.stdout.write(f"비교: {options['compare']}")
+            self.stdout.write(
+                f"{'p95':>8} {'change':>7} {'rps':>8} {'change':>7}  endpoint"
+            )
+            for row in loadtest.compare(baseline, result):
+                self.stdout.write(
+                    f"{row['p95'] * 1000:>6.1f}ms {_format_change(row['p95_change'])} "
+                    f"{row['rps']:>8.1f} {_format_change(row['rps_change'])}  "
+                    f"{row['endpoint']}"
+                )
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['output']}")
+
+
+def _format_change(value) -> str:
+    return f"{'-':>7}" if value is None else f"{value:>+7.0%}"
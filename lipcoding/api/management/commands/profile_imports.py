@@ -0,0 +1,169 @@
+"""
+워커 시작 비용 측정 커맨드
+
+    python manage.py profile_imports
+    python manage.py profile_imports --settings lipcoding.settings_api --group
+
+새 인터프리터를 `python -X importtime`으로 띄워 워커가 첫 요청을 처리할 때까지
+불러오는 모듈별 import 시간을 집계하고, importtime 없이 여러 번 다시 띄워
+django.setup / 앱 로드 / 첫 응답까지 걸린 시간(time-to-first-response)을 잰다.
+"""
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 하위 프로세스에서 실행: 워커와 같은 순서로 앱을 불러오고 첫 요청을 처리한다
+_PROBE = """
+import io, json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
+app = get_wsgi_application()
+get_resolver()._populate()
+app_done = time.perf_counter()
+status = []
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "QUERY_STRING": "",
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "HTTP_HOST": "localhost",
+    "wsgi.input": io.BytesIO(), "wsgi.errors": sys.stderr, "wsgi.url_scheme": "http",
+    "wsgi.version": (1, 0), "wsgi.multithread": False, "wsgi.multiprocess": True,
+    "wsgi.run_once": False,
+}
+body = b"".join(app(environ, lambda s, h, exc_info=None: status.append(s)))
+done = time.perf_counter()
+print("PROBE " + json.dumps({
+    "setup": setup_done - started,
+    "app": app_done - setup_done,
+    "first_response": done - app_done,
+    "total": done - started,
+    "status": status[0],
+    "modules": len(sys.modules),
+}))
+"""
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def parse_importtime(output: str) -> list[dict[str, object]]:
+    """-X importtime 출력 -> [{module, self, cumulative, depth}] (마이크로초)"""
+    rows = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            rows.append(
+                {
+                    "module": match.group(4),
+                    "self": int(match.group(1)),
+                    "cumulative": int(match.group(2)),
+                    "depth": len(match.group(3)) // 2,
+                }
+            )
+    return rows
+
+
+class Command(BaseCommand):
+    help = "워커가 첫 요청까지 불러오는 모듈별 import 시간과 첫 응답 시간을 측정한다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path", default="/api/hello", help="첫 요청으로 보낼 경로"
+        )
+        parser.add_argument("--limit", type=int, default=25, help="출력할 모듈 수")
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="정렬 기준 (cumulative: 하위 import 포함)",
+        )
+        parser.add_argument(
+            "--group",
+            action="store_true",
+            help="최상위 패키지별로 self 시간을 합산해서 출력",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=5,
+            help="첫 응답 시간 측정 반복 횟수 (importtime 없이 실행)",
+        )
+
+    def _probe(self, importtime: bool, path: str):
+        command = [sys.executable]
+        if importtime:
+            command += ["-X", "importtime"]
+        command += ["-c", _PROBE, path]
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        # 실패해도 stderr를 보여 주도록 종료 코드는 출력으로 판단
+        result = subprocess.run(
+            command,
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        for line in result.stdout.splitlines():
+            if line.startswith("PROBE "):
+                return json.loads(line[len("PROBE ") :]), result.stderr
+        raise CommandError(f"측정용 프로세스 실행 실패:\n{result.stderr[-2000:]}")
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1 or options["limit"] < 1:
+            raise CommandError("--runs와 --limit은 1 이상이어야 합니다.")
+
+        _, stderr = self._probe(True, options["path"])
+        rows = parse_importtime(stderr)
+        self.stdout.write(
+            f"설정: {settings.SETTINGS_MODULE}, 불러온 모듈 {len(rows)}개, "
+            f"import 합계 {sum(row['self'] for row in rows) / 1000:.1f}ms"
+        )
+        if options["group"]:
+            totals: dict[str, int] = {}
+            for row in rows:
+                package = row["module"].split(".")[0]
+                totals[package] = totals.get(package, 0) + row["self"]
+            self.stdout.write(f"{'self ms':>9}  package")
+            for package, total in sorted(totals.items(), key=lambda item: -item[1])[
+                : options["limit"]
+            ]:
+                self.stdout.write(f"{total / 1000:>9.1f}  {package}")
+        else:
+            self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+            for row in sorted(rows, key=lambda row: -row[options["sort"]])[
+                : options["limit"]
+            ]:
+                self.stdout.write(
+                    f"{row['self'] / 1000:>9.1f} {row['cumulative'] / 1000:>9.1f}  "
+                    f"{'  ' * row['depth']}{row['module']}"
+                )
+
+        probes = [
+            self._probe(False, options["path"])[0] for _ in range(options["runs"])
+        ]
+        self.stdout.write("")
+        self.stdout.write(
+            f"첫 응답까지 ({options['path']}, {probes[0]['status']}, "
+            f"{options['runs']}회 중앙값 / 최소)"
+        )
+        self.stdout.write(f"{'median':>10} {'min':>10}")
+        for key, label in [
+            ("setup", "django.setup"),
+            ("app", "WSGI 앱 + URLconf"),
+            ("first_response", "첫 요청 처리"),
+            ("total", "합계"),
+        ]:
+            values = [probe[key] * 1000 for probe in probes]
+            self.stdout.write(
+                f"{statistics.median(values):>8.1f}ms {min(values):>8.1f}ms  {label}"
+            )
+        self.stdout.write(f"불러온 모듈 수: {probes[0]['modules']}개")
@@ -0,0 +1,89 @@
+"""
+요청 프로파일 캡처 조회 커맨드
+
+    python manage.py request_profiles --token          # X-Profile 헤더에 넣을 토큰
+    python manage.py request_profiles                  # 최근 캡처 목록
+    python manage.py request_profiles <id> --sort tottime --limit 20 --sql
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.profiling import make_token, profile_dir, store
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls", "pcalls", "filename", "name")
+
+
+class Command(BaseCommand):
+    help = "ProfilingMiddleware가 남긴 요청 프로파일을 나열하거나 출력한다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("capture_id", nargs="?", help="출력할 캡처 id")
+        parser.add_argument(
+            "--token",
+            action="store_true",
+            help="프로파일을 요청할 서명 토큰 발급 (PROFILING_TOKEN_MAX_AGE 동안 유효)",
+        )
+        parser.add_argument(
+            "--issuer", default="admin", help="토큰과 캡처에 남길 발급자 이름"
+        )
+        parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative")
+        parser.add_argument("--limit", type=int, default=30, help="출력할 함수 수")
+        parser.add_argument(
+            "--sql", action="store_true", help="실행한 SQL도 느린 순서로 출력"
+        )
+
+    def handle(self, *args, **options):
+        if options["token"]:
+            self.stdout.write(make_token(options["issuer"]))
+            return
+        if options["capture_id"]:
+            self._show(options)
+            return
+
+        ids = store.ids()
+        if not ids:
+            self.stdout.write(f"캡처 없음 ({profile_dir()})")
+            return
+        self.stdout.write(
+            f"{'id':<30} {'created':<19} {'status':>6} {'ms':>8} {'sql':>5}  request"
+        )
+        for capture_id in reversed(ids):
+            try:
+                meta = store.load(capture_id)
+            except (OSError, ValueError):
+                continue  # 목록을 읽는 사이 링에서 밀려났다
+            created = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(meta["created"])
+            )
+            self.stdout.write(
+                f"{capture_id:<30} {created:<19} {meta['status']:>6} "
+                f"{meta['duration'] * 1000:>8.1f} {meta['query_count']:>5}  "
+                f"{meta['method']} {meta['path']}"
+            )
+
+    def _show(self, options):
+        capture_id = options["capture_id"]
+        try:
+            meta = store.load(capture_id)
+            table = store.render(capture_id, options["sort"], options["limit"])
+        except (OSError, ValueError) as e:
+            raise CommandError(f"캡처를 읽을 수 없습니다: {capture_id} ({e})")
+
+        self.stdout.write(
+            f"{meta['method']} {meta['path']} -> {meta['status']} "
+            f"({meta['duration'] * 1000:.1f}ms, SQL {meta['query_count']}개, "
+            f"발급자 {meta['issuer']})"
+        )
+        self.stdout.write(table)
+        if options["sql"]:
+            queries = sorted(meta["queries"], key=lambda q: q["duration"], reverse=True)
+            for query in queries:
+                self.stdout.write(
+                    f"{query['duration'] * 1000:>8.2f}ms  {query['sql']}  "
+                    f"{query['params']}"
+                )
+            omitted = meta["query_count"] - len(queries)
+            if omitted:
+                self.stdout.write(f"(PROFILING_MAX_QUERIES 초과로 {omitted}개 생략)")
@@ -0,0 +1,289 @@
+"""
+벤치마크용 대량 데이터 생성 커맨드
+
+    python manage.py seed                                  # 멘토 10만, 멘티 100만, 요청 200만
+    python manage.py seed --mentors 1000 --mentees 10000 --requests 20000 --seed 7
+
+같은 --seed면 같은 데이터를 만든다. 계정(사용자/프로필/멘토 스킬)은
+api.bulk.create_accounts로, 매칭 요청과 매칭 통계(MatchStats)는 같은 Inserter로
+청크 단위 executemany로 넣는다. 시그널을 거치지 않으므로 끝나면
+멘토 디렉터리 버전과 인메모리 인덱스를 갱신한다.
+"""
+
+import itertools
+import random
+import time
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from api.bulk import Account, Inserter, chunks, create_accounts, finish_bulk_load
+from api.models import MatchRequest, MatchStats, Profile, Skill, User
+
+BASE_SKILLS = [
+    "React", "Vue", "Angular", "Svelte", "TypeScript", "JavaScript", "Python",
+    "Django", "FastAPI", "Flask", "Java", "Spring", "Kotlin", "Swift", "Go",
+    "Rust", "C++", "SQL", "PostgreSQL", "Docker", "Kubernetes", "AWS", "Figma",
+]  # fmt: skip
+
+BIO_TEMPLATES = [
+    "{skill} 실무 경험을 나누고 싶습니다.",
+    "{skill} 중심으로 커리어를 쌓고 있습니다.",
+    "{skill}와 {other}를 공부하고 있습니다.",
+    "현업에서 {skill}, {other}를 주로 사용합니다.",
+]
+
+MENTOR_EMAIL = "seed-mentor-{}@example.com"
+MENTEE_EMAIL = "seed-mentee-{}@example.com"
+
+
+def zipf_cum_weights(n: int, exponent: float) -> list[float]:
+    """순위 k(1부터)의 가중치가 1/k^exponent인 누적 가중치 (random.choices용)"""
+    return list(itertools.accumulate(1 / rank**exponent for rank in range(1, n + 1)))
+
+
+def skill_names(count: int) -> list[str]:
+    names = BASE_SKILLS[:count]
+    names += [f"skill-{index}" for index in range(len(names), count)]
+    return names
+
+
+class Command(BaseCommand):
+    help = "벤치마크용 멘토/멘티/매칭 요청/스킬/이미지 데이터를 대량으로 만든다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mentors", type=int, default=100_000)
+        parser.add_argument("--mentees", type=int, default=1_000_000)
+        parser.add_argument(
+            "--requests", type=int, default=2_000_000, help="매칭 요청 수 (대략)"
+        )
+        parser.add_argument("--skills", type=int, default=500, help="스킬 어휘 크기")
+        parser.add_argument(
+            "--zipf",
+            type=float,
+            default=1.1,
+            help="스킬/멘토 인기도 Zipf 지수 (클수록 상위에 몰림)",
+        )
+        parser.add_argument(
+            "--max-skills", type=int, default=5, help="멘토당 최대 스킬 수"
+        )
+        parser.add_argument(
+            "--images", type=int, default=1000, help="이미지를 넣을 멘토 수"
+        )
+        parser.add_argument(
+            "--image-size", type=int, default=16_384, help="이미지 크기(바이트)"
+        )
+        parser.add_argument("--days", type=int, default=180, help="요청 생성 기간(일)")
+        parser.add_argument("--password", default="seed-password")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--chunk", type=int, default=20_000, help="INSERT 묶음 크기"
+        )
+
+    def handle(self, *args, **options):
+        for key in ("mentors", "mentees", "skills", "chunk", "max_skills"):
+            if options[key] < 1:
+                raise CommandError(f"--{key.replace('_', '-')}는 1 이상이어야 합니다.")
+        if options["requests"] < 0 or options["images"] < 0:
+            raise CommandError("--requests와 --images는 0 이상이어야 합니다.")
+        if User.objects.filter(
+            email__in=[MENTOR_EMAIL.format(0), MENTEE_EMAIL.format(0)]
+        ).exists():
+            raise CommandError(
+                "seed 데이터가 이미 있습니다. 빈 DB(migrate 직후)에서 실행하세요."
+            )
+
+        self.rng = random.Random(options["seed"])
+        self.now = timezone.now().replace(microsecond=0)
+        self.options = options
+        started = time.perf_counter()
+
+        skill_ids = self._seed_skills()
+        mentor_ids, mentee_ids = self._seed_accounts(skill_ids)
+        accepted_mentors = self._seed_requests(mentor_ids, mentee_ids)
+        if accepted_mentors:
+            # 수락한 멘토는 더 이상 요청을 받을 수 없음
+            for chunk in chunks(sorted(accepted_mentors), 900):
+                Profile.objects.filter(user_id__in=chunk).update(is_available=False)
+
+        finish_bulk_load()
+        self._log(f"완료: {time.perf_counter() - started:.1f}초")
+
+    def _log(self, message: str) -> None:
+        self.stdout.write(message)
+        self.stdout.flush()
+
+    def _timed(self, label: str, inserter: Inserter, rows: Iterable[tuple]) -> int:
+        started = time.perf_counter()
+        count = inserter.insert(rows, self.options["chunk"])
+        elapsed = time.perf_counter() - started
+        rate = count / elapsed if elapsed else 0
+        self._log(f"{label}: {count:,}행 {elapsed:.1f}초 ({rate:,.0f}행/초)")
+        return count
+
+    def _seed_skills(self) -> list[int]:
+        """인기순으로 정렬된 스킬 id 목록 (앞쪽일수록 자주 선택)"""
+        names = skill_names(self.options["skills"])
+        Skill.objects.bulk_create(
+            [Skill(name=name) for name in names], ignore_conflicts=True
+        )
+        ids = dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+        self._log(f"스킬: {len(names):,}개")
+        return [ids[name] for name in names]
+
+    def _seed_accounts(self, skill_ids: list[int]):
+        """멘토와 멘티 계정을 넣고 각각의 사용자 id 범위 반환"""
+        options, rng = self.options, self.rng
+        names = dict(Skill.objects.filter(id__in=skill_ids).values_list("id", "name"))
+        skill_weights = zipf_cum_weights(len(skill_ids), options["zipf"])
+        images = [
+            b"\xff\xd8\xff\xe0"
+            + rng.randbytes(max(0, options["image_size"] - 6))
+            + b"\xff\xd9"
+            for _ in range(min(options["images"], 16))
+        ]
+        mentors = options["mentors"]
+        with_image = set(rng.sample(range(mentors), min(options["images"], mentors)))
+
+        def bio(skills: list[int]) -> str:
+            template = rng.choice(BIO_TEMPLATES)
+            other = names[skills[-1]]
+            return template.format(skill=names[skills[0]], other=other)
+
+        def accounts() -> Iterator[Account]:
+            for index in range(mentors):
+                count = rng.randint(1, options["max_skills"])
+                skills = list(
+                    dict.fromkeys(
+                        rng.choices(skill_ids, cum_weights=skill_weights, k=count)
+                    )
+                )
+                yield Account(
+                    MENTOR_EMAIL.format(index),
+                    f"멘토{index}",
+                    "mentor",
+                    bio(skills),
+                    skills,
+                    images[index % len(images)] if index in with_image else None,
+                )
+            for index in range(options["mentees"]):
+                skills = rng.choices(skill_ids, cum_weights=skill_weights, k=2)
+                yield Account(
+                    MENTEE_EMAIL.format(index), f"멘티{index}", "mentee", bio(skills)
+                )
+
+        started = time.perf_counter()
+        user_ids = create_accounts(
+            accounts(), options["password"], options["chunk"], now=self.now
+        )
+        elapsed = time.perf_counter() - started
+        rate = len(user_ids) / elapsed if elapsed else 0
+        self._log(
+            f"계정(사용자/프로필/멘토 스킬): {len(user_ids):,}개 "
+            f"{elapsed:.1f}초 ({rate:,.0f}개/초)"
+        )
+        return user_ids[:mentors], user_ids[mentors:]
+
+    def _seed_requests(self, mentor_ids, mentee_ids) -> set:
+        """멘티별로 서로 다른 멘토에게 요청을 만든다
+
+        제약 조건을 지키도록 멘티당 대기 요청은 마지막 하나까지만,
+        멘토당 수락은 하나까지만 만든다. 상태별 개수로 MatchStats도 채운다.
+        """
+        options, rng = self.options, self.rng
+        mentors = len(mentor_ids)
+        average = min(options["requests"] / len(mentee_ids), mentors)
+        base, extra = int(average), average - int(average)
+        mentor_weights = zipf_cum_weights(mentors, options["zipf"])
+        # 인기 순위와 id가 겹치지 않도록 순위 -> 멘토를 섞는다
+        ranking = list(mentor_ids)
+        rng.shuffle(ranking)
+        accepted_mentors = set()
+        stats: dict[int, list[int]] = {}
+        statuses = ("pending", "accepted", "rejected", "cancelled")
+        period = options["days"] * 86400
+        adapt = connection.ops.adapt_datetimefield_value
+        messages = [
+            "멘토링 부탁드립니다.",
+            "커리어 상담을 받고 싶습니다.",
+            "코드 리뷰를 받고 싶습니다.",
+        ]
+
+        def count_status(user_id: int, status: str) -> None:
+            counts = stats.setdefault(user_id, [0, 0, 0, 0])
+            counts[statuses.index(status)] += 1
+
+        def rows():
+            request_id = (
+                MatchRequest.objects.order_by("-id")
+                .values_list("id", flat=True)
+                .first()
+                or 0
+            )
+            for mentee_id in mentee_ids:
+                count = base + (rng.random() < extra)
+                if not count:
+                    continue
+                chosen = set()
+                while len(chosen) < count:
+                    chosen.update(
+                        rng.choices(
+                            ranking, cum_weights=mentor_weights, k=count - len(chosen)
+                        )
+                    )
+                offsets = sorted(rng.randrange(period) for _ in range(count))
+                for position, (mentor_id, offset) in enumerate(
+                    zip(sorted(chosen), offsets)
+                ):
+                    last = position == count - 1
+                    roll = rng.random()
+                    if last and roll < 0.3:
+                        status = "pending"
+                    elif roll < 0.4 and mentor_id not in accepted_mentors:
+                        status = "accepted"
+                        accepted_mentors.add(mentor_id)
+                    elif roll < 0.55:
+                        status = "cancelled"
+                    else:
+                        status = "rejected"
+                    created = self.now - timedelta(seconds=period - offset)
+                    updated = (
+                        created
+                        if status == "pending"
+                        else created + timedelta(seconds=rng.randrange(1, 3 * 86400))
+                    )
+                    count_status(mentor_id, status)
+                    count_status(mentee_id, status)
+                    request_id += 1
+                    yield (
+                        request_id,
+                        mentor_id,
+                        mentee_id,
+                        rng.choice(messages),
+                        status,
+                        adapt(created),
+                        adapt(min(updated, self.now)),
+                    )
+
+        inserter = Inserter(
+            MatchRequest,
+            ["id", "mentor", "mentee", "message", "status", "created_at", "updated_at"],
+        )
+        self._timed("매칭 요청", inserter, rows())
+
+        stats_inserter = Inserter(
+            MatchStats,
+            ["user", "pending", "accepted", "rejected", "cancelled", "accepted_total"],
+        )
+        self._timed(
+            "매칭 통계",
+            stats_inserter,
+            (
+                (user_id, *counts, counts[1])
+                for user_id, counts in sorted(stats.items())
+            ),
+        )
+        return accepted_mentors
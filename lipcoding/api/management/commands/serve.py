@@ -0,0 +1,192 @@
+"""
+운영용 프리포크 서버 실행 커맨드 (runserver 대체)
+
+    python manage.py serve --port 8080                  # uvicorn(ASGI) 워커
+    python manage.py serve --worker-class wsgi          # wsgiref 워커 (벤치마크용)
+"""
+
+import shutil
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api import prefork
+from api.metrics import collector
+
+LOCAL_EVENTS_BACKEND = "api.events.LocalBackend"
+SHARED_EVENTS_BACKEND = "api.events.SQLitePollingBackend"
+
+
+def select_events_backend(workers: int) -> str | None:
+    """워커가 여럿인데 LocalBackend면 대신 쓸 매칭 이벤트 백엔드 (아니면 None)
+
+    LocalBackend는 발행한 워커의 SSE 연결에만 전달하므로 다른 워커에 붙은
+    클라이언트는 이벤트를 놓친다.
+    """
+    backend = getattr(settings, "MATCH_EVENTS_BACKEND", LOCAL_EVENTS_BACKEND)
+    if workers > 1 and backend == LOCAL_EVENTS_BACKEND:
+        return SHARED_EVENTS_BACKEND
+    return None
+
+
+def _warm_up() -> None:
+    """URLconf(Ninja 라우터, 스키마 포함)를 미리 불러와 첫 요청 지연을 없앤다"""
+    from django.urls import get_resolver
+
+    get_resolver()._populate()
+
+
+def load_wsgi_app():
+    from django.core.wsgi import get_wsgi_application
+
+    app = get_wsgi_application()
+    _warm_up()
+    return app
+
+
+def load_asgi_app():
+    from django.core.asgi import get_asgi_application
+
+    app = get_asgi_application()
+    _warm_up()
+    return app
+
+
+class Command(BaseCommand):
+    help = "워커 프로세스를 미리 fork해 두는 운영용 ASGI(uvicorn) 서버를 실행한다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8080)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="워커 프로세스 수 (기본: 사용 가능한 CPU 코어 수)",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="WSGI 워커 하나가 동시에 처리할 요청 수",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30,
+            help="WSGI 워커에서 클라이언트 요청을 읽는 제한 시간(초)",
+        )
+        parser.add_argument(
+            "--keep-alive",
+            type=float,
+            default=5,
+            help="ASGI 워커에서 유휴 keep-alive 연결을 유지하는 시간(초)",
+        )
+        parser.add_argument(
+            "--max-connections",
+            type=int,
+            default=1000,
+            help="ASGI 워커 하나의 최대 동시 연결 수 (넘으면 503, 0: 제한 없음)",
+        )
+        parser.add_argument(
+            "--worker-class",
+            choices=["asgi", "wsgi"],
+            default="asgi",
+            help=(
+                "asgi: uvicorn (SSE 이벤트 스트림 지원), "
+                "wsgi: keep-alive 없는 wsgiref 서버 (벤치마크/비교용)"
+            ),
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            default=1000,
+            help="워커가 이만큼 요청을 처리하면 새 워커로 교체 (0: 교체 안 함)",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            type=int,
+            default=50,
+            help="워커마다 --max-requests에 더할 무작위 값의 최대치",
+        )
+        parser.add_argument(
+            "--graceful-timeout",
+            type=float,
+            default=30,
+            help="종료/재시작 시 처리 중인 요청을 기다리는 최대 시간(초)",
+        )
+        parser.add_argument(
+            "--no-preload",
+            action="store_true",
+            help="앱을 마스터가 아닌 각 워커에서 불러온다 (SIGHUP 시 뷰 코드 변경 반영)",
+        )
+        parser.add_argument(
+            "--access-log", action="store_true", help="요청마다 접근 로그 출력"
+        )
+
+    def log(self, message: str) -> None:
+        self.stdout.write(message)
+        self.stdout.flush()
+
+    def handle(self, *args, **options):
+        if not hasattr(prefork.os, "fork"):
+            raise CommandError("serve는 fork를 지원하는 OS에서만 실행할 수 있습니다.")
+        workers = options["workers"] or prefork.available_cores()
+        if workers < 1 or options["threads"] < 1:
+            raise CommandError("--workers와 --threads는 1 이상이어야 합니다.")
+        if options["timeout"] <= 0 or options["keep_alive"] <= 0:
+            raise CommandError("--timeout과 --keep-alive는 0보다 커야 합니다.")
+        if options["max_connections"] < 0:
+            raise CommandError("--max-connections는 0 이상이어야 합니다.")
+        if options["max_requests"] < 0 or options["max_requests_jitter"] < 0:
+            raise CommandError("--max-requests 값은 0 이상이어야 합니다.")
+
+        events_backend = select_events_backend(workers)
+        if events_backend:
+            # fork 전에 바꿔 두면 모든 워커가 같은 설정을 물려받는다
+            settings.MATCH_EVENTS_BACKEND = events_backend
+            self.log(f"[master] 워커 {workers}개: 매칭 이벤트 백엔드 {events_backend}")
+
+        if options["worker_class"] == "asgi":
+            load_app, run_worker = load_asgi_app, prefork.run_asgi_worker
+        else:
+            load_app, run_worker = load_wsgi_app, prefork.run_wsgi_worker
+
+        try:
+            sock = prefork.create_socket(options["host"], options["port"])
+        except OSError as e:
+            raise CommandError(f"{options['host']}:{options['port']} 바인드 실패: {e}")
+
+        # 워커별 메트릭 파일을 모을 디렉터리 (/metrics가 합산)
+        metrics_dir = getattr(settings, "METRICS_DIR", None)
+        temporary = metrics_dir is None
+        if temporary:
+            metrics_dir = tempfile.mkdtemp(prefix="lipcoding-metrics-")
+        collector.configure(metrics_dir, clear=True)
+
+        arbiter = prefork.Arbiter(
+            sock,
+            load_app,
+            run_worker,
+            workers=workers,
+            preload=not options["no_preload"],
+            graceful_timeout=options["graceful_timeout"],
+            worker_options={
+                "threads": options["threads"],
+                "max_requests": options["max_requests"],
+                "max_requests_jitter": options["max_requests_jitter"],
+                "access_log": options["access_log"],
+                "timeout": options["timeout"],
+                "keep_alive": options["keep_alive"],
+                "max_connections": options["max_connections"],
+            },
+            log=self.log,
+        )
+        try:
+            arbiter.run()
+        finally:
+            if temporary:
+                shutil.rmtree(metrics_dir, ignore_errors=True)
+        sys.stdout.flush()
@@ -0,0 +1,69 @@
+"""
+대기 중인 매칭 요청 일괄 배정 커맨드 (코호트 시작 시)
+
+    python manage.py solve_match_requests --dry-run
+    python manage.py solve_match_requests --since 2025-03-01T09:00
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from api.services import MatchSolverService
+
+
+class Command(BaseCommand):
+    help = "대기 중인 매칭 요청을 멘토당 한 명인 최대 매칭으로 한 번에 배정한다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            default=None,
+            help="이 시각 이후 생성된 요청만 배정 (ISO 8601, 기본: 전체)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="반영하지 않고 배정 결과만 출력",
+        )
+        parser.add_argument(
+            "--show-pairs",
+            action="store_true",
+            help="배정된 요청 목록도 출력",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError("--since는 ISO 8601 형식이어야 합니다.")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        started = time.perf_counter()
+        try:
+            result = MatchSolverService.solve(since=since, dry_run=options["dry_run"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        if options["show_pairs"]:
+            for pair in result["pairs"]:
+                self.stdout.write(
+                    f"요청 {pair['id']}: 멘토 {pair['mentorId']} - 멘티 {pair['menteeId']}"
+                )
+        self.stdout.write(
+            f"대기 요청 {result['candidates']}개 "
+            f"(멘토 {result['mentors']}명, 멘티 {result['mentees']}명)"
+        )
+        summary = (
+            f"수락 {result['matched']}개, 자동 거절 {result['rejected']}개 "
+            f"({elapsed:.2f}초)"
+        )
+        if result["dryRun"]:
+            self.stdout.write(f"[dry run] {summary}")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"배정 완료: {summary}"))
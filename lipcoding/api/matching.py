@@ -0,0 +1,93 @@
+"""
+이분 그래프 최대 매칭 (Hopcroft-Karp)
+
+왼쪽 정점(멘티)마다 연결된 오른쪽 정점(멘토) 목록을 선호 순서대로 받아
+오른쪽 정점 하나가 왼쪽 정점 하나와만 짝지어지는 최대 매칭을 계산한다.
+"""
+
+from collections import deque
+from collections.abc import Sequence
+
+UNMATCHED = -1
+
+
+def _greedy(adjacency: Sequence[Sequence[int]], match_right: list[int]) -> list[int]:
+    """선호 순서대로 비어 있는 첫 정점과 짝짓는 초기 매칭"""
+    match_left = [UNMATCHED] * len(adjacency)
+    for left, neighbors in enumerate(adjacency):
+        for right in neighbors:
+            if match_right[right] == UNMATCHED:
+                match_left[left] = right
+                match_right[right] = left
+                break
+    return match_left
+
+
+def hopcroft_karp(adjacency: Sequence[Sequence[int]], right_count: int) -> list[int]:
+    """
+    최대 매칭 계산 - O(E * sqrt(V))
+
+    adjacency[왼쪽] = 오른쪽 정점 번호 목록 (앞쪽일수록 선호)
+    반환값[왼쪽] = 짝지어진 오른쪽 정점 번호 (없으면 UNMATCHED)
+
+    탐욕 초기 매칭으로 선호 순서를 최대한 살린 뒤,
+    증가 경로가 있을 때만 기존 짝을 바꿔 매칭 수를 늘린다.
+    """
+    match_right = [UNMATCHED] * right_count
+    match_left = _greedy(adjacency, match_right)
+    left_count = len(adjacency)
+
+    while True:
+        # BFS: 짝 없는 왼쪽 정점에서 시작하는 층(거리) 계산
+        distance = [UNMATCHED] * left_count
+        queue = deque()
+        for left in range(left_count):
+            if match_left[left] == UNMATCHED and adjacency[left]:
+                distance[left] = 0
+                queue.append(left)
+        found = False
+        while queue:
+            left = queue.popleft()
+            for right in adjacency[left]:
+                partner = match_right[right]
+                if partner == UNMATCHED:
+                    found = True
+                elif distance[partner] == UNMATCHED:
+                    distance[partner] = distance[left] + 1
+                    queue.append(partner)
+        if not found:
+            return match_left
+
+        # DFS: 층을 따라 서로 겹치지 않는 최단 증가 경로를 찾아 뒤집는다
+        # (멘티 수만큼 깊어질 수 있으므로 재귀 대신 명시적 스택 사용)
+        cursor = [0] * left_count
+        for root in range(left_count):
+            if match_left[root] != UNMATCHED or distance[root] != 0:
+                continue
+            stack = [root]
+            while stack:
+                left = stack[-1]
+                neighbors = adjacency[left]
+                advanced = False
+                while cursor[left] < len(neighbors):
+                    right = neighbors[cursor[left]]
+                    cursor[left] += 1
+                    partner = match_right[right]
+                    if partner == UNMATCHED:
+                        # 증가 경로 발견: 스택의 정점들을 경로를 따라 다시 짝짓기
+                        for node in reversed(stack):
+                            previous = match_left[node]
+                            match_left[node] = right
+                            match_right[right] = node
+                            right = previous
+                        stack = []
+                        advanced = True
+                        break
+                    if distance[partner] == distance[left] + 1:
+                        stack.append(partner)
+                        advanced = True
+                        break
+                if not advanced:
+                    # 이 정점에서는 증가 경로가 없으므로 이번 단계에서 제외
+                    distance[left] = UNMATCHED
+                    stack.pop()
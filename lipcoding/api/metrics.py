@@ -0,0 +1,391 @@
+"""
+엔드포인트별 지연/쿼리/응답 크기 메트릭 (Prometheus 텍스트 형식)
+
+요청을 처리한 스레드는 자기 전용 카운터(shard)만 갱신하므로 잠금이 없다.
+프로세스는 주기적으로 자기 합계를 METRICS_DIR/<pid>.json에 통째로 덮어쓰고,
+/metrics를 받은 워커가 모든 파일을 합산해서 내려준다.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+import weakref
+from collections.abc import Iterable
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+# shard가 이만큼 쌓이면 새 스레드 등록 시 종료된 스레드 shard를 정리
+MIN_PRUNE_SHARDS = 64
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# (메트릭 이름, 라벨 튜플) -> 값
+Key = tuple[str, tuple[tuple[str, str], ...]]
+
+METRICS = {
+    "lipcoding_http_requests_total": (
+        "counter",
+        "처리한 요청 수",
+    ),
+    "lipcoding_http_request_duration_seconds": (
+        "histogram",
+        "요청 처리 시간",
+    ),
+    "lipcoding_http_response_size_bytes": (
+        "summary",
+        "응답 본문 크기 (스트리밍 응답 제외)",
+    ),
+    "lipcoding_db_queries_total": (
+        "counter",
+        "요청 처리 중 실행한 SQL 쿼리 수",
+    ),
+    "lipcoding_db_query_duration_seconds_total": (
+        "counter",
+        "요청 처리 중 SQL 쿼리에 쓴 시간",
+    ),
+}
+
+
+class _Shard:
+    """스레드 하나만 쓰는 카운터 묶음"""
+
+    __slots__ = ("thread", "values")
+
+    def __init__(self, thread: threading.Thread):
+        self.values: dict[Key, float] = {}
+        self.thread = weakref.ref(thread)
+
+    def alive(self) -> bool:
+        thread = self.thread()
+        return thread is not None and thread.is_alive()
+
+    def add(self, key: Key, amount: float) -> None:
+        values = self.values
+        values[key] = values.get(key, 0) + amount
+
+
+class MetricsCollector:
+    """프로세스 내 메트릭 수집기 (스레드별 shard + 프로세스별 파일)"""
+
+    def __init__(self, directory: str | None = None):
+        self.directory = directory
+        self.buckets = tuple(
+            getattr(settings, "METRICS_LATENCY_BUCKETS", DEFAULT_BUCKETS)
+        )
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        # 종료된 스레드의 shard를 합쳐 둔 값 (요청마다 스레드를 만드는 서버에서
+        # shard 수가 누적되지 않도록)
+        self._retired: dict[Key, float] = {}
+        self._prune_at = MIN_PRUNE_SHARDS
+        self._register_lock = threading.Lock()  # 스레드마다 처음 한 번만 사용
+        self._flush_lock = threading.Lock()
+        self._last_flush = 0.0
+        self._pid = os.getpid()
+
+    def configure(self, directory: str | None, clear: bool = False) -> None:
+        """워커 파일을 모을 디렉터리 지정 (clear: 이전 실행이 남긴 파일 삭제)"""
+        self.directory = directory
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        if clear:
+            for name in os.listdir(directory):
+                if name.endswith((".json", ".tmp")):
+                    os.unlink(os.path.join(directory, name))
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is not None and self._pid == os.getpid():
+            return shard
+        with self._register_lock:
+            if self._pid != os.getpid():
+                # fork된 워커는 부모가 기록한 값을 이어받지 않는다
+                self._reset()
+            if len(self._shards) >= self._prune_at:
+                self._prune()
+                self._prune_at = max(MIN_PRUNE_SHARDS, 2 * len(self._shards))
+            shard = _Shard(threading.current_thread())
+            self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _prune(self) -> None:
+        """종료된 스레드의 shard를 _retired에 합치고 목록에서 뺀다 (_register_lock 안에서)"""
+        live = []
+        for shard in self._shards:
+            if shard.alive():
+                live.append(shard)
+                continue
+            # 더 이상 쓰는 스레드가 없으므로 그대로 읽어도 된다
+            for key, value in shard.values.items():
+                self._retired[key] = self._retired.get(key, 0) + value
+        self._shards = live
+
+    def _reset(self) -> None:
+        self._shards = []
+        self._retired = {}
+        self._prune_at = MIN_PRUNE_SHARDS
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._last_flush = 0.0
+
+    def reset(self) -> None:
+        """이 프로세스의 값을 모두 지운다"""
+        with self._register_lock:
+            self._reset()
+
+    def observe_request(
+        self,
+        endpoint: str,
+        method: str,
+        status: int,
+        duration: float,
+        size: int | None,
+        queries: int,
+        query_time: float,
+    ) -> None:
+        shard = self._shard()
+        labels = (("endpoint", endpoint), ("method", method))
+        shard.add(
+            ("lipcoding_http_requests_total", labels + (("status", str(status)),)), 1
+        )
+        name = "lipcoding_http_request_duration_seconds"
+        for index, bound in enumerate(self.buckets):
+            if duration <= bound:
+                # 누적하지 않은 버킷별 개수 (내보낼 때 누적)
+                shard.add((f"{name}:{index}", labels), 1)
+                break
+        shard.add((f"{name}_sum", labels), duration)
+        shard.add((f"{name}_count", labels), 1)
+        if size is not None:
+            shard.add(("lipcoding_http_response_size_bytes_sum", labels), size)
+            shard.add(("lipcoding_http_response_size_bytes_count", labels), 1)
+        shard.add(("lipcoding_db_queries_total", labels), queries)
+        shard.add(("lipcoding_db_query_duration_seconds_total", labels), query_time)
+        self.maybe_flush()
+
+    def snapshot(self) -> dict[Key, float]:
+        """이 프로세스의 모든 스레드 값 합계"""
+        with self._register_lock:
+            self._prune()
+            totals = dict(self._retired)
+            shards = list(self._shards)
+        for shard in shards:
+            # dict 복사는 GIL 안에서 한 번에 일어나므로 쓰는 스레드와 경합해도 안전
+            for key, value in dict(shard.values).items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def maybe_flush(self) -> None:
+        interval = getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0)
+        if self.directory and time.monotonic() - self._last_flush >= interval:
+            self.flush(blocking=False)
+
+    def flush(self, blocking: bool = True) -> None:
+        """이 프로세스의 합계를 <pid>.json으로 원자적으로 교체"""
+        if not self.directory or self._pid != os.getpid():
+            return
+        if not self._flush_lock.acquire(blocking=blocking):
+            return  # 다른 스레드가 기록 중
+        try:
+            self._last_flush = time.monotonic()
+            path = os.path.join(self.directory, f"{os.getpid()}.json")
+            _write_json(path, _encode(self.snapshot()))
+        finally:
+            self._flush_lock.release()
+
+    def collect(self) -> dict[Key, float]:
+        """모든 워커 파일과 이 프로세스의 최신 값을 합산"""
+        if not self.directory:
+            return self.snapshot()
+        self.flush()
+        _compact(self.directory)
+        totals: dict[Key, float] = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            for key, value in _read_json(os.path.join(self.directory, name)).items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+def _encode(values: dict[Key, float]) -> list:
+    return [
+        [name, list(map(list, labels)), value]
+        for (name, labels), value in values.items()
+    ]
+
+
+def _write_json(path: str, rows: list) -> None:
+    temp = f"{path}.{threading.get_ident()}.tmp"
+    with open(temp, "w") as f:
+        json.dump(rows, f)
+    os.replace(temp, path)
+
+
+def _read_json(path: str) -> dict[Key, float]:
+    try:
+        with open(path) as f:
+            rows = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        (name, tuple(tuple(label) for label in labels)): value
+        for name, labels, value in rows
+    }
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _compact(directory: str) -> None:
+    """종료된 워커 파일을 archive.json에 합쳐 파일 수를 제한 (카운터는 줄어들지 않음)"""
+    dead = [
+        name
+        for name in os.listdir(directory)
+        if name.endswith(".json")
+        and name[:-5].isdigit()
+        and not _pid_alive(int(name[:-5]))
+    ]
+    if len(dead) < getattr(settings, "METRICS_COMPACT_THRESHOLD", 16):
+        return
+    with open(os.path.join(directory, "compact.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        archive_path = os.path.join(directory, "archive.json")
+        totals = _read_json(archive_path)
+        merged = []
+        for name in dead:
+            path = os.path.join(directory, name)
+            if not os.path.exists(path):
+                continue  # 다른 워커가 먼저 합침
+            for key, value in _read_json(path).items():
+                totals[key] = totals.get(key, 0) + value
+            merged.append(path)
+        _write_json(archive_path, _encode(totals))
+        for path in merged:
+            os.unlink(path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    inner = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f"{{{inner}}}" if inner else ""
+
+
+def render(values: dict[Key, float], buckets: Iterable[float]) -> str:
+    """합산된 값을 Prometheus 텍스트 형식으로"""
+    buckets = list(buckets)
+    series: dict[str, dict[tuple, float]] = {}
+    for (name, labels), value in values.items():
+        series.setdefault(name, {})[labels] = value
+
+    lines = []
+    for metric, (kind, help_text) in METRICS.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        if kind == "histogram":
+            label_sets = sorted(series.get(f"{metric}_count", {}))
+            for labels in label_sets:
+                cumulative = 0
+                for index, bound in enumerate(buckets):
+                    cumulative += series.get(f"{metric}:{index}", {}).get(labels, 0)
+                    le = labels + (("le", repr(float(bound))),)
+                    lines.append(f"{metric}_bucket{_format_labels(le)} {cumulative:g}")
+                count = series[f"{metric}_count"][labels]
+                le = labels + (("le", "+Inf"),)
+                lines.append(f"{metric}_bucket{_format_labels(le)} {count:g}")
+                total = series.get(f"{metric}_sum", {}).get(labels, 0)
+                lines.append(f"{metric}_sum{_format_labels(labels)} {total!r}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {count:g}")
+        elif kind == "summary":
+            for labels in sorted(series.get(f"{metric}_count", {})):
+                for suffix in ("_sum", "_count"):
+                    value = series.get(f"{metric}{suffix}", {}).get(labels, 0)
+                    lines.append(f"{metric}{suffix}{_format_labels(labels)} {value:g}")
+        else:
+            for labels, value in sorted(series.get(metric, {}).items()):
+                lines.append(f"{metric}{_format_labels(labels)} {value!r}")
+    return "\n".join(lines) + "\n"
+
+
+collector = MetricsCollector()
+
+
+@contextmanager
+def _count_queries(stats: list):
+    def wrapper(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            stats[0] += 1
+            stats[1] += time.perf_counter() - started
+
+    connection = connections["default"]
+    with connection.execute_wrapper(wrapper):
+        yield
+
+
+def _endpoint(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None or match.route is None:
+        return "unmatched"
+    return "/" + match.route
+
+
+class MetricsMiddleware:
+    """Ninja 오퍼레이션(URL 패턴)별 요청 수/지연/쿼리 수/응답 크기 기록"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        # serve 커맨드가 워커 공용 디렉터리를 먼저 지정했으면 그대로 둔다
+        if collector.directory is None:
+            collector.configure(getattr(settings, "METRICS_DIR", None))
+
+    def __call__(self, request):
+        if request.path == "/metrics":
+            return self.get_response(request)
+        stats = [0, 0.0]
+        started = time.perf_counter()
+        with _count_queries(stats):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+        size = None if response.streaming else len(response.content)
+        collector.observe_request(
+            _endpoint(request),
+            request.method,
+            response.status_code,
+            duration,
+            size,
+            stats[0],
+            stats[1],
+        )
+        return response
+
+
+def metrics_view(request):
+    """내부 수집용 /metrics (METRICS_ALLOWED_IPS에서만 허용)"""
+    allowed = getattr(settings, "METRICS_ALLOWED_IPS", ["127.0.0.1", "::1"])
+    if allowed is not None and request.META.get("REMOTE_ADDR") not in allowed:
+        return HttpResponseForbidden("Forbidden")
+    body = render(collector.collect(), collector.buckets)
+    return HttpResponse(body, content_type="text/plain; version=0.0.4; charset=utf-8")
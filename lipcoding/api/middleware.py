@@ -0,0 +1,199 @@
+"""
+API 미들웨어
+"""
+
+import gzip
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성
+    brotli = None
+
+
+def _compress_gzip(data: bytes) -> bytes:
+    # mtime=0: 같은 내용이면 항상 같은 바이트가 나오도록 고정
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _compress_brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+COMPRESSORS = {"gzip": _compress_gzip}
+if brotli is not None:
+    COMPRESSORS["br"] = _compress_brotli
+
+# 같은 q 값이면 압축률이 좋은 쪽을 우선
+ENCODING_PREFERENCE = ["br", "gzip"]
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding 헤더에서 사용할 인코딩 선택"""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    best = None
+    best_quality = 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in COMPRESSORS:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+# (경로, 쿼리 문자열, 내용 버전)
+VariantKey = tuple[str, str, str]
+
+
+class CompressedVariantCache:
+    """(경로, 쿼리, 내용 버전)별 압축 결과를 보관하는 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        # key -> (Content-Type, 인코딩 -> 압축 결과)
+        self._entries: OrderedDict[VariantKey, tuple[str, dict[str, bytes]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def lookup(self, key: VariantKey, encoding: str) -> tuple[bytes, str] | None:
+        """캐시된 (압축 결과, Content-Type), 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or encoding not in entry[1]:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1][encoding], entry[0]
+
+    def store(
+        self, key: VariantKey, encoding: str, content: bytes, content_type: str
+    ) -> bytes:
+        """압축해서 저장하고 압축 결과 반환"""
+        cached = self.lookup(key, encoding)
+        if cached is not None:
+            return cached[0]
+        compressed = COMPRESSORS[encoding](content)
+        with self._lock:
+            entry = self._entries.setdefault(key, (content_type, {}))
+            entry[1][encoding] = compressed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+compressed_variant_cache = CompressedVariantCache(
+    getattr(settings, "PRECOMPRESSED_CACHE_SIZE", 64)
+)
+
+
+def _variant_response(compressed: bytes, content_type: str, encoding: str):
+    response = HttpResponse(compressed, content_type=content_type)
+    response["Content-Length"] = str(len(compressed))
+    response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def precompressed_response(request, etag: str) -> HttpResponse | None:
+    """ETag(버전)가 같은 압축 변형이 캐시에 있으면 뷰가 목록을 만들기 전에 반환
+
+    인증/권한/304 확인을 마친 뷰에서 호출한다. 없으면 None이고, 뷰가 만든 응답은
+    PrecompressedResponseMiddleware가 같은 키로 저장한다.
+    """
+    paths = getattr(settings, "PRECOMPRESSED_PATHS", {})
+    if paths.get(request.path) != "etag":
+        return None
+    encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    if encoding is None:
+        return None
+    key = (request.path, request.META.get("QUERY_STRING", ""), etag)
+    cached = compressed_variant_cache.lookup(key, encoding)
+    if cached is None:
+        return None
+    response = _variant_response(cached[0], cached[1], encoding)
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+class PrecompressedResponseMiddleware:
+    """
+    크고 반복적인 JSON 응답을 미리 압축된 변형으로 내려주는 미들웨어
+
+    PRECOMPRESSED_PATHS에 정확히 일치하는 경로만 다루고, (경로, 쿼리, 내용 버전)을
+    키로 압축 결과를 캐시한다.
+
+    - "static": 배포 중 바뀌지 않는 응답 (openapi.json). 캐시에 있으면 뷰를
+      실행하지 않고 바로 반환한다. 인증이 필요 없는 경로에만 쓴다.
+    - "etag": 뷰가 버전 카운터로 만든 ETag가 내용 버전. 뷰가 인증/권한 확인 뒤
+      precompressed_response()로 먼저 캐시를 확인한다.
+    """
+
+    min_length = 200
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.paths = dict(getattr(settings, "PRECOMPRESSED_PATHS", {}))
+
+    def __call__(self, request):
+        mode = self.paths.get(request.path)
+        if mode is None:
+            return self.get_response(request)
+
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        query = request.META.get("QUERY_STRING", "")
+        if mode == "static" and encoding is not None:
+            cached = compressed_variant_cache.lookup(
+                (request.path, query, "static"), encoding
+            )
+            if cached is not None:
+                return _variant_response(cached[0], cached[1], encoding)
+
+        response = self.get_response(request)
+        if (
+            response.status_code != 200
+            or response.streaming
+            or response.has_header("Content-Encoding")
+            or len(response.content) < self.min_length
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        version = "static" if mode == "static" else response.get("ETag")
+        if encoding is None or not version:
+            return response
+
+        response.content = compressed_variant_cache.store(
+            (request.path, query, version),
+            encoding,
+            response.content,
+            response["Content-Type"],
+        )
+        response["Content-Length"] = str(len(response.content))
+        response["Content-Encoding"] = encoding
+        return response
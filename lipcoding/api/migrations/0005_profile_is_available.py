@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+def populate_is_available(apps, schema_editor):
+    """수락된 요청이 있는 멘토의 프로필을 수락 불가 상태로 초기화"""
+    Profile = apps.get_model("api", "Profile")
+    MatchRequest = apps.get_model("api", "MatchRequest")
+    busy_mentor_ids = MatchRequest.objects.filter(status="accepted").values(
+        "mentor_id"
+    )
+    Profile.objects.filter(user_id__in=busy_mentor_ids).update(is_available=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_profile_image_content_type_profile_image_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="is_available",
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.RunPython(populate_is_available, migrations.RunPython.noop),
+    ]
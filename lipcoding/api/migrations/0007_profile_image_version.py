@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0006_dataversion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="image_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0007_profile_image_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="matchrequest",
+            index=models.Index(
+                fields=["mentor", "status", "created_at"],
+                name="matchreq_mentor_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="matchrequest",
+            index=models.Index(
+                fields=["mentee", "status", "created_at"],
+                name="matchreq_mentee_status_idx",
+            ),
+        ),
+    ]
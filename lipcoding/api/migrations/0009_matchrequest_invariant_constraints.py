@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:09
+
+from django.db import migrations, models
+
+
+def resolve_duplicates(apps, schema_editor):
+    """제약 추가 전 위반 데이터 정리 (가장 최근 요청만 남김)"""
+    MatchRequest = apps.get_model("api", "MatchRequest")
+
+    # 멘티별로 가장 최근 대기 요청만 남기고 나머지는 취소
+    seen = set()
+    for request_id, mentee_id in (
+        MatchRequest.objects.filter(status="pending")
+        .order_by("-created_at", "-id")
+        .values_list("id", "mentee_id")
+    ):
+        if mentee_id in seen:
+            MatchRequest.objects.filter(id=request_id).update(status="cancelled")
+        seen.add(mentee_id)
+
+    # 멘토별로 가장 최근 수락 요청만 남기고 나머지는 거절
+    seen = set()
+    for request_id, mentor_id in (
+        MatchRequest.objects.filter(status="accepted")
+        .order_by("-updated_at", "-id")
+        .values_list("id", "mentor_id")
+    ):
+        if mentor_id in seen:
+            MatchRequest.objects.filter(id=request_id).update(status="rejected")
+        seen.add(mentor_id)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0008_matchrequest_inbox_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(resolve_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="matchrequest",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "pending")),
+                fields=("mentee",),
+                name="matchreq_one_pending_per_mentee",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="matchrequest",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "accepted")),
+                fields=("mentor",),
+                name="matchreq_one_accepted_per_mentor",
+            ),
+        ),
+    ]
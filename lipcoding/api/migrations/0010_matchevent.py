@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_events(apps, schema_editor):
+    """기존 요청마다 현재 상태로 이벤트 하나씩 기록 (seq=0부터 동기화 가능하도록)"""
+    MatchRequest = apps.get_model("api", "MatchRequest")
+    MatchEvent = apps.get_model("api", "MatchEvent")
+    rows = MatchRequest.objects.order_by("updated_at", "id").values_list(
+        "id", "mentor_id", "mentee_id", "status"
+    )
+    MatchEvent.objects.bulk_create(
+        (
+            MatchEvent(
+                match_request_id=id_,
+                mentor_id=mentor_id,
+                mentee_id=mentee_id,
+                status=status,
+            )
+            for id_, mentor_id, mentee_id, status in rows.iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0009_matchrequest_invariant_constraints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchEvent",
+            fields=[
+                ("seq", models.BigAutoField(primary_key=True, serialize=False)),
+                ("match_request_id", models.BigIntegerField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("accepted", "Accepted"),
+                            ("rejected", "Rejected"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "mentee",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "mentor",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["seq"],
+                "indexes": [
+                    models.Index(
+                        fields=["mentor", "seq"], name="matchevent_mentor_seq_idx"
+                    ),
+                    models.Index(
+                        fields=["mentee", "seq"], name="matchevent_mentee_seq_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_events, migrations.RunPython.noop),
+    ]
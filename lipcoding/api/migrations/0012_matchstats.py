@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_stats(apps, schema_editor):
+    """기존(보관 포함) 요청의 상태별 개수로 통계 초기화"""
+    MatchStats = apps.get_model("api", "MatchStats")
+    counts = {}
+    for model_name in ("MatchRequest", "ArchivedMatchRequest"):
+        model = apps.get_model("api", model_name)
+        rows = model.objects.values_list("mentor_id", "mentee_id", "status")
+        for mentor_id, mentee_id, status in rows.iterator():
+            for user_id in (mentor_id, mentee_id):
+                stats = counts.setdefault(user_id, {})
+                stats[status] = stats.get(status, 0) + 1
+    MatchStats.objects.bulk_create(
+        [
+            MatchStats(
+                user_id=user_id,
+                pending=stats.get("pending", 0),
+                accepted=stats.get("accepted", 0),
+                rejected=stats.get("rejected", 0),
+                cancelled=stats.get("cancelled", 0),
+                accepted_total=stats.get("accepted", 0),
+            )
+            for user_id, stats in counts.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0011_archivedmatchrequest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="match_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("pending", models.PositiveIntegerField(default=0)),
+                ("accepted", models.PositiveIntegerField(default=0)),
+                ("rejected", models.PositiveIntegerField(default=0)),
+                ("cancelled", models.PositiveIntegerField(default=0)),
+                ("accepted_total", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-accepted_total"], name="matchstats_popularity_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0012_matchstats"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="role",
+            field=models.CharField(
+                choices=[("mentor", "Mentor"), ("mentee", "Mentee")],
+                db_index=True,
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0014_eventstreamticket"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="matchrequest",
+            index=models.Index(
+                fields=["status", "updated_at"], name="matchreq_status_updated_idx"
+            ),
+        ),
+    ]
@@ -32,7 +32,8 @@ class User(AbstractUser):
     username = None  # username 필드 사용 안 함
     email = models.EmailField(unique=True)
     name = models.CharField(max_length=255)
-    role = models.CharField(max_length=10, choices=Role.choices)
+    # 멘토 목록/추천/facet이 role로 거르므로 전체 사용자 스캔을 피하도록 인덱스
+    role = models.CharField(max_length=10, choices=Role.choices, db_index=True)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["name", "role"]
@@ -60,7 +61,10 @@ class Profile(models.Model):
     image_content_type = models.CharField(
         max_length=50, default="image/jpeg"
     )  # 이미지 MIME 타입
+    image_version = models.PositiveIntegerField(default=0)  # 이미지 변경 시 증가
     skills = models.ManyToManyField(Skill, blank=True)
+    # 멘토 수락 가능 여부 (매칭 요청 상태 변경 시 같은 트랜잭션에서 갱신)
+    is_available = models.BooleanField(default=True, db_index=True)
 
     def __str__(self):
         return f"{self.user.name}'s Profile"
@@ -96,6 +100,153 @@ class MatchRequest(models.Model):
     class Meta:
         unique_together = ("mentor", "mentee")  # 중복 요청 방지
         ordering = ["-created_at"]
+        indexes = [
+            # 상태별 받은/보낸 요청함 페이지 조회용
+            models.Index(
+                fields=["mentor", "status", "created_at"],
+                name="matchreq_mentor_status_idx",
+            ),
+            models.Index(
+                fields=["mentee", "status", "created_at"],
+                name="matchreq_mentee_status_idx",
+            ),
+            # 종료된 요청 보관(archive_match_requests) 대상 선택용
+            models.Index(
+                fields=["status", "updated_at"],
+                name="matchreq_status_updated_idx",
+            ),
+        ]
+        constraints = [
+            # 멘티는 대기 중인 요청을 하나만 가질 수 있음
+            models.UniqueConstraint(
+                fields=["mentee"],
+                condition=models.Q(status="pending"),
+                name="matchreq_one_pending_per_mentee",
+            ),
+            # 멘토는 수락한 요청을 하나만 가질 수 있음
+            models.UniqueConstraint(
+                fields=["mentor"],
+                condition=models.Q(status="accepted"),
+                name="matchreq_one_accepted_per_mentor",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.mentee.name} -> {self.mentor.name} ({self.status})"
+
+
+class MatchStats(models.Model):
+    """사용자별 매칭 요청 상태 개수 (상태 전이마다 같은 트랜잭션에서 증분 갱신)"""
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="match_stats"
+    )
+    # 현재 해당 상태인 요청 수 (보관된 요청 포함)
+    pending = models.PositiveIntegerField(default=0)
+    accepted = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    # 지금까지 수락된 횟수 (줄어들지 않음, 멘토 인기순 정렬용)
+    accepted_total = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-accepted_total"], name="matchstats_popularity_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {self.pending}/{self.accepted}/{self.rejected}"
+
+
+class ArchivedMatchRequest(models.Model):
+    """보관된 종료(거절/취소) 매칭 요청 - 이력 조회 전용"""
+
+    id = models.BigIntegerField(primary_key=True)  # 원래 요청 id 유지
+    mentor = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="archived_incoming_match_requests",
+        db_index=False,
+    )
+    mentee = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="archived_outgoing_match_requests",
+        db_index=False,
+    )
+    message = models.TextField()
+    status = models.CharField(max_length=20, choices=MatchRequest.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["mentor", "created_at"], name="archivedreq_mentor_idx"
+            ),
+            models.Index(
+                fields=["mentee", "created_at"], name="archivedreq_mentee_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.mentee_id} -> {self.mentor_id} ({self.status}, archived)"
+
+
+class MatchEvent(models.Model):
+    """매칭 요청 상태 변경 로그 (추가 전용, seq 순서로 증분 동기화)"""
+
+    seq = models.BigAutoField(primary_key=True)
+    # 요청 행이 보관/삭제되어도 로그는 남도록 FK 대신 id만 저장
+    match_request_id = models.BigIntegerField()
+    mentor = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    mentee = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    status = models.CharField(max_length=20, choices=MatchRequest.STATUS_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["seq"]
+        indexes = [
+            # 사용자별 seq 이후 변경분 조회용
+            models.Index(fields=["mentor", "seq"], name="matchevent_mentor_seq_idx"),
+            models.Index(fields=["mentee", "seq"], name="matchevent_mentee_seq_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("MatchEvent는 수정할 수 없습니다.")
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"#{self.seq} request {self.match_request_id} -> {self.status}"
+
+
+class DataVersion(models.Model):
+    """데이터 변경 시 증가하는 버전 카운터 (ETag 생성용)"""
+
+    key = models.CharField(max_length=100, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.key}@{self.version}"
+
+
+class EventStreamTicket(models.Model):
+    """이벤트 스트림(SSE) 연결용 1회용 단기 티켓
+
+    EventSource는 헤더를 붙일 수 없어 쿼리 문자열로 인증 정보를 넘기므로,
+    로그에 남아도 곧 쓸모없어지는 티켓만 받는다.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"ticket for {self.user_id} until {self.expires_at}"
@@ -0,0 +1,367 @@
+"""
+프리포크 서버 (manage.py serve)
+
+마스터 프로세스가 소켓을 열고 앱을 미리 불러온 뒤 gc.freeze()로 힙을 고정하고
+워커를 fork한다. 워커는 같은 소켓에서 요청을 받고, N개 처리 후 스스로 종료하면
+마스터가 새 워커로 교체한다.
+
+    SIGHUP          워커를 새로 띄운 뒤 기존 워커를 정상 종료 (순차 교체)
+                    preload(기본)면 마스터가 이미 불러온 코드로 다시 fork하므로
+                    코드 변경은 --no-preload로 띄웠을 때만 반영된다
+    SIGTERM/SIGINT  새 연결을 받지 않고 처리 중인 요청을 마친 뒤 종료
+
+기본 워커는 uvicorn(ASGI)이다. wsgiref 기반 WSGI 워커는 keep-alive가 없고
+연결마다 스레드를 만들므로 벤치마크/비교용으로만 쓴다.
+"""
+
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+import uvicorn
+
+from .log import RedactingFilter, redact
+
+SIGNALS = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+
+
+def available_cores() -> int:
+    """프로세스가 사용할 수 있는 CPU 코어 수 (affinity/cgroup cpuset 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def create_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    access_log = False
+    # 요청을 보내지 않고 연결만 잡고 있는 클라이언트가 슬롯을 계속 차지하지 않도록
+    timeout = 30
+
+    def log_message(self, format, *args):
+        if self.access_log:
+            # 요청 줄의 쿼리 문자열에 실린 토큰/티켓은 남기지 않는다
+            super().log_message(format, *(redact(str(arg)) for arg in args))
+
+
+class WorkerWSGIServer(ThreadingMixIn, WSGIServer):
+    """상속받은 소켓으로 요청을 받는 WSGI 서버 (워커 하나, 벤치마크용)
+
+    연결마다 스레드를 만들지만 동시에 살아 있는 스레드는 threads개로 제한하고
+    (꽉 차면 accept하지 않는다), 연결마다 읽기 제한 시간을 둔다. HTTP/1.0처럼
+    요청 하나마다 연결을 닫는다.
+    """
+
+    # 종료 시 처리 중인 요청 스레드를 기다린다 (drain)
+    daemon_threads = False
+    block_on_close = True
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        app: Callable,
+        threads: int,
+        max_requests: int = 0,
+        access_log: bool = False,
+        timeout: float = 30,
+    ):
+        handler = type(
+            "RequestHandler",
+            (_QuietRequestHandler,),
+            {"access_log": access_log, "timeout": timeout},
+        )
+        super().__init__(sock.getsockname()[:2], handler, bind_and_activate=False)
+        self.socket.close()
+        self.socket = sock
+        host, port = sock.getsockname()[:2]
+        self.server_name = socket.getfqdn(host)
+        self.server_port = port
+        self.setup_environ()
+        self.set_app(app)
+        self._slots = threading.BoundedSemaphore(threads)
+        self._max_requests = max_requests
+        self._handled = 0
+        self._stopping = False
+
+    def process_request(self, request, client_address):
+        # 동시에 처리하는 요청 수를 스레드 수로 제한 (꽉 차면 accept를 멈춘다)
+        self._slots.acquire()
+        self._handled += 1
+        if self._max_requests and self._handled >= self._max_requests:
+            self.stop()
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+    def handle_error(self, request, client_address):
+        # 읽기 제한 시간 초과/클라이언트 연결 끊김은 정상 흐름
+        if isinstance(sys.exc_info()[1], (TimeoutError, ConnectionError)):
+            return
+        super().handle_error(request, client_address)
+
+    def stop(self) -> None:
+        """accept 루프 종료 요청 (serve_forever를 도는 스레드가 아닌 곳에서 호출)"""
+        if not self._stopping:
+            self._stopping = True
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def server_close(self):
+        # 소켓은 마스터와 다른 워커가 계속 사용하므로 닫지 않고 스레드만 기다린다
+        ThreadingMixIn.server_close(self)
+
+
+def run_wsgi_worker(sock, app, options) -> None:
+    server = WorkerWSGIServer(
+        sock,
+        app,
+        threads=options["threads"],
+        max_requests=options["max_requests"],
+        access_log=options["access_log"],
+        timeout=options["timeout"],
+    )
+    signal.signal(signal.SIGTERM, lambda *args: server.stop())
+    signal.signal(signal.SIGINT, lambda *args: server.stop())
+    options["ready"]()
+    server.serve_forever(poll_interval=0.5)
+    server.server_close()
+
+
+def run_asgi_worker(sock, app, options) -> None:
+    config = uvicorn.Config(
+        app,
+        lifespan="off",
+        log_level="warning",
+        access_log=options["access_log"],
+        limit_max_requests=options["max_requests"] or None,
+        timeout_graceful_shutdown=options["graceful_timeout"],
+        timeout_keep_alive=options["keep_alive"],
+        limit_concurrency=options["max_connections"] or None,
+    )
+    # 접근 로그의 경로(쿼리 문자열 포함)에서 토큰/티켓을 가린다
+    logging.getLogger("uvicorn.access").addFilter(RedactingFilter())
+    server = uvicorn.Server(config)
+    options["ready"]()
+    # uvicorn이 SIGTERM/SIGINT를 받으면 처리 중인 요청을 마치고 종료한다
+    server.run(sockets=[sock])
+
+
+class Arbiter:
+    """워커 프로세스를 띄우고 감시하는 마스터"""
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        load_app: Callable[[], Callable],
+        run_worker: Callable,
+        workers: int,
+        preload: bool = True,
+        graceful_timeout: float = 30,
+        worker_options: dict | None = None,
+        log: Callable[[str], None] = print,
+    ):
+        self.sock = sock
+        self.load_app = load_app
+        self.run_worker = run_worker
+        self.workers = workers
+        self.preload = preload
+        self.graceful_timeout = graceful_timeout
+        self.worker_options = worker_options or {}
+        self.log = log
+        self.app = None
+        self._workers: dict[int, float] = {}  # pid -> fork 시각
+        self._retiring: dict[int, float] = {}  # 정상 종료 중인 pid -> 종료 요청 시각
+        self._signals = []
+
+    def _preload(self) -> None:
+        started = time.perf_counter()
+        self.app = self.load_app()
+        # 미리 불러온 객체를 GC 대상에서 빼서 워커에서 복사되지 않게 (copy-on-write)
+        gc.collect()
+        gc.freeze()
+        self.log(
+            f"[master {os.getpid()}] 앱 로드 "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms, "
+            f"고정된 객체 {gc.get_freeze_count()}개"
+        )
+
+    def _spawn(self) -> int:
+        from django import db
+
+        # 부모의 DB 연결을 워커가 공유하지 않도록
+        db.connections.close_all()
+        forked_at = time.perf_counter()
+        # fork 직후 워커가 마스터의 핸들러로 시그널을 삼키지 않도록 잠시 막아 둔다
+        signal.pthread_sigmask(signal.SIG_BLOCK, SIGNALS)
+        pid = os.fork()
+        if pid:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+            self._workers[pid] = time.monotonic()
+            return pid
+
+        # 워커 프로세스
+        code = 0
+        try:
+            for signum in SIGNALS:
+                signal.signal(signum, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+            random.seed()
+            app = self.app if self.app is not None else self.load_app()
+            options = dict(self.worker_options)
+            if options.get("max_requests") and options.get("max_requests_jitter"):
+                # 워커들이 한꺼번에 교체되지 않도록 요청 수 제한을 흩뜨린다
+                options["max_requests"] += random.randint(
+                    0, options["max_requests_jitter"]
+                )
+
+            def ready():
+                self.log(
+                    f"[worker {os.getpid()}] 준비 완료 "
+                    f"{(time.perf_counter() - forked_at) * 1000:.1f}ms"
+                )
+
+            self.run_worker(
+                self.sock,
+                app,
+                {
+                    **options,
+                    "graceful_timeout": self.graceful_timeout,
+                    "ready": ready,
+                },
+            )
+        except BaseException:  # noqa: BLE001 - 자식은 무엇이 나든 os._exit로 끝낸다
+            traceback.print_exc()
+            code = 1
+        finally:
+            try:
+                # 마지막 주기 이후 쌓인 메트릭을 남기고 종료
+                from api.metrics import collector
+
+                collector.flush()
+            except Exception:  # noqa: BLE001 - 종료 정리 실패가 종료를 막지 않도록
+                traceback.print_exc()
+            try:
+                # os._exit는 atexit을 건너뛰므로 로그 큐를 직접 비운다
+                from api.log import stop_queue_logging
+
+                stop_queue_logging()
+            except Exception:  # noqa: BLE001
+                traceback.print_exc()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            started = self._workers.pop(pid, None)
+            if self._retiring.pop(pid, None) is not None or started is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if code:
+                self.log(f"[master] 워커 {pid} 비정상 종료 (코드 {code})")
+                # 시작하자마자 죽는 워커를 무한히 빠르게 다시 띄우지 않도록
+                if time.monotonic() - started < 1:
+                    time.sleep(1)
+            else:
+                self.log(f"[master] 워커 {pid} 교체 (요청 수 제한)")
+
+    def _reload(self) -> None:
+        old = list(self._workers)
+        self.log(f"[master] 재시작: 워커 {len(old)}개 교체")
+        for _ in range(self.workers):
+            self._spawn()
+        self._retire(old)
+
+    def _retire(self, pids) -> None:
+        now = time.monotonic()
+        for pid in pids:
+            self._workers.pop(pid, None)
+            self._retiring[pid] = now
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._retiring.pop(pid, None)
+
+    def _kill_stragglers(self) -> None:
+        deadline = time.monotonic() - self.graceful_timeout
+        for pid, requested in list(self._retiring.items()):
+            if requested < deadline:
+                self.log(f"[master] 워커 {pid} 강제 종료 (정상 종료 시간 초과)")
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                self._retiring[pid] = float("inf")
+
+    def _on_signal(self, signum, frame) -> None:
+        self._signals.append(signum)
+
+    def run(self) -> None:
+        if self.preload:
+            self._preload()
+        for signum in SIGNALS:
+            signal.signal(signum, self._on_signal)
+
+        host, port = self.sock.getsockname()[:2]
+        self.log(
+            f"[master {os.getpid()}] http://{host}:{port} 에서 대기 "
+            f"(워커 {self.workers}개)"
+        )
+        for _ in range(self.workers):
+            self._spawn()
+
+        stopping = False
+        while True:
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum == signal.SIGHUP and not stopping:
+                    self._reload()
+                elif signum in (signal.SIGTERM, signal.SIGINT) and not stopping:
+                    stopping = True
+                    self.log("[master] 종료: 처리 중인 요청을 마치는 중")
+                    self._retire(list(self._workers))
+            self._reap()
+            self._kill_stragglers()
+            if stopping:
+                if not self._retiring:
+                    break
+            else:
+                for _ in range(self.workers - len(self._workers)):
+                    self._spawn()
+            time.sleep(0.1)
+
+        self.sock.close()
+        self.log("[master] 종료 완료")
@@ -0,0 +1,208 @@
+"""
+요청 단위 프로파일 캡처 (opt-in)
+
+관리자가 서명한 토큰을 X-Profile 헤더나 ?__profile= 쿼리로 넘긴 요청만 cProfile로
+실행하고, 프로파일(pstats)과 실행한 SQL을 PROFILING_DIR에 남긴다. 디렉터리에는
+최근 PROFILING_MAX_CAPTURES개만 유지한다(오래된 것부터 삭제).
+
+    python manage.py request_profiles --token            # 토큰 발급
+    curl -H "X-Profile: <token>" http://127.0.0.1:8080/api/mentors
+    python manage.py request_profiles                    # 목록
+    python manage.py request_profiles <id>               # 상세
+
+토큰이 없는 요청은 헤더/쿼리 문자열 포함 여부만 확인하고 그대로 지나간다.
+SQL 파라미터는 숫자/불리언/None만 남기고 나머지(이메일, 비밀번호 해시, 이벤트
+티켓 키 등)는 가려서 저장하고, SQL 문도 api.log.redact로 토큰을 가린다.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .log import redact
+
+HEADER = "HTTP_X_PROFILE"
+QUERY_PARAM = "__profile"
+SALT = "api.profiling"
+DEFAULT_MAX_CAPTURES = 50
+DEFAULT_MAX_QUERIES = 500
+DEFAULT_TOKEN_MAX_AGE = 3600  # 초
+
+
+def profile_dir() -> str:
+    directory = getattr(settings, "PROFILING_DIR", None)
+    return str(directory or os.path.join(settings.BASE_DIR, "profiles"))
+
+
+def make_token(issuer: str = "admin") -> str:
+    """SECRET_KEY로 서명한 프로파일 토큰 (PROFILING_TOKEN_MAX_AGE 동안 유효)"""
+    return signing.dumps({"by": issuer}, salt=SALT, compress=True)
+
+
+def check_token(token: str) -> str | None:
+    """유효한 토큰이면 발급자, 아니면 None"""
+    max_age = getattr(settings, "PROFILING_TOKEN_MAX_AGE", DEFAULT_TOKEN_MAX_AGE)
+    try:
+        return signing.loads(token, salt=SALT, max_age=max_age).get("by", "")
+    except (signing.BadSignature, AttributeError):
+        return None
+
+
+@contextmanager
+def _record_queries(queries: list, limit: int):
+    def wrapper(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if len(queries) < limit:
+                queries.append(
+                    {
+                        "sql": redact(sql),
+                        "params": None if many else _redact_params(params),
+                        "many": many,
+                        "duration": time.perf_counter() - started,
+                    }
+                )
+            else:
+                queries.append(None)  # 개수만 센다
+
+    with connections["default"].execute_wrapper(wrapper):
+        yield
+
+
+def _redact_params(params) -> Any:
+    """숫자/불리언/None만 남기고 나머지 값은 가린다 (캡처 파일에 사용자 데이터를 남기지 않음)"""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {name: _redact_param(value) for name, value in params.items()}
+    return [_redact_param(value) for value in params]
+
+
+def _redact_param(value) -> Any:
+    if value is None or isinstance(value, (int, float, bool)):
+        return value
+    return "<redacted>"
+
+
+class ProfilingMiddleware:
+    """서명된 X-Profile 헤더 / ?__profile= 가 있는 요청만 cProfile로 실행"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        meta = request.META
+        if HEADER not in meta and QUERY_PARAM not in meta.get("QUERY_STRING", ""):
+            return self.get_response(request)
+
+        token = meta.get(HEADER) or request.GET.get(QUERY_PARAM, "")
+        issuer = check_token(token)
+        if issuer is None:
+            # 토큰이 틀리면 프로파일 없이 평소처럼 처리
+            return self.get_response(request)
+
+        limit = getattr(settings, "PROFILING_MAX_QUERIES", DEFAULT_MAX_QUERIES)
+        queries: list[dict | None] = []
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        with _record_queries(queries, limit):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        duration = time.perf_counter() - started
+
+        capture_id = store.save(
+            profiler,
+            {
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "duration": duration,
+                "issuer": issuer,
+                "created": time.time(),
+                "query_count": len(queries),
+                "queries": [query for query in queries if query is not None],
+            },
+        )
+        response["X-Profile-Id"] = capture_id
+        return response
+
+
+class CaptureStore:
+    """PROFILING_DIR의 <id>.prof(pstats) + <id>.json(요청/SQL) 링 버퍼
+
+    id는 생성 시각(ns)-pid라서 이름순이 곧 시간순이다.
+    """
+
+    def save(self, profiler: cProfile.Profile, meta: dict[str, Any]) -> str:
+        directory = profile_dir()
+        os.makedirs(directory, exist_ok=True)
+        capture_id = f"{time.time_ns()}-{os.getpid()}"
+        meta = {"id": capture_id, **meta}
+
+        # 목록 조회가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        profiler.dump_stats(tmp)
+        os.replace(tmp, os.path.join(directory, f"{capture_id}.prof"))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, os.path.join(directory, f"{capture_id}.json"))
+
+        self.prune()
+        return capture_id
+
+    def ids(self) -> list[str]:
+        directory = profile_dir()
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-5] for name in names if name.endswith(".json"))
+
+    def prune(self) -> None:
+        keep = getattr(settings, "PROFILING_MAX_CAPTURES", DEFAULT_MAX_CAPTURES)
+        ids = self.ids()
+        for capture_id in ids[: max(len(ids) - keep, 0)]:
+            for suffix in (".json", ".prof"):
+                try:
+                    os.remove(os.path.join(profile_dir(), capture_id + suffix))
+                except FileNotFoundError:
+                    pass  # 다른 워커가 먼저 지웠다
+
+    def load(self, capture_id: str) -> dict[str, Any]:
+        """요청 정보와 SQL 목록 (없으면 FileNotFoundError)"""
+        if os.sep in capture_id or capture_id.startswith("."):
+            raise FileNotFoundError(capture_id)
+        with open(os.path.join(profile_dir(), f"{capture_id}.json")) as f:
+            return json.load(f)
+
+    def render(self, capture_id: str, sort: str = "cumulative", limit: int = 30) -> str:
+        """pstats 상위 limit개 함수 표"""
+        out = io.StringIO()
+        stats = pstats.Stats(
+            os.path.join(profile_dir(), f"{capture_id}.prof"), stream=out
+        )
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+store = CaptureStore()
@@ -0,0 +1,133 @@
+"""
+테스트용 쿼리 예산 / 실행 계획 검사
+
+    with QueryBudget(3, "GET /api/mentors") as budget:
+        client.get("/api/mentors", ...)
+
+    @QueryBudget(2, "MentorService.get_mentors")
+    def test_...
+
+블록 안에서 실행된 쿼리 수가 예산을 넘거나, 주요 테이블(api_matchrequest,
+api_user)을 인덱스 없이 전체 스캔하는 쿼리가 있으면 AssertionError를 낸다.
+실행 계획은 블록이 끝난 뒤 같은 SQL/파라미터로 EXPLAIN QUERY PLAN을 실행해 얻는다.
+"""
+
+import re
+from collections.abc import Sequence
+from contextlib import ContextDecorator
+from typing import Any
+
+from django.db import connections
+
+# 전체 스캔되면 안 되는 테이블 (행 수가 사용자/요청 수에 비례)
+FULL_SCAN_TABLES = ("api_matchrequest", "api_user")
+
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+# FROM/JOIN 절의 "테이블" 별칭 (서브쿼리는 U0, U1 ... 으로 별칭이 붙는다)
+_ALIAS_RE = re.compile(r'"(\w+)"(?: AS)? "?([A-Z]\d+)"?(?=[\s,)]|$)')
+
+
+class QueryBudget(ContextDecorator):
+    """실행 쿼리 수 상한과 전체 스캔 여부를 검사하는 컨텍스트 매니저/데코레이터"""
+
+    def __init__(
+        self,
+        limit: int,
+        label: str = "",
+        using: str = "default",
+        forbid_scans: Sequence[str] | None = FULL_SCAN_TABLES,
+    ):
+        self.limit = limit
+        self.label = label
+        self.using = using
+        self.forbid_scans = tuple(forbid_scans or ())
+        self.queries: list[dict[str, Any]] = []
+
+    def _recreate_cm(self):
+        # 데코레이터로 쓸 때 호출마다 새로 센다
+        return type(self)(self.limit, self.label, self.using, self.forbid_scans)
+
+    def _record(self, execute, sql, params, many, context):
+        self.queries.append({"sql": sql, "params": params, "many": many})
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self.queries = []
+        self._wrapper = connections[self.using].execute_wrapper(self._record)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._wrapper.__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            return False
+        name = f"{self.label}: " if self.label else ""
+        if len(self.queries) > self.limit:
+            listing = "\n".join(
+                f"  {index}. {query['sql']}"
+                for index, query in enumerate(self.queries, 1)
+            )
+            raise AssertionError(
+                f"{name}쿼리 {len(self.queries)}개 실행 (예산 {self.limit}개)\n{listing}"
+            )
+        if self.forbid_scans:
+            scans = self.full_scans()
+            if scans:
+                listing = "\n".join(f"  SCAN {table}: {sql}" for table, sql, _ in scans)
+                raise AssertionError(f"{name}전체 테이블 스캔\n{listing}")
+        return False
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def plans(self) -> list[dict[str, Any]]:
+        """기록된 SELECT/UPDATE/DELETE 쿼리마다 EXPLAIN QUERY PLAN 결과"""
+        return [
+            {
+                "sql": query["sql"],
+                "plan": explain(query["sql"], query["params"], self.using),
+            }
+            for query in self.queries
+            if not query["many"]
+            and query["sql"].lstrip().upper().startswith(_EXPLAINABLE)
+        ]
+
+    def full_scans(self) -> list[tuple]:
+        """forbid_scans 테이블을 인덱스 없이 스캔하는 (테이블, SQL, 계획 행) 목록"""
+        found = []
+        for item in self.plans():
+            aliases = table_aliases(item["sql"])
+            for detail in item["plan"]:
+                table = scanned_table(detail, aliases)
+                if table in self.forbid_scans:
+                    found.append((table, item["sql"], detail))
+        return found
+
+
+def explain(sql: str, params=None, using: str = "default") -> list[str]:
+    """EXPLAIN QUERY PLAN의 detail 열 목록 (SQLite 전용)"""
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params or ())
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def table_aliases(sql: str) -> dict[str, str]:
+    """SQL의 별칭 -> 테이블 이름"""
+    return {alias: table for table, alias in _ALIAS_RE.findall(sql)}
+
+
+def scanned_table(detail: str, aliases: dict[str, str] | None = None) -> str:
+    """인덱스 없는 전체 스캔 계획 행이면 테이블 이름, 아니면 빈 문자열
+
+    "SCAN api_user"는 전체 스캔, "SCAN api_user USING INDEX ..."는
+    인덱스 순서대로 읽는 것이므로 대상이 아니다.
+    """
+    parts = detail.split()
+    if len(parts) < 2 or parts[0] != "SCAN" or "USING" in parts:
+        return ""
+    return (aliases or {}).get(parts[1], parts[1])
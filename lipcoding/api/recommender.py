@@ -0,0 +1,284 @@
+"""
+멘토 추천 벡터 인덱스
+
+멘토마다 스킬/소개글 단어를 해시한 희소 특징을 NumPy 행렬의 한 열로 유지하고,
+멘티의 프로필과 요청 이력으로 만든 질의 벡터와의 행렬-벡터 곱 한 번으로 점수를 계산한다.
+행렬은 특징 우선(특징 × 멘토)으로 저장해서 질의에 없는 특징 행은 곱셈에서 건너뛴다.
+"""
+
+import math
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+# numpy(pyproject 의존성)는 불러오는 데 오래 걸리므로 첫 추천 조회 때 불러온다
+# 설치되지 않은 환경에서는 추천 API만 503을 돌려준다
+np = None
+
+
+def _load_numpy() -> bool:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
+
+
+_TOKEN_RE = re.compile(r"\w{2,}")
+
+# 스킬은 소개글 단어보다 강한 신호
+SKILL_WEIGHT = 3.0
+TERM_WEIGHT = 1.0
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class MentorRecommender:
+    """프로세스 내 멘토 특징 행렬 (행 = 해시된 스킬/단어, 열 = 멘토)"""
+
+    def __init__(self, dimensions: int | None = None, ttl: float | None = None):
+        self._lock = threading.RLock()
+        self._dimensions = dimensions
+        self._ttl = ttl
+        self.reset()
+
+    @property
+    def available(self) -> bool:
+        return _load_numpy()
+
+    @property
+    def dimensions(self) -> int:
+        if self._dimensions is not None:
+            return self._dimensions
+        return getattr(settings, "RECOMMENDER_DIMENSIONS", 256)
+
+    def reset(self) -> None:
+        """인덱스 무효화 (다음 조회 시 DB에서 재구성)"""
+        with self._lock:
+            self._loaded_at: float | None = None
+            self._matrix = None
+            self._slot_ids = None  # 슬롯(열) 번호 -> 멘토 id (빈 슬롯은 0)
+            self._slots: dict[int, int] = {}  # 멘토 id -> 슬롯(열) 번호
+            self._size = 0
+            self._dirty: set[int] = set()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _expired(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        ttl = self._ttl
+        if ttl is None:
+            ttl = getattr(settings, "RECOMMENDER_TTL", 300)
+        return ttl is not None and time.monotonic() - self._loaded_at > ttl
+
+    def _bucket(self, feature: str) -> int:
+        # 프로세스마다 달라지는 hash() 대신 고정된 해시 사용
+        return zlib.crc32(feature.encode()) % self.dimensions
+
+    def vectorize(
+        self, skills: Iterable[str], texts: Iterable[str]
+    ) -> dict[int, float]:
+        """스킬과 텍스트를 L2 정규화된 희소 벡터({열: 값})로 변환"""
+        weights: dict[int, float] = {}
+        for name in skills:
+            column = self._bucket(f"skill:{name.lower()}")
+            weights[column] = weights.get(column, 0.0) + SKILL_WEIGHT
+        counts = Counter(token for text in texts for token in tokenize(text))
+        for token, count in counts.items():
+            column = self._bucket(f"term:{token}")
+            # 같은 단어 반복은 로그로 완화
+            weights[column] = weights.get(column, 0.0) + TERM_WEIGHT * (
+                1 + math.log(count)
+            )
+        norm = math.sqrt(sum(value * value for value in weights.values()))
+        if not norm:
+            return {}
+        return {column: value / norm for column, value in weights.items()}
+
+    def _load_features(
+        self, mentor_ids: list[int] | None = None
+    ) -> dict[int, tuple[list[str], str]]:
+        """멘토 id -> (스킬 목록, 소개글) 을 쿼리 두 번으로 조회"""
+        from .models import Profile
+
+        profiles = Profile.objects.filter(user__role="mentor")
+        pairs = Profile.skills.through.objects.filter(profile__user__role="mentor")
+        if mentor_ids is not None:
+            profiles = profiles.filter(user_id__in=mentor_ids)
+            pairs = pairs.filter(profile__user_id__in=mentor_ids)
+
+        features = {
+            user_id: ([], bio)
+            for user_id, bio in profiles.values_list("user_id", "bio").iterator(
+                chunk_size=10000
+            )
+        }
+        for user_id, name in pairs.values_list(
+            "profile__user_id", "skill__name"
+        ).iterator(chunk_size=10000):
+            if user_id in features:
+                features[user_id][0].append(name)
+        return features
+
+    def _write_slot(self, slot: int, vector: dict[int, float]) -> None:
+        """멘토 한 명의 특징 벡터를 행렬의 해당 열에 기록"""
+        self._matrix[:, slot] = 0.0
+        if vector:
+            columns = np.fromiter(vector.keys(), dtype=np.intp, count=len(vector))
+            values = np.fromiter(vector.values(), dtype=np.float32, count=len(vector))
+            self._matrix[columns, slot] = values
+
+    def _build(self) -> None:
+        features = self._load_features()
+        capacity = max(16, len(features))
+        self._matrix = np.zeros((self.dimensions, capacity), dtype=np.float32)
+        self._slot_ids = np.zeros(capacity, dtype=np.int64)
+        self._slots = {}
+        for slot, (mentor_id, (skills, bio)) in enumerate(sorted(features.items())):
+            self._write_slot(slot, self.vectorize(skills, [bio]))
+            self._slot_ids[slot] = mentor_id
+            self._slots[mentor_id] = slot
+        self._size = len(features)
+        self._dirty = set()
+        self._loaded_at = time.monotonic()
+
+    def _grow(self) -> None:
+        capacity = self._matrix.shape[1] * 2
+        matrix = np.zeros((self.dimensions, capacity), dtype=np.float32)
+        matrix[:, : self._size] = self._matrix[:, : self._size]
+        slot_ids = np.zeros(capacity, dtype=np.int64)
+        slot_ids[: self._size] = self._slot_ids[: self._size]
+        self._matrix, self._slot_ids = matrix, slot_ids
+
+    def _refresh_dirty(self) -> None:
+        """변경된 멘토 열만 다시 계산 (신규 멘토는 열 추가, 삭제된 멘토는 0 열)"""
+        if not self._dirty:
+            return
+        mentor_ids = sorted(self._dirty)
+        self._dirty = set()
+        features = self._load_features(mentor_ids)
+        for mentor_id in mentor_ids:
+            slot = self._slots.get(mentor_id)
+            if mentor_id not in features:
+                if slot is not None:
+                    self._matrix[:, slot] = 0.0
+                    self._slot_ids[slot] = 0
+                    del self._slots[mentor_id]
+                continue
+            if slot is None:
+                if self._size == self._matrix.shape[1]:
+                    self._grow()
+                slot = self._size
+                self._size += 1
+                self._slots[mentor_id] = slot
+                self._slot_ids[slot] = mentor_id
+            skills, bio = features[mentor_id]
+            self._write_slot(slot, self.vectorize(skills, [bio]))
+
+    def ensure_loaded(self) -> None:
+        with self._lock:
+            if self._expired():
+                self._build()
+            else:
+                self._refresh_dirty()
+
+    def mark_dirty(self, mentor_id: int) -> None:
+        """멘토 프로필 변경 표시 (다음 조회 때 해당 열만 다시 계산)"""
+        with self._lock:
+            if self._loaded_at is not None:
+                self._dirty.add(mentor_id)
+
+    def query_vector(self, vector: dict[int, float], history_ids: Iterable[int] = ()):
+        """희소 질의 벡터에 요청했던 멘토들의 평균 특징을 더해 밀집 벡터로 변환"""
+        query = np.zeros(self.dimensions, dtype=np.float32)
+        for column, value in vector.items():
+            query[column] = value
+        with self._lock:
+            slots = [self._slots[id_] for id_ in history_ids if id_ in self._slots]
+            if slots:
+                query += self._matrix[:, slots].mean(axis=1)
+        return query
+
+    def top_k(
+        self, query, k: int, exclude: Iterable[int] = ()
+    ) -> list[tuple[int, float]]:
+        """행렬-벡터 곱 한 번과 argpartition으로 상위 k명 (멘토 id, 점수) 반환"""
+        with self._lock:
+            size = self._size
+            if not size or k <= 0:
+                return []
+            # 질의에서 0이 아닌 특징 행만 곱한다 (희소 질의면 전체 곱보다 훨씬 적은 연산)
+            features = np.flatnonzero(query)
+            scores = query[features] @ self._matrix[features, :size]
+            slot_ids = self._slot_ids[:size].copy()
+            scores[slot_ids == 0] = -np.inf
+            for mentor_id in exclude:
+                slot = self._slots.get(mentor_id)
+                if slot is not None:
+                    scores[slot] = -np.inf
+
+        k = min(k, size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(slot_ids[slot]), float(scores[slot]))
+            for slot in top
+            if np.isfinite(scores[slot])
+        ]
+
+
+recommender = MentorRecommender()
+
+
+def _profile_saved(sender, instance, **kwargs):
+    if recommender.loaded and instance.user.role == "mentor":
+        transaction.on_commit(lambda: recommender.mark_dirty(instance.user_id))
+
+
+def _profile_skills_changed(sender, instance, action, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not recommender.loaded:
+        return
+    if reverse:
+        # Skill 쪽에서 변경된 경우 영향 범위가 넓으므로 전체 재구성
+        recommender.reset()
+        return
+    if instance.user.role == "mentor":
+        transaction.on_commit(lambda: recommender.mark_dirty(instance.user_id))
+
+
+def _profile_deleted(sender, instance, **kwargs):
+    if recommender.loaded:
+        transaction.on_commit(lambda: recommender.mark_dirty(instance.user_id))
+
+
+def connect_signals() -> None:
+    from .models import Profile
+
+    post_save.connect(
+        _profile_saved, sender=Profile, dispatch_uid="recommender_profile_save"
+    )
+    m2m_changed.connect(
+        _profile_skills_changed,
+        sender=Profile.skills.through,
+        dispatch_uid="recommender_profile_skills",
+    )
+    post_delete.connect(
+        _profile_deleted, sender=Profile, dispatch_uid="recommender_profile_delete"
+    )
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from ninja import Schema
 from typing import Optional, List
 
@@ -57,6 +59,10 @@ class ProfileResponseSchema(Schema):
     profile: dict  # Union type을 사용하여 조건부로 다른 스키마 적용
 
 
+class RecommendedMentorSchema(ProfileResponseSchema):
+    score: float
+
+
 class BaseProfileUpdateSchema(Schema):
     name: str
     bio: str
@@ -93,5 +99,91 @@ class MatchRequestResponseSchema(Schema):
     status: str
 
 
+class BulkMatchRequestActionSchema(Schema):
+    ids: List[int]
+    action: str  # accept, reject, cancel
+
+
+class BulkMatchRequestResultSchema(Schema):
+    id: int
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkMatchRequestResponseSchema(Schema):
+    results: List[BulkMatchRequestResultSchema]
+
+
+class CounterpartSchema(Schema):
+    id: int
+    name: str
+    imageVersion: int
+
+
+class MatchRequestListItemSchema(MatchRequestResponseSchema):
+    createdAt: datetime
+    updatedAt: datetime
+    counterpart: CounterpartSchema
+
+
+class MatchEventSchema(Schema):
+    seq: int
+    id: int
+    status: str
+    mentorId: int
+    menteeId: int
+    createdAt: datetime
+
+
+class MatchEventChangesSchema(Schema):
+    events: List[MatchEventSchema]
+    lastSeq: int
+    hasMore: bool
+
+
+class EventTicketSchema(Schema):
+    ticket: str
+    expiresIn: int
+
+
+class MatchStatsSchema(Schema):
+    pending: int
+    accepted: int
+    rejected: int
+    cancelled: int
+    acceptedTotal: int
+
+
+class MatchSolveSchema(Schema):
+    dryRun: bool = True
+    since: Optional[datetime] = None  # 이 시각 이후 생성된 요청만 배정
+
+
+class MatchSolvePairSchema(Schema):
+    id: int
+    mentorId: int
+    menteeId: int
+
+
+class MatchSolveResultSchema(Schema):
+    dryRun: bool
+    candidates: int
+    mentors: int
+    mentees: int
+    matched: int
+    rejected: int
+    pairs: List[MatchSolvePairSchema]
+
+
+class SkillFacetSchema(Schema):
+    name: str
+    count: int
+
+
+class SkillFacetsResponseSchema(Schema):
+    total: int
+    skills: List[SkillFacetSchema]
+
+
 class ErrorResponseSchema(Schema):
     error: str
@@ -1,14 +1,46 @@
 import logging
+import secrets
 import uuid
 import base64
+import binascii
+import hashlib
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
 import jwt
 from django.conf import settings
-from django.db import transaction
-
-from .models import Profile, User, Skill, MatchRequest
+from django.db import IntegrityError, connection, transaction
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .db import read_transaction, write_transaction
+from .events import publish_match_event
+from .matching import UNMATCHED, hopcroft_karp
+from .models import (
+    ArchivedMatchRequest,
+    DataVersion,
+    EventStreamTicket,
+    MatchEvent,
+    MatchStats,
+    Profile,
+    User,
+    Skill,
+    MatchRequest,
+)
+from .recommender import recommender
+from .skill_index import skill_index
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +101,298 @@ class AuthService:
         )
 
 
+class DataVersionService:
+    """데이터 버전 카운터 관련 서비스 (쓰기 시 증가, ETag 생성에 사용)"""
+
+    MENTORS = "mentors"
+    # 멘토 목록/스킬 구성 변경 (스킬 인덱스 재구성 기준, 항상 MENTORS와 함께 증가)
+    MENTOR_SKILLS = "mentor_skills"
+
+    @staticmethod
+    def incoming_key(user_id: int) -> str:
+        return f"incoming:{user_id}"
+
+    @staticmethod
+    def outgoing_key(user_id: int) -> str:
+        return f"outgoing:{user_id}"
+
+    @staticmethod
+    def bump(*keys: str) -> None:
+        """버전 증가 (호출하는 쪽 트랜잭션 안에서 실행)"""
+        keys = set(keys)
+        existing = set(
+            DataVersion.objects.filter(key__in=keys).values_list("key", flat=True)
+        )
+        missing = keys - existing
+        if missing:
+            # 0으로 만든 뒤 함께 증가 (동시에 다른 요청이 먼저 생성해도 충돌 무시)
+            DataVersion.objects.bulk_create(
+                [DataVersion(key=key, version=0) for key in missing],
+                ignore_conflicts=True,
+            )
+        DataVersion.objects.filter(key__in=keys).update(version=F("version") + 1)
+        if DataVersionService.MENTOR_SKILLS in keys and skill_index.loaded:
+            # 이 트랜잭션의 스킬 변경은 시그널이 커밋 후 인덱스에 증분 반영한다.
+            # 그 뒤에 (먼저 등록된 콜백부터 실행) 인덱스 버전도 따라 올린다
+            version = DataVersionService.get_version(DataVersionService.MENTOR_SKILLS)
+            transaction.on_commit(lambda: skill_index.advance(version - 1, version))
+
+    @staticmethod
+    def bump_match_requests(mentor_id: int, mentee_id: int) -> None:
+        """매칭 요청 변경 시 양쪽 목록 버전 증가"""
+        DataVersionService.bump(
+            DataVersionService.incoming_key(mentor_id),
+            DataVersionService.outgoing_key(mentee_id),
+        )
+
+    @staticmethod
+    def counterpart_list_keys(user: User) -> List[str]:
+        """user의 이름/이미지를 상대방 정보로 포함하는 요청 목록의 버전 키
+
+        멘토가 바뀌면 요청을 보낸 멘티들의 outgoing, 멘티가 바뀌면 요청을 받은
+        멘토들의 incoming 목록이 달라진다.
+        """
+        if user.role == "mentor":
+            queryset = MatchRequest.objects.filter(mentor=user)
+            field, key = "mentee_id", DataVersionService.outgoing_key
+        else:
+            queryset = MatchRequest.objects.filter(mentee=user)
+            field, key = "mentor_id", DataVersionService.incoming_key
+        ids = queryset.order_by().values_list(field, flat=True).distinct()
+        return [key(user_id) for user_id in ids]
+
+    @staticmethod
+    def get_version(key: str) -> int:
+        version = (
+            DataVersion.objects.filter(key=key)
+            .values_list("version", flat=True)
+            .first()
+        )
+        return version or 0
+
+    @staticmethod
+    def etag(key: str, variant: str = "") -> str:
+        """버전과 조회 조건으로 약한 ETag 생성"""
+        version = DataVersionService.get_version(key)
+        digest = hashlib.blake2b(f"{key}|{variant}".encode(), digest_size=8).hexdigest()
+        return f'W/"{version}-{digest}"'
+
+
+class EventTicketService:
+    """이벤트 스트림 연결용 1회용 티켓 (쿼리 문자열에 JWT를 싣지 않도록)"""
+
+    TTL = timedelta(seconds=60)
+
+    @staticmethod
+    def issue(user: User) -> Dict[str, Any]:
+        """티켓 발급 (만료된 티켓은 이때 함께 정리)"""
+        now = timezone.now()
+        EventStreamTicket.objects.filter(expires_at__lte=now).delete()
+        ticket = EventStreamTicket.objects.create(
+            key=secrets.token_urlsafe(32),
+            user=user,
+            expires_at=now + EventTicketService.TTL,
+        )
+        return {
+            "ticket": ticket.key,
+            "expiresIn": int(EventTicketService.TTL.total_seconds()),
+        }
+
+    @staticmethod
+    def redeem(key: str) -> Optional[User]:
+        """유효한 티켓이면 삭제하고 사용자 반환 (두 번째 사용부터는 None)"""
+        ticket = (
+            EventStreamTicket.objects.select_related("user")
+            .filter(key=key, expires_at__gt=timezone.now())
+            .first()
+        )
+        if ticket is None:
+            return None
+        # 동시에 같은 티켓을 쓰면 한쪽만 삭제에 성공한다
+        deleted, _ = EventStreamTicket.objects.filter(key=key).delete()
+        return ticket.user if deleted else None
+
+
+class MatchEventService:
+    """매칭 요청 상태 변경 로그 (증분 동기화용)"""
+
+    MAX_PAGE_SIZE = 500
+
+    @staticmethod
+    def record(transitions: List[tuple]) -> None:
+        """
+        상태 전이를 호출한 쪽과 같은 트랜잭션에서 로그에 추가하고
+        커밋 이후 실시간 이벤트로 발행
+
+        transitions: (요청 id, 상태, 멘토 id, 멘티 id) 목록
+        """
+        if not transitions:
+            return
+        events = MatchEvent.objects.bulk_create(
+            [
+                MatchEvent(
+                    match_request_id=request_id,
+                    status=status,
+                    mentor_id=mentor_id,
+                    mentee_id=mentee_id,
+                )
+                for request_id, status, mentor_id, mentee_id in transitions
+            ]
+        )
+        for event in events:
+            publish_match_event(
+                event.seq,
+                event.match_request_id,
+                event.status,
+                event.mentor_id,
+                event.mentee_id,
+            )
+
+    @staticmethod
+    def get_changes(
+        user: User, after: Optional[int], limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """after 이후 사용자와 관련된 변경분 반환 (after가 없으면 현재 위치만)"""
+        if after is None:
+            last_seq = MatchEvent.objects.aggregate(last=Max("seq"))["last"] or 0
+            return {"events": [], "lastSeq": last_seq, "hasMore": False}
+        if after < 0:
+            raise ValueError("after는 0 이상이어야 합니다.")
+        if limit is None:
+            limit = MatchEventService.MAX_PAGE_SIZE
+        if not 1 <= limit <= MatchEventService.MAX_PAGE_SIZE:
+            raise ValueError(
+                f"limit은 1~{MatchEventService.MAX_PAGE_SIZE} 사이여야 합니다."
+            )
+
+        rows = list(
+            MatchEvent.objects.filter(Q(mentor=user) | Q(mentee=user), seq__gt=after)
+            .order_by("seq")
+            .values(
+                "seq",
+                "match_request_id",
+                "status",
+                "mentor_id",
+                "mentee_id",
+                "created_at",
+            )[: limit + 1]
+        )
+        has_more = len(rows) > limit
+        events = [
+            {
+                "seq": row["seq"],
+                "id": row["match_request_id"],
+                "status": row["status"],
+                "mentorId": row["mentor_id"],
+                "menteeId": row["mentee_id"],
+                "createdAt": row["created_at"],
+            }
+            for row in rows[:limit]
+        ]
+        return {
+            "events": events,
+            "lastSeq": events[-1]["seq"] if events else after,
+            "hasMore": has_more,
+        }
+
+
+class MatchStatsService:
+    """사용자별 매칭 요청 상태 개수 (COUNT 없이 대시보드/인기순 정렬에 사용)"""
+
+    STATUS_FIELDS = ["pending", "accepted", "rejected", "cancelled"]
+
+    @staticmethod
+    def apply(transitions: List[tuple]) -> None:
+        """
+        상태 전이를 멘토/멘티 통계에 반영 (호출한 쪽 트랜잭션 안에서)
+
+        transitions: (요청 id, 이전 상태 또는 None, 새 상태, 멘토 id, 멘티 id) 목록
+        """
+        deltas: Dict[int, Dict[str, int]] = {}
+        for _, previous, status, mentor_id, mentee_id in transitions:
+            if previous == status:
+                continue
+            for user_id in (mentor_id, mentee_id):
+                delta = deltas.setdefault(user_id, {})
+                if previous:
+                    delta[previous] = delta.get(previous, 0) - 1
+                delta[status] = delta.get(status, 0) + 1
+                if status == "accepted":
+                    delta["accepted_total"] = delta.get("accepted_total", 0) + 1
+        if not deltas:
+            return
+
+        MatchStats.objects.bulk_create(
+            [MatchStats(user_id=user_id) for user_id in deltas], ignore_conflicts=True
+        )
+        # 변화량이 같은 사용자끼리 묶어 UPDATE 한 번 (예: 수락 시 자동 거절된 멘티들)
+        groups: Dict[tuple, List[int]] = {}
+        for user_id, delta in deltas.items():
+            key = tuple(sorted((name, d) for name, d in delta.items() if d))
+            if key:
+                groups.setdefault(key, []).append(user_id)
+        for key, user_ids in groups.items():
+            # 음수가 될 행은 건너뛰고, 그런 행이 있으면 원본 요청으로 다시 센다
+            guard = {f"{name}__gte": -d for name, d in key if d < 0}
+            updated = MatchStats.objects.filter(user_id__in=user_ids, **guard).update(
+                **{name: F(name) + d for name, d in key}
+            )
+            if updated != len(user_ids):
+                logger.error(
+                    f"MatchStats counter would go negative for users {user_ids} "
+                    f"(delta {dict(key)}); recomputing"
+                )
+                MatchStatsService.recompute(user_ids)
+
+    @staticmethod
+    def recompute(user_ids: List[int]) -> None:
+        """
+        보관 포함 요청 행을 다시 세어 상태별 카운터를 고친다 (어긋난 통계 복구)
+
+        accepted_total은 지나간 수락을 셀 수 없으므로 현재 수락 수보다 작을 때만 올린다.
+        """
+        counts = {
+            user_id: dict.fromkeys(MatchStatsService.STATUS_FIELDS, 0)
+            for user_id in user_ids
+        }
+        for model in (MatchRequest, ArchivedMatchRequest):
+            for field in ("mentor_id", "mentee_id"):
+                rows = (
+                    model.objects.filter(**{f"{field}__in": user_ids})
+                    .values_list(field, "status")
+                    .annotate(count=Count("id"))
+                    .order_by()
+                )
+                for user_id, status, count in rows:
+                    counts[user_id][status] += count
+        MatchStats.objects.bulk_create(
+            [MatchStats(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+        )
+        for user_id, stats in counts.items():
+            MatchStats.objects.filter(user_id=user_id).update(
+                **stats,
+                accepted_total=Greatest(F("accepted_total"), Value(stats["accepted"])),
+            )
+
+    @staticmethod
+    def get_stats(user: User) -> Dict[str, int]:
+        stats = (
+            MatchStats.objects.filter(user=user)
+            .values(*MatchStatsService.STATUS_FIELDS, "accepted_total")
+            .first()
+        )
+        if stats is None:
+            stats = dict.fromkeys(MatchStatsService.STATUS_FIELDS, 0)
+            stats["accepted_total"] = 0
+        return {
+            "pending": stats["pending"],
+            "accepted": stats["accepted"],
+            "rejected": stats["rejected"],
+            "cancelled": stats["cancelled"],
+            "acceptedTotal": stats["accepted_total"],
+        }
+
+
 class ProfileService:
     """프로필 관련 서비스"""
 
@@ -76,6 +400,12 @@ class ProfileService:
     def get_or_create_profile(user: User) -> Profile:
         """프로필 조회 또는 생성"""
         profile, created = Profile.objects.get_or_create(user=user)
+        # 시그널 핸들러가 profile.user.role을 볼 때 다시 조회하지 않도록
+        profile.user = user
+        if created and user.role == "mentor":
+            DataVersionService.bump(
+                DataVersionService.MENTORS, DataVersionService.MENTOR_SKILLS
+            )
         return profile
 
     @staticmethod
@@ -104,7 +434,7 @@ class ProfileService:
         return response_data
 
     @staticmethod
-    @transaction.atomic
+    @write_transaction()
     def update_profile(user: User, data: Dict[str, Any]) -> Dict[str, Any]:
         """프로필 업데이트"""
         # 필수 필드 검증
@@ -115,6 +445,7 @@ class ProfileService:
         profile = ProfileService.get_or_create_profile(user)
 
         # 기본 프로필 정보 업데이트
+        counterpart_changed = user.name != data["name"]
         user.name = data["name"]
         user.save()
 
@@ -132,6 +463,8 @@ class ProfileService:
 
                 # 이미지 URL을 DB 이미지 조회 경로로 업데이트
                 profile.image_url = f"/images/{user.role}/{user.id}"
+                profile.image_version += 1
+                counterpart_changed = True
 
             except Exception as e:
                 # 이미지 처리 실패 시 기본 이미지 URL 유지
@@ -146,13 +479,23 @@ class ProfileService:
             # 기존 스킬 제거
             profile.skills.clear()
 
-            # 새로운 스킬 추가
-            for skill_name in data["skills"]:
-                skill, created = Skill.objects.get_or_create(name=skill_name)
-                profile.skills.add(skill)
+            # 새로운 스킬 추가 (스킬 수와 상관없이 일정한 쿼리 수로)
+            names = list(dict.fromkeys(data["skills"]))
+            Skill.objects.bulk_create(
+                [Skill(name=name) for name in names], ignore_conflicts=True
+            )
+            profile.skills.add(*Skill.objects.filter(name__in=names))
 
         profile.save()
 
+        keys = []
+        if user.role == "mentor":
+            keys += [DataVersionService.MENTORS, DataVersionService.MENTOR_SKILLS]
+        if counterpart_changed:
+            keys += DataVersionService.counterpart_list_keys(user)
+        if keys:
+            DataVersionService.bump(*keys)
+
         return ProfileService.get_user_profile_data(user)
 
     @staticmethod
@@ -182,11 +525,21 @@ class ProfileService:
 class MentorService:
     """멘토 관련 서비스"""
 
+    @staticmethod
+    def set_availability(mentor_id: int, available: bool) -> None:
+        """멘토 수락 가능 여부 갱신 (호출하는 쪽 트랜잭션 안에서 실행)"""
+        Profile.objects.filter(user_id=mentor_id).update(is_available=available)
+        DataVersionService.bump(DataVersionService.MENTORS)
+
     @staticmethod
     def get_mentors(
-        skill: Optional[str] = None, order_by: Optional[str] = None
+        skill: Optional[str] = None,
+        order_by: Optional[str] = None,
+        available: Optional[bool] = None,
+        skills: Optional[List[str]] = None,
+        match: str = "all",
     ) -> List[Dict[str, Any]]:
-        """멘토 리스트 조회"""
+        """멘토 리스트 조회 (skills: 비트맵 인덱스 기반 다중 스킬 AND/OR 검색)"""
         # 멘토 사용자들 조회
         mentors = (
             User.objects.filter(role="mentor")
@@ -198,140 +551,446 @@ class MentorService:
         if skill:
             mentors = mentors.filter(profile__skills__name__icontains=skill)
 
+        # 수락 가능 여부 필터링 (비정규화된 플래그 사용)
+        if available is not None:
+            mentors = mentors.filter(profile__is_available=available)
+
+        # 다중 스킬 필터링 (비트맵 인덱스)
+        allowed_ids = None
+        if skills:
+            allowed_ids = skill_index.mentor_ids(skills, match)
+            if not allowed_ids:
+                return []
+            max_params = connection.features.max_query_params
+            if max_params is None or len(allowed_ids) <= max_params:
+                mentors = mentors.filter(id__in=allowed_ids)
+                allowed_ids = None
+            else:
+                # IN 절 파라미터 한도를 넘으면 조회 후 메모리에서 거른다
+                allowed_ids = set(allowed_ids)
+
         # 정렬
         if order_by == "name":
             mentors = mentors.order_by("name")
         elif order_by == "skill":
             mentors = mentors.order_by("profile__skills__name")
+        elif order_by == "popularity":
+            # 누적 수락 수 인덱스 사용, 통계가 없는 멘토는 뒤로
+            mentors = mentors.order_by(
+                F("match_stats__accepted_total").desc(nulls_last=True), "id"
+            )
         else:
             mentors = mentors.order_by("id")
 
         # 응답 데이터 구성
         mentor_list = []
         for mentor in mentors:
+            if allowed_ids is not None and mentor.id not in allowed_ids:
+                continue
             if hasattr(mentor, "profile"):
-                skills = [skill.name for skill in mentor.profile.skills.all()]
-                image_url = (
-                    f"/images/mentor/{mentor.id}" if mentor.profile.image_url else None
-                )
-
-                mentor_data = {
-                    "id": mentor.id,
-                    "email": mentor.email,
-                    "role": mentor.role,
-                    "profile": {
-                        "name": mentor.name,
-                        "bio": mentor.profile.bio,
-                        "imageUrl": image_url,
-                        "skills": skills,
-                    },
-                }
-                mentor_list.append(mentor_data)
+                mentor_list.append(MentorService._mentor_data(mentor))
 
         return mentor_list
 
+    @staticmethod
+    def _mentor_data(mentor: User) -> Dict[str, Any]:
+        skills = [skill.name for skill in mentor.profile.skills.all()]
+        image_url = f"/images/mentor/{mentor.id}" if mentor.profile.image_url else None
+        return {
+            "id": mentor.id,
+            "email": mentor.email,
+            "role": mentor.role,
+            "profile": {
+                "name": mentor.name,
+                "bio": mentor.profile.bio,
+                "imageUrl": image_url,
+                "skills": skills,
+            },
+        }
+
+    @staticmethod
+    def recommend_mentors(mentee: User, limit: int = 10) -> List[Dict[str, Any]]:
+        """멘티 프로필과 요청 이력으로 멘토 추천 (벡터 인덱스 점수순)"""
+        if not recommender.available:
+            raise RuntimeError("numpy가 설치되어 있지 않아 추천을 사용할 수 없습니다.")
+        if not 1 <= limit <= 50:
+            raise ValueError("limit은 1~50 사이여야 합니다.")
+
+        recommender.ensure_loaded()
+
+        profile = Profile.objects.filter(user=mentee).first()
+        skills = list(profile.skills.values_list("name", flat=True)) if profile else []
+        texts = [profile.bio] if profile else []
+
+        # 요청 이력: 보낸 메시지 내용과 요청했던 멘토의 특징을 질의에 반영
+        history = list(
+            MatchRequest.objects.filter(mentee=mentee).values_list(
+                "mentor_id", "message", "status"
+            )
+        )
+        archived = list(
+            ArchivedMatchRequest.objects.filter(mentee=mentee).values_list(
+                "mentor_id", "message"
+            )
+        )
+        texts += [message for _, message, _ in history]
+        texts += [message for _, message in archived]
+        history_ids = [mentor_id for mentor_id, _, _ in history] + [
+            mentor_id for mentor_id, _ in archived
+        ]
+        # 이미 대기/수락 중인 멘토는 다시 요청할 수 없으므로 제외
+        exclude = [
+            mentor_id
+            for mentor_id, _, status in history
+            if status in ("pending", "accepted")
+        ]
+
+        query = recommender.query_vector(
+            recommender.vectorize(skills, texts), history_ids
+        )
+        # 수락 불가 멘토를 거르고도 limit명이 남도록 넉넉히 뽑는다
+        candidates = recommender.top_k(query, limit * 4, exclude=exclude)
+        scores = dict(candidates)
+        mentors = (
+            User.objects.filter(
+                id__in=list(scores), role="mentor", profile__is_available=True
+            )
+            .select_related("profile")
+            .prefetch_related("profile__skills")
+        )
+        ranked = sorted(mentors, key=lambda mentor: (-scores[mentor.id], mentor.id))
+        return [
+            {**MentorService._mentor_data(mentor), "score": scores[mentor.id]}
+            for mentor in ranked[:limit]
+        ]
+
+    @staticmethod
+    def get_skill_facets(
+        skills: Optional[List[str]] = None, match: str = "all"
+    ) -> Dict[str, Any]:
+        """스킬별 멘토 수 (facet) 조회 - 선택된 스킬 조건 안에서 계산"""
+        total, counts = skill_index.facets(skills or [], match)
+        return {"total": total, "skills": counts}
+
 
 class MatchRequestService:
     """매칭 요청 관련 서비스"""
 
+    # 이 상태의 요청은 취소할 수 없음
+    NON_CANCELLABLE_STATUSES = ["cancelled", "rejected"]
+    # 같은 멘토에게 다시 요청하면 이 상태의 요청을 재사용
+    REOPENABLE_STATUSES = ["cancelled", "rejected"]
+    MAX_BULK_SIZE = 100
+    MAX_PAGE_SIZE = 100
+
+    @staticmethod
+    def _upsert_pending_request(
+        mentor_id: int, mentee_id: int, message: str
+    ) -> Optional[int]:
+        """
+        INSERT ... ON CONFLICT 한 번으로 요청 생성
+
+        취소/거절된 기존 요청은 같은 행을 대기 상태로 다시 연다.
+        대기/수락 상태의 기존 요청과 충돌하면 None을 반환한다.
+        """
+        meta = MatchRequest._meta
+        quote = connection.ops.quote_name
+        now = meta.get_field("created_at").get_db_prep_value(timezone.now(), connection)
+        table = quote(meta.db_table)
+        mentor_col = quote(meta.get_field("mentor").column)
+        mentee_col = quote(meta.get_field("mentee").column)
+        reopenable = ", ".join(
+            f"'{status}'" for status in MatchRequestService.REOPENABLE_STATUSES
+        )
+        sql = (
+            f"INSERT INTO {table} ({mentor_col}, {mentee_col}, message, status, "
+            f"created_at, updated_at) VALUES (%s, %s, %s, 'pending', %s, %s) "
+            f"ON CONFLICT ({mentor_col}, {mentee_col}) DO UPDATE SET "
+            f"message = excluded.message, status = excluded.status, "
+            f"created_at = excluded.created_at, updated_at = excluded.updated_at "
+            f"WHERE {table}.status IN ({reopenable})"
+        )
+        params = [mentor_id, mentee_id, message, now, now]
+
+        with connection.cursor() as cursor:
+            if connection.features.can_return_columns_from_insert:
+                cursor.execute(sql + " RETURNING id", params)
+                row = cursor.fetchone()
+                return row[0] if row else None
+
+            cursor.execute(sql, params)
+            if not cursor.rowcount:
+                return None
+        return (
+            MatchRequest.objects.filter(mentor_id=mentor_id, mentee_id=mentee_id)
+            .values_list("id", flat=True)
+            .first()
+        )
+
     @staticmethod
+    def _record_transitions(transitions: List[tuple]) -> None:
+        """
+        상태 전이를 변경 로그와 사용자별 통계에 반영 (호출한 쪽 트랜잭션 안에서)
+
+        transitions: (요청 id, 이전 상태 또는 None, 새 상태, 멘토 id, 멘티 id) 목록
+        """
+        MatchStatsService.apply(transitions)
+        MatchEventService.record(
+            [
+                (request_id, status, mentor_id, mentee_id)
+                for request_id, _, status, mentor_id, mentee_id in transitions
+            ]
+        )
+
+    @staticmethod
+    @write_transaction()
     def create_match_request(
         mentee: User, mentor_id: int, message: str
     ) -> Dict[str, Any]:
-        """매칭 요청 생성"""
-        # 멘토 존재 확인
-        try:
-            mentor = User.objects.get(id=mentor_id, role="mentor")
-        except User.DoesNotExist:
-            raise ValueError("Mentor not found")
-
+        """매칭 요청 생성 - 멘토 존재 확인 + 충돌 처리 INSERT"""
         # 메시지 길이 제한 (DB/요구사항)
         if len(message) > 500:
             raise ValueError("메시지는 500자 이내여야 합니다.")
 
-        # 중복 요청 방지 (unique_together 및 활성 요청 체크)
-        existing_request = MatchRequest.objects.filter(
-            mentor=mentor, 
-            mentee=mentee, 
-            status__in=["pending", "accepted"]
-        ).first()
-        if existing_request:
-            if existing_request.status == "pending":
-                raise ValueError("이미 해당 멘토에게 요청을 보냈습니다.")
-            elif existing_request.status == "accepted":
+        # 멘토 존재 확인과 기존 요청 상태 조회를 한 번의 쿼리로
+        existing = list(
+            User.objects.filter(id=mentor_id, role="mentor")
+            .annotate(
+                request_status=Subquery(
+                    MatchRequest.objects.filter(
+                        mentor=OuterRef("pk"), mentee=mentee
+                    ).values("status")[:1]
+                )
+            )
+            .values_list("request_status", flat=True)
+        )
+        if not existing:
+            raise ValueError("Mentor not found")
+        previous_status = existing[0]
+        if previous_status == "accepted":
+            raise ValueError("이미 해당 멘토와 매칭이 완료되었습니다.")
+        if previous_status == "pending":
+            raise ValueError("이미 해당 멘토에게 요청을 보냈습니다.")
+
+        # 멘티당 대기 요청 하나 규칙은 부분 유니크 인덱스가 보장한다
+        try:
+            with transaction.atomic():
+                request_id = MatchRequestService._upsert_pending_request(
+                    mentor_id, mentee.id, message
+                )
+        except IntegrityError:
+            raise ValueError("이미 대기 중인 매칭 요청이 있습니다.")
+
+        # 조회 이후 다른 요청이 먼저 대기/수락 상태로 바꾼 경우
+        if request_id is None:
+            existing_status = (
+                MatchRequest.objects.filter(mentor_id=mentor_id, mentee=mentee)
+                .values_list("status", flat=True)
+                .first()
+            )
+            if existing_status == "accepted":
                 raise ValueError("이미 해당 멘토와 매칭이 완료되었습니다.")
+            raise ValueError("이미 해당 멘토에게 요청을 보냈습니다.")
 
-        match_request = MatchRequest.objects.create(
-            mentor=mentor,
-            mentee=mentee,
-            message=message,
-            status="pending",
+        DataVersionService.bump_match_requests(mentor_id, mentee.id)
+        MatchRequestService._record_transitions(
+            [(request_id, previous_status, "pending", mentor_id, mentee.id)]
         )
 
         return {
-            "id": match_request.id,
-            "mentorId": match_request.mentor.id,
-            "menteeId": match_request.mentee.id,
-            "message": match_request.message,
-            "status": match_request.status,
+            "id": request_id,
+            "mentorId": mentor_id,
+            "menteeId": mentee.id,
+            "message": message,
+            "status": "pending",
         }
 
     @staticmethod
-    def get_incoming_match_requests(mentor: User) -> List[Dict[str, Any]]:
-        """들어온 매칭 요청 목록 조회"""
-        match_requests = MatchRequest.objects.filter(mentor=mentor)
+    def _page_size(limit: Optional[int]) -> Optional[int]:
+        if limit is None:
+            return None
+        return max(1, min(limit, MatchRequestService.MAX_PAGE_SIZE))
 
-        request_list = []
-        for req in match_requests:
-            request_data = {
-                "id": req.id,
-                "mentorId": req.mentor.id,
-                "menteeId": req.mentee.id,
-                "message": req.message,
-                "status": req.status,
-            }
-            request_list.append(request_data)
+    @staticmethod
+    def encode_cursor(item: Dict[str, Any]) -> str:
+        """목록 항목의 (createdAt, id)를 다음 페이지 커서로 인코딩"""
+        raw = f"{item['createdAt'].isoformat()}|{item['id']}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
 
-        return request_list
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_at, request_id = raw.split("|")
+            return datetime.fromisoformat(created_at), int(request_id)
+        except (ValueError, UnicodeDecodeError, binascii.Error):
+            raise ValueError("Invalid cursor")
 
     @staticmethod
-    def get_outgoing_match_requests(mentee: User) -> List[Dict[str, Any]]:
-        """보낸 매칭 요청 목록 조회"""
-        match_requests = MatchRequest.objects.filter(mentee=mentee)
+    def next_cursor(items: List[Dict[str, Any]], limit: Optional[int]) -> Optional[str]:
+        """페이지가 가득 찼으면 다음 페이지 커서 반환"""
+        page_size = MatchRequestService._page_size(limit)
+        if page_size is None or len(items) < page_size:
+            return None
+        return MatchRequestService.encode_cursor(items[-1])
 
-        request_list = []
-        for req in match_requests:
-            request_data = {
-                "id": req.id,
-                "mentorId": req.mentor.id,
-                "menteeId": req.mentee.id,
-                "message": req.message,
-                "status": req.status,
+    @staticmethod
+    def _list_match_requests(
+        queryset,
+        counterpart: str,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """FK id 프로젝션과 상대방 정보 JOIN으로 목록을 한 번의 쿼리로 구성"""
+        # 상태 필터 (콤마로 여러 개 지정 가능)
+        if status:
+            statuses = [name.strip() for name in status.split(",") if name.strip()]
+            valid_statuses = {choice for choice, _ in MatchRequest.STATUS_CHOICES}
+            if not set(statuses) <= valid_statuses:
+                raise ValueError("Invalid status")
+            queryset = queryset.filter(status__in=statuses)
+
+        # 마지막 동기화 이후 변경된 요청만
+        if since:
+            queryset = queryset.filter(updated_at__gt=since)
+
+        # (created_at, id) 키셋 페이지네이션
+        if cursor:
+            created_at, request_id = MatchRequestService._decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at)
+                | Q(created_at=created_at, id__lt=request_id)
+            )
+
+        queryset = queryset.order_by("-created_at", "-id")
+        page_size = MatchRequestService._page_size(limit)
+        if page_size is not None:
+            queryset = queryset[:page_size]
+
+        rows = queryset.values(
+            "id",
+            "mentor_id",
+            "mentee_id",
+            "message",
+            "status",
+            "created_at",
+            "updated_at",
+            f"{counterpart}__name",
+            f"{counterpart}__profile__image_version",
+        )
+        return [
+            {
+                "id": row["id"],
+                "mentorId": row["mentor_id"],
+                "menteeId": row["mentee_id"],
+                "message": row["message"],
+                "status": row["status"],
+                "createdAt": row["created_at"],
+                "updatedAt": row["updated_at"],
+                "counterpart": {
+                    "id": row[f"{counterpart}_id"],
+                    "name": row[f"{counterpart}__name"],
+                    "imageVersion": row[f"{counterpart}__profile__image_version"] or 0,
+                },
             }
-            request_list.append(request_data)
+            for row in rows
+        ]
 
-        return request_list
+    @staticmethod
+    def get_incoming_match_requests(mentor: User, **filters) -> List[Dict[str, Any]]:
+        """들어온 매칭 요청 목록 조회 (filters: status, limit, cursor, since)"""
+        return MatchRequestService._list_match_requests(
+            MatchRequest.objects.filter(mentor=mentor), "mentee", **filters
+        )
+
+    @staticmethod
+    def get_outgoing_match_requests(mentee: User, **filters) -> List[Dict[str, Any]]:
+        """보낸 매칭 요청 목록 조회 (filters: status, limit, cursor, since)"""
+        return MatchRequestService._list_match_requests(
+            MatchRequest.objects.filter(mentee=mentee), "mentor", **filters
+        )
 
     @staticmethod
+    @write_transaction()
     def accept_match_request(mentor: User, request_id: int) -> Dict[str, Any]:
-        """매칭 요청 수락"""
-        try:
-            match_request = MatchRequest.objects.get(id=request_id, mentor=mentor)
-        except MatchRequest.DoesNotExist:
+        """매칭 요청 수락 - 수락과 나머지 대기 요청 일괄 거절을 조건부 UPDATE 한 번으로 처리"""
+        target = (
+            MatchRequest.objects.filter(id=request_id, mentor=mentor)
+            .values("mentee_id", "message", "status")
+            .first()
+        )
+        if target is None:
             raise ValueError("Match request not found")
+        if target["status"] != "pending":
+            raise ValueError("대기 중인 요청만 수락할 수 있습니다.")
+
+        # 함께 거절될 대기 요청을 같은 트랜잭션에서 먼저 고정한다 (이벤트/버전 대상)
+        pending = dict(
+            MatchRequest.objects.select_for_update()
+            .filter(mentor=mentor, status="pending")
+            .values_list("id", "mentee_id")
+        )
+        if request_id not in pending:
+            raise ValueError("대기 중인 요청만 수락할 수 있습니다.")
 
-        match_request.status = "accepted"
-        match_request.save()
+        # 대상 요청이 아직 대기 중일 때만 대상은 accepted,
+        # 고정한 나머지 대기 요청은 rejected로 바꾼다.
+        # 멘토당 수락 하나 규칙은 부분 유니크 인덱스가 보장한다.
+        try:
+            with transaction.atomic():
+                updated = (
+                    MatchRequest.objects.filter(id__in=pending, status="pending")
+                    .filter(
+                        Exists(
+                            MatchRequest.objects.filter(
+                                id=request_id, mentor=mentor, status="pending"
+                            )
+                        )
+                    )
+                    .update(
+                        status=Case(
+                            When(id=request_id, then=Value("accepted")),
+                            default=Value("rejected"),
+                        ),
+                        updated_at=timezone.now(),
+                    )
+                )
+        except IntegrityError:
+            raise ValueError("이미 수락한 멘티가 있어 요청을 수락할 수 없습니다.")
+        if not updated:
+            raise ValueError("대기 중인 요청만 수락할 수 있습니다.")
+
+        rejected = [
+            (pending_id, mentee_id)
+            for pending_id, mentee_id in pending.items()
+            if pending_id != request_id
+        ]
+        DataVersionService.bump(
+            DataVersionService.incoming_key(mentor.id),
+            DataVersionService.outgoing_key(target["mentee_id"]),
+            *[DataVersionService.outgoing_key(mentee_id) for _, mentee_id in rejected],
+        )
+        MentorService.set_availability(mentor.id, False)
+        MatchRequestService._record_transitions(
+            [(request_id, "pending", "accepted", mentor.id, target["mentee_id"])]
+            + [
+                (rejected_id, "pending", "rejected", mentor.id, mentee_id)
+                for rejected_id, mentee_id in rejected
+            ]
+        )
 
         return {
-            "id": match_request.id,
-            "mentorId": match_request.mentor.id,
-            "menteeId": match_request.mentee.id,
-            "message": match_request.message,
-            "status": match_request.status,
+            "id": request_id,
+            "mentorId": mentor.id,
+            "menteeId": target["mentee_id"],
+            "message": target["message"],
+            "status": "accepted",
         }
 
     @staticmethod
+    @write_transaction()
     def reject_match_request(mentor: User, request_id: int) -> Dict[str, Any]:
         """매칭 요청 거절"""
         try:
@@ -339,18 +998,36 @@ class MatchRequestService:
         except MatchRequest.DoesNotExist:
             raise ValueError("Match request not found")
 
+        previous_status = match_request.status
         match_request.status = "rejected"
         match_request.save()
+        DataVersionService.bump_match_requests(
+            match_request.mentor_id, match_request.mentee_id
+        )
+        if previous_status == "accepted":
+            MentorService.set_availability(mentor.id, True)
+        MatchRequestService._record_transitions(
+            [
+                (
+                    match_request.id,
+                    previous_status,
+                    match_request.status,
+                    match_request.mentor_id,
+                    match_request.mentee_id,
+                )
+            ]
+        )
 
         return {
             "id": match_request.id,
-            "mentorId": match_request.mentor.id,
-            "menteeId": match_request.mentee.id,
+            "mentorId": match_request.mentor_id,
+            "menteeId": match_request.mentee_id,
             "message": match_request.message,
             "status": match_request.status,
         }
 
     @staticmethod
+    @write_transaction()
     def cancel_match_request(mentee: User, request_id: int) -> Dict[str, Any]:
         """매칭 요청 취소"""
         try:
@@ -358,16 +1035,435 @@ class MatchRequestService:
         except MatchRequest.DoesNotExist:
             raise ValueError("Match request not found")
 
-        if match_request.status in ["cancelled", "rejected"]:
+        if match_request.status in MatchRequestService.NON_CANCELLABLE_STATUSES:
             raise ValueError("이미 취소되었거나 거절된 요청입니다.")
 
+        previous_status = match_request.status
         match_request.status = "cancelled"
         match_request.save()
+        DataVersionService.bump_match_requests(
+            match_request.mentor_id, match_request.mentee_id
+        )
+        if previous_status == "accepted":
+            MentorService.set_availability(match_request.mentor_id, True)
+        MatchRequestService._record_transitions(
+            [
+                (
+                    match_request.id,
+                    previous_status,
+                    match_request.status,
+                    match_request.mentor_id,
+                    match_request.mentee_id,
+                )
+            ]
+        )
 
         return {
             "id": match_request.id,
-            "mentorId": match_request.mentor.id,
-            "menteeId": match_request.mentee.id,
+            "mentorId": match_request.mentor_id,
+            "menteeId": match_request.mentee_id,
             "message": match_request.message,
             "status": match_request.status,
         }
+
+    @staticmethod
+    @write_transaction()
+    def bulk_transition(
+        user: User, request_ids: List[int], action: str
+    ) -> List[Dict[str, Any]]:
+        """여러 매칭 요청에 같은 상태 전이를 한 번에 적용하고 id별 결과 반환"""
+        if action not in ("accept", "reject", "cancel"):
+            raise ValueError("action 값은 accept, reject, cancel만 허용됩니다.")
+        request_ids = list(dict.fromkeys(request_ids))  # 순서 유지 중복 제거
+        if not request_ids:
+            raise ValueError("ids가 비어 있습니다.")
+        if len(request_ids) > MatchRequestService.MAX_BULK_SIZE:
+            raise ValueError(
+                f"한 번에 최대 {MatchRequestService.MAX_BULK_SIZE}개까지 처리할 수 있습니다."
+            )
+
+        # 소유권 검증을 한 번의 쿼리로
+        owner = {"mentee": user} if action == "cancel" else {"mentor": user}
+        rows = {
+            row["id"]: row
+            for row in MatchRequest.objects.filter(id__in=request_ids, **owner).values(
+                "id", "mentor_id", "mentee_id", "status"
+            )
+        }
+        results: Dict[int, Dict[str, Any]] = {
+            id_: {"id": id_, "status": None, "error": "Match request not found"}
+            for id_ in request_ids
+            if id_ not in rows
+        }
+
+        if action == "accept":
+            results.update(MatchRequestService._bulk_accept(user, request_ids, rows))
+        else:
+            new_status = "cancelled" if action == "cancel" else "rejected"
+            eligible = [id_ for id_ in request_ids if id_ in rows]
+            if action == "cancel":
+                for id_ in list(eligible):
+                    status = rows[id_]["status"]
+                    if status in MatchRequestService.NON_CANCELLABLE_STATUSES:
+                        eligible.remove(id_)
+                        results[id_] = {
+                            "id": id_,
+                            "status": status,
+                            "error": "이미 취소되었거나 거절된 요청입니다.",
+                        }
+
+            applied = MatchRequestService._bulk_update_status(
+                eligible, owner, new_status
+            )
+            for id_ in eligible:
+                if id_ in applied:
+                    results[id_] = {"id": id_, "status": new_status, "error": None}
+                else:
+                    results[id_] = {
+                        "id": id_,
+                        "status": None,
+                        "error": "요청 상태가 변경되어 처리하지 못했습니다.",
+                    }
+
+            freed_mentor_ids = {
+                rows[id_]["mentor_id"]
+                for id_ in applied
+                if rows[id_]["status"] == "accepted"
+            }
+            for mentor_id in freed_mentor_ids:
+                MentorService.set_availability(mentor_id, True)
+            version_keys = []
+            for id_ in applied:
+                version_keys.append(
+                    DataVersionService.incoming_key(rows[id_]["mentor_id"])
+                )
+                version_keys.append(
+                    DataVersionService.outgoing_key(rows[id_]["mentee_id"])
+                )
+            DataVersionService.bump(*version_keys)
+            MatchRequestService._record_transitions(
+                [
+                    (
+                        id_,
+                        rows[id_]["status"],
+                        new_status,
+                        rows[id_]["mentor_id"],
+                        rows[id_]["mentee_id"],
+                    )
+                    for id_ in eligible
+                    if id_ in applied
+                ]
+            )
+
+        return [results[id_] for id_ in request_ids]
+
+    @staticmethod
+    def _bulk_update_status(
+        request_ids: List[int], owner: Dict[str, User], new_status: str
+    ) -> set:
+        """한 번의 UPDATE로 상태 변경 후 실제 반영된 id 집합 반환"""
+        if not request_ids:
+            return set()
+        now = timezone.now()
+        queryset = MatchRequest.objects.filter(id__in=request_ids, **owner)
+        if new_status == "cancelled":
+            queryset = queryset.exclude(
+                status__in=MatchRequestService.NON_CANCELLABLE_STATUSES
+            )
+        updated = queryset.update(status=new_status, updated_at=now)
+        if updated == len(request_ids):
+            return set(request_ids)
+        # 읽은 뒤 다른 요청이 상태를 바꾼 경우에만 다시 확인
+        return set(
+            MatchRequest.objects.filter(
+                id__in=request_ids, status=new_status, updated_at=now
+            ).values_list("id", flat=True)
+        )
+
+    @staticmethod
+    def _bulk_accept(
+        mentor: User, request_ids: List[int], rows: Dict[int, Dict[str, Any]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """일괄 수락 - 한 멘토는 한 명만 수락할 수 있으므로 수락에 성공한 첫 대기 요청만 수락"""
+        results = {}
+        pending = []
+        for id_ in request_ids:
+            if id_ not in rows:
+                continue
+            if rows[id_]["status"] == "pending":
+                pending.append(id_)
+            else:
+                results[id_] = {
+                    "id": id_,
+                    "status": rows[id_]["status"],
+                    "error": "대기 중인 요청만 수락할 수 있습니다.",
+                }
+        if not pending:
+            return results
+
+        # 수락에 실패한 요청은 그 오류를 남기고 다음 대기 요청으로 넘어간다
+        accepted = None
+        for id_ in pending:
+            try:
+                MatchRequestService.accept_match_request(mentor, id_)
+            except ValueError as e:
+                results[id_] = {"id": id_, "status": "pending", "error": str(e)}
+                continue
+            accepted = id_
+            results[id_] = {"id": id_, "status": "accepted", "error": None}
+            break
+
+        if accepted is not None:
+            # 같은 쓰기 트랜잭션에서 읽은 대기 요청이므로 수락 UPDATE에서 함께 거절되었다
+            for id_ in pending:
+                if id_ != accepted:
+                    failed = results.get(id_)
+                    results[id_] = {
+                        "id": id_,
+                        "status": "rejected",
+                        "error": failed["error"]
+                        if failed
+                        else "한 명의 멘티만 수락할 수 있습니다.",
+                    }
+        return results
+
+
+class MatchRequestArchiveService:
+    """종료된 매칭 요청을 보관 테이블로 옮기고 이력을 조회"""
+
+    ARCHIVABLE_STATUSES = ["rejected", "cancelled"]
+
+    @staticmethod
+    def _archivable(cutoff: datetime):
+        return MatchRequest.objects.filter(
+            status__in=MatchRequestArchiveService.ARCHIVABLE_STATUSES,
+            updated_at__lt=cutoff,
+        )
+
+    @staticmethod
+    def count_archivable(cutoff: datetime) -> int:
+        return MatchRequestArchiveService._archivable(cutoff).count()
+
+    @staticmethod
+    def archive_batch(cutoff: datetime, batch_size: int) -> int:
+        """
+        cutoff 이전에 종료된 요청을 최대 batch_size개 옮기고 옮긴 개수 반환
+
+        배치마다 짧은 트랜잭션 하나로 복사와 삭제를 함께 커밋하므로
+        중간에 멈춰도 다시 실행하면 남은 요청부터 이어서 처리된다.
+        대상 id는 쓰기 잠금 밖에서 (status, updated_at) 인덱스로 고르고,
+        트랜잭션 안에서는 그 id만 조건을 다시 확인해 옮긴다.
+        """
+        candidate_ids = list(
+            MatchRequestArchiveService._archivable(cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not candidate_ids:
+            return 0
+
+        with write_transaction():
+            # 고른 뒤 다시 열렸거나 이미 옮겨진 요청은 건너뜀
+            rows = list(
+                MatchRequestArchiveService._archivable(cutoff)
+                .filter(id__in=candidate_ids)
+                .select_for_update()
+                .order_by("id")
+                .values(
+                    "id",
+                    "mentor_id",
+                    "mentee_id",
+                    "message",
+                    "status",
+                    "created_at",
+                    "updated_at",
+                )
+            )
+            if not rows:
+                return 0
+
+            ids = [row["id"] for row in rows]
+            ArchivedMatchRequest.objects.bulk_create(
+                [ArchivedMatchRequest(**row) for row in rows], ignore_conflicts=True
+            )
+            MatchRequest.objects.filter(id__in=ids).delete()
+
+            version_keys = set()
+            for row in rows:
+                version_keys.add(DataVersionService.incoming_key(row["mentor_id"]))
+                version_keys.add(DataVersionService.outgoing_key(row["mentee_id"]))
+            DataVersionService.bump(*sorted(version_keys))
+        return len(rows)
+
+    @staticmethod
+    def get_archived_match_requests(
+        user: User,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """보관된 요청 이력 조회 (요청함과 같은 항목 형식, 같은 커서)"""
+        if user.role == "mentor":
+            queryset = ArchivedMatchRequest.objects.filter(mentor=user)
+            counterpart = "mentee"
+        else:
+            queryset = ArchivedMatchRequest.objects.filter(mentee=user)
+            counterpart = "mentor"
+        return MatchRequestService._list_match_requests(
+            queryset, counterpart, status=status, limit=limit, cursor=cursor
+        )
+
+
+class MatchSolverService:
+    """대기 중인 매칭 요청 전체를 한 번에 배정 (코호트 시작 시 관리자용)"""
+
+    @staticmethod
+    def _candidates(since: Optional[datetime]) -> List[tuple]:
+        """이미 수락한 멘티가 없는 멘토에게 보낸 대기 요청 (오래된 순)"""
+        queryset = MatchRequest.objects.filter(status="pending").exclude(
+            Exists(
+                MatchRequest.objects.filter(
+                    mentor=OuterRef("mentor"), status="accepted"
+                )
+            )
+        )
+        if since is not None:
+            queryset = queryset.filter(created_at__gte=since)
+        return list(
+            queryset.order_by("created_at", "id").values_list(
+                "id", "mentor_id", "mentee_id"
+            )
+        )
+
+    @staticmethod
+    def plan(since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        요청을 멘티-멘토 이분 그래프로 보고 멘토당 한 명인 최대 매칭 계산
+
+        먼저 요청한 멘티와 멘티가 먼저 보낸 요청을 우선하되,
+        매칭 수를 늘릴 수 있으면 그 선호를 바꾼다.
+        """
+        rows = MatchSolverService._candidates(since)
+        mentee_index: Dict[int, int] = {}
+        mentor_index: Dict[int, int] = {}
+        adjacency: List[List[int]] = []
+        edges: List[Dict[int, int]] = []  # 멘티 번호별 {멘토 번호: 요청 id}
+        for request_id, mentor_id, mentee_id in rows:
+            left = mentee_index.setdefault(mentee_id, len(mentee_index))
+            right = mentor_index.setdefault(mentor_id, len(mentor_index))
+            if left == len(adjacency):
+                adjacency.append([])
+                edges.append({})
+            if right not in edges[left]:
+                adjacency[left].append(right)
+                edges[left][right] = request_id
+
+        mentee_ids = list(mentee_index)
+        mentor_ids = list(mentor_index)
+        matching = hopcroft_karp(adjacency, len(mentor_ids))
+        pairs = sorted(
+            (edges[left][right], mentor_ids[right], mentee_ids[left])
+            for left, right in enumerate(matching)
+            if right != UNMATCHED
+        )
+        return {
+            "candidates": len(rows),
+            "mentors": len(mentor_ids),
+            "mentees": len(mentee_ids),
+            "pairs": pairs,
+        }
+
+    @staticmethod
+    def solve(
+        since: Optional[datetime] = None, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        최대 매칭을 계산하고 (dry_run이 아니면) 한 쓰기 트랜잭션에서 반영
+
+        계산은 읽기 트랜잭션에서 하므로 dry run은 쓰기 잠금을 잡지 않는다.
+        수락과 같은 규칙으로 배정된 요청은 accepted, 배정된 멘토의
+        나머지 대기 요청은 rejected가 되며 멘토는 수락 불가 상태가 된다.
+        계산 이후 요청 상태가 바뀌었으면 전체를 되돌리고 ValueError를 던진다.
+        """
+        with read_transaction():
+            plan = MatchSolverService.plan(since)
+            pairs = plan["pairs"]
+            accepted_ids = [request_id for request_id, _, _ in pairs]
+            matched_mentor_ids = [mentor_id for _, mentor_id, _ in pairs]
+            rejected = list(
+                MatchRequest.objects.filter(
+                    status="pending", mentor_id__in=matched_mentor_ids
+                )
+                .exclude(id__in=accepted_ids)
+                .order_by("id")
+                .values_list("id", "mentor_id", "mentee_id")
+            )
+        result = {
+            "dryRun": dry_run,
+            "candidates": plan["candidates"],
+            "mentors": plan["mentors"],
+            "mentees": plan["mentees"],
+            "matched": len(pairs),
+            "rejected": len(rejected),
+            "pairs": [
+                {"id": request_id, "mentorId": mentor_id, "menteeId": mentee_id}
+                for request_id, mentor_id, mentee_id in pairs
+            ],
+        }
+        if dry_run or not pairs:
+            return result
+
+        with write_transaction():
+            MatchSolverService._apply(pairs, rejected)
+        return result
+
+    @staticmethod
+    def _apply(pairs: List[tuple], rejected: List[tuple]) -> None:
+        """계산한 배정을 반영 (요청 상태가 바뀌었으면 ValueError)"""
+        accepted_ids = [request_id for request_id, _, _ in pairs]
+        matched_mentor_ids = [mentor_id for _, mentor_id, _ in pairs]
+        changed = ValueError("배정 중 요청 상태가 변경되었습니다. 다시 실행해 주세요.")
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                updated = MatchRequest.objects.filter(
+                    id__in=accepted_ids, status="pending"
+                ).update(status="accepted", updated_at=now)
+        except IntegrityError:
+            # 계산 이후 다른 요청이 같은 멘토의 요청을 먼저 수락한 경우
+            raise changed
+        if updated != len(accepted_ids):
+            raise changed
+        rejected_ids = [request_id for request_id, _, _ in rejected]
+        # 계산 뒤 배정된 멘토에게 새로 온 대기 요청이 있으면 이벤트 없이 거절하지 않는다
+        pending_ids = set(
+            MatchRequest.objects.filter(
+                status="pending", mentor_id__in=matched_mentor_ids
+            ).values_list("id", flat=True)
+        )
+        if pending_ids != set(rejected_ids):
+            raise changed
+        updated = MatchRequest.objects.filter(
+            id__in=rejected_ids, status="pending"
+        ).update(status="rejected", updated_at=now)
+        if updated != len(rejected_ids):
+            raise changed
+
+        Profile.objects.filter(user_id__in=matched_mentor_ids).update(
+            is_available=False
+        )
+        version_keys = {DataVersionService.MENTORS}
+        for _, mentor_id, mentee_id in pairs + rejected:
+            version_keys.add(DataVersionService.incoming_key(mentor_id))
+            version_keys.add(DataVersionService.outgoing_key(mentee_id))
+        DataVersionService.bump(*sorted(version_keys))
+        MatchRequestService._record_transitions(
+            [
+                (request_id, "pending", "accepted", mentor_id, mentee_id)
+                for request_id, mentor_id, mentee_id in pairs
+            ]
+            + [
+                (request_id, "pending", "rejected", mentor_id, mentee_id)
+                for request_id, mentor_id, mentee_id in rejected
+            ]
+        )
@@ -0,0 +1,283 @@
+"""
+멘토 스킬 비트맵 인덱스
+
+스킬 id마다 멘토 비트맵(파이썬 int)을 메모리에 유지하여
+AND/OR 스킬 검색과 스킬별 facet 개수를 비트 연산으로 계산한다.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+# 바이트 값 -> 켜진 비트 위치 목록 (비트맵을 id 목록으로 풀 때 사용)
+_BYTE_BITS = [[bit for bit in range(8) if value >> bit & 1] for value in range(256)]
+
+
+def bitmap_from_ids(ids: Iterable[int]) -> int:
+    """id 목록으로 비트맵 생성"""
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for id_ in ids:
+        buffer[id_ >> 3] |= 1 << (id_ & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bitmap_to_ids(bitmap: int) -> list[int]:
+    """비트맵에서 켜진 id 목록을 오름차순으로 반환"""
+    ids = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for offset, value in enumerate(data):
+        if value:
+            base = offset << 3
+            ids.extend(base + bit for bit in _BYTE_BITS[value])
+    return ids
+
+
+class SkillIndex:
+    """프로세스 내 멘토 스킬 비트맵 인덱스
+
+    DataVersion의 MENTOR_SKILLS 버전이 인덱스를 만든 시점과 다르면(다른 워커가
+    멘토/스킬을 바꿨으면) 다음 조회 때 전체 재구성한다. 같은 프로세스의 변경은
+    시그널로 커밋 후 증분 반영하고, 그 트랜잭션이 올린 버전까지 advance()로
+    따라가므로 재구성하지 않는다.
+
+    비트 위치는 (멘토 id - 가장 작은 멘토 id)라서 비트맵 크기는 멘토 id 범위에
+    비례한다. 멘토가 아닌 사용자 id가 사이사이에 많으면 그만큼 빈 비트가 생긴다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        """인덱스 무효화 (다음 조회 시 DB에서 재구성)"""
+        with self._lock:
+            self._version: int | None = None
+            self._base = 0
+            self._bitmaps: dict[int, int] = {}
+            self._mentor_skills: dict[int, set[int]] = {}
+            self._skill_names: dict[int, str] = {}
+            self._skill_ids: dict[str, int] = {}
+            self._mentors = 0
+
+    @staticmethod
+    def _current_version() -> int:
+        from .services import DataVersionService
+
+        return DataVersionService.get_version(DataVersionService.MENTOR_SKILLS)
+
+    def ensure_loaded(self) -> None:
+        """인덱스가 없거나 MENTOR_SKILLS 버전이 바뀌었으면 DB에서 전체 재구성"""
+        version = self._current_version()
+        with self._lock:
+            if self._version != version:
+                self._build(version)
+
+    def advance(self, before: int, after: int) -> None:
+        """같은 프로세스의 변경분을 반영한 뒤 버전을 before -> after로 올린다
+
+        인덱스가 before가 아니면 그 사이 다른 워커의 변경이 있었던 것이므로 그대로
+        두고 다음 조회 때 재구성한다.
+        """
+        with self._lock:
+            if self._version == before:
+                self._version = after
+
+    def _build(self, version: int) -> None:
+        from .models import Profile, Skill
+
+        # 버전을 먼저 읽었으므로 인덱스 내용은 그 버전보다 오래되지 않는다
+        mentor_ids = list(
+            Profile.objects.filter(user__role="mentor").values_list(
+                "user_id", flat=True
+            )
+        )
+        pairs = Profile.skills.through.objects.filter(
+            profile__user__role="mentor"
+        ).values_list("profile__user_id", "skill_id")
+
+        base = min(mentor_ids, default=0)
+        members: dict[int, list[int]] = {}
+        mentor_skills: dict[int, set[int]] = {id_: set() for id_ in mentor_ids}
+        for mentor_id, skill_id in pairs.iterator(chunk_size=10000):
+            members.setdefault(skill_id, []).append(mentor_id - base)
+            mentor_skills.setdefault(mentor_id, set()).add(skill_id)
+
+        self._skill_names = dict(Skill.objects.values_list("id", "name"))
+        self._skill_ids = {
+            name.lower(): skill_id for skill_id, name in self._skill_names.items()
+        }
+        self._base = base
+        self._bitmaps = {
+            skill_id: bitmap_from_ids(ids) for skill_id, ids in members.items()
+        }
+        self._mentor_skills = mentor_skills
+        self._mentors = bitmap_from_ids(id_ - base for id_ in mentor_ids)
+        self._version = version
+
+    def _bit(self, mentor_id: int) -> int:
+        """멘토 id의 비트 (기준 id보다 작으면 모든 비트맵을 옮겨 기준을 낮춘다)"""
+        if mentor_id < self._base:
+            shift = self._base - mentor_id
+            self._bitmaps = {
+                skill_id: bitmap << shift for skill_id, bitmap in self._bitmaps.items()
+            }
+            self._mentors <<= shift
+            self._base = mentor_id
+        return 1 << (mentor_id - self._base)
+
+    def update_mentor(
+        self,
+        mentor_id: int,
+        add: Iterable[int] = (),
+        remove: Iterable[int] = (),
+        clear: bool = False,
+    ) -> None:
+        """멘토 한 명의 스킬 변경분을 비트맵에 증분 반영"""
+        with self._lock:
+            if self._version is None:
+                return
+            if not self._mentor_skills and not self._mentors:
+                self._base = mentor_id
+            bit = self._bit(mentor_id)
+            current = self._mentor_skills.setdefault(mentor_id, set())
+            removed = set(current) if clear else set(remove) & current
+            for skill_id in removed:
+                bitmap = self._bitmaps.get(skill_id, 0) & ~bit
+                if bitmap:
+                    self._bitmaps[skill_id] = bitmap
+                else:
+                    self._bitmaps.pop(skill_id, None)
+            current -= removed
+
+            added = set(add) - current
+            self._load_skill_names(added)
+            for skill_id in added:
+                self._bitmaps[skill_id] = self._bitmaps.get(skill_id, 0) | bit
+            current |= added
+            self._mentors |= bit
+
+    def _load_skill_names(self, skill_ids: set[int]) -> None:
+        from .models import Skill
+
+        missing = [id_ for id_ in skill_ids if id_ not in self._skill_names]
+        if not missing:
+            return
+        for skill_id, name in Skill.objects.filter(id__in=missing).values_list(
+            "id", "name"
+        ):
+            self._skill_names[skill_id] = name
+            self._skill_ids[name.lower()] = skill_id
+
+    def remove_mentor(self, mentor_id: int) -> None:
+        """멘토를 인덱스에서 제거"""
+        with self._lock:
+            if self._version is None or mentor_id not in self._mentor_skills:
+                return
+            self.update_mentor(mentor_id, clear=True)
+            self._mentor_skills.pop(mentor_id, None)
+            self._mentors &= ~self._bit(mentor_id)
+
+    def is_mentor(self, mentor_id: int) -> bool:
+        """인덱스에 등록된 멘토인지 여부"""
+        return mentor_id in self._mentor_skills
+
+    @property
+    def loaded(self) -> bool:
+        return self._version is not None
+
+    def _query(self, skill_names: Iterable[str], match: str) -> int:
+        bitmaps = []
+        for name in skill_names:
+            skill_id = self._skill_ids.get(name.strip().lower())
+            bitmap = self._bitmaps.get(skill_id, 0)
+            if match == "all" and not bitmap:
+                return 0
+            bitmaps.append(bitmap)
+
+        if not bitmaps:
+            return self._mentors
+        result = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            result = result & bitmap if match == "all" else result | bitmap
+        return result
+
+    def mentor_ids(self, skill_names: Iterable[str], match: str = "all") -> list[int]:
+        """스킬 이름 목록에 맞는 멘토 id (match: all=AND, any=OR, 오름차순)"""
+        self.ensure_loaded()
+        with self._lock:
+            base = self._base
+            return [
+                bit + base for bit in bitmap_to_ids(self._query(skill_names, match))
+            ]
+
+    def facets(
+        self, skill_names: Iterable[str] = (), match: str = "all"
+    ) -> tuple[int, list[dict[str, object]]]:
+        """스킬 조건에 맞는 멘토 수와, 그 안에서 스킬별 멘토 수 (많은 순)"""
+        self.ensure_loaded()
+        with self._lock:
+            bitmap = self._query(skill_names, match)
+            counts = []
+            for skill_id, skill_bitmap in self._bitmaps.items():
+                count = (skill_bitmap & bitmap).bit_count()
+                if count:
+                    counts.append({"name": self._skill_names[skill_id], "count": count})
+        counts.sort(key=lambda item: (-item["count"], item["name"]))
+        return bitmap.bit_count(), counts
+
+
+skill_index = SkillIndex()
+
+
+def _profile_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Profile.skills 변경 시 인덱스 증분 갱신"""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not skill_index.loaded:
+        return
+    if reverse:
+        # Skill 쪽에서 변경된 경우 영향 범위가 넓으므로 전체 재구성
+        skill_index.reset()
+        return
+    if not skill_index.is_mentor(instance.user_id) and instance.user.role != "mentor":
+        return
+    # 롤백된 변경이 인덱스에 남지 않도록 커밋 이후 반영
+    transaction.on_commit(
+        lambda: skill_index.update_mentor(
+            instance.user_id,
+            add=pk_set if action == "post_add" else (),
+            remove=pk_set if action == "post_remove" else (),
+            clear=action == "post_clear",
+        )
+    )
+
+
+def _profile_saved(sender, instance, created, **kwargs):
+    if created and skill_index.loaded and instance.user.role == "mentor":
+        transaction.on_commit(lambda: skill_index.update_mentor(instance.user_id))
+
+
+def _profile_deleted(sender, instance, **kwargs):
+    if skill_index.loaded:
+        transaction.on_commit(lambda: skill_index.remove_mentor(instance.user_id))
+
+
+def connect_signals() -> None:
+    from .models import Profile
+
+    m2m_changed.connect(
+        _profile_skills_changed,
+        sender=Profile.skills.through,
+        dispatch_uid="skill_index_profile_skills",
+    )
+    post_save.connect(
+        _profile_saved, sender=Profile, dispatch_uid="skill_index_profile_save"
+    )
+    post_delete.connect(
+        _profile_deleted, sender=Profile, dispatch_uid="skill_index_profile_delete"
+    )
@@ -8,3 +8,138 @@ def test_hello_api():
     response = client.get("/api/hello")
     assert response.status_code == 200
     assert response.json() == {"message": "Hello, World!"}
+
+
+@pytest.mark.django_db
+def test_openapi_precompressed_gzip():
+    import gzip
+
+    from .middleware import compressed_variant_cache
+
+    compressed_variant_cache.clear()
+    client = Client()
+    plain = client.get("/api/openapi.json")
+    assert plain.status_code == 200
+    assert not plain.has_header("Content-Encoding")
+
+    response = client.get("/api/openapi.json", HTTP_ACCEPT_ENCODING="gzip, deflate")
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert gzip.decompress(response.content) == plain.content
+
+    # 같은 내용이면 캐시된 압축 결과를 재사용
+    again = client.get("/api/openapi.json", HTTP_ACCEPT_ENCODING="gzip")
+    assert again.content == response.content
+    assert again["Content-Length"] == str(len(response.content))
+    assert len(compressed_variant_cache) == 1
+
+
+def test_choose_encoding():
+    from .middleware import COMPRESSORS, choose_encoding
+
+    assert choose_encoding("") is None
+    assert choose_encoding("identity") is None
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("gzip, deflate") == "gzip"
+    expected = "br" if "br" in COMPRESSORS else "gzip"
+    assert choose_encoding("gzip, br") == expected
+
+
+@pytest.mark.django_db
+def test_metrics_per_endpoint():
+    from .metrics import collector
+
+    collector.reset()
+    client = Client()
+    hello = client.get("/api/hello")
+    client.get("/api/hello")
+    client.get("/api/mentors")  # 인증 없음 -> 401
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert "# TYPE lipcoding_http_request_duration_seconds histogram" in body
+    assert (
+        'lipcoding_http_requests_total{endpoint="/api/hello",method="GET",'
+        'status="200"} 2' in body
+    )
+    assert (
+        'lipcoding_http_requests_total{endpoint="/api/mentors",method="GET",'
+        'status="401"} 1' in body
+    )
+    assert (
+        'lipcoding_http_request_duration_seconds_bucket{endpoint="/api/hello",'
+        'method="GET",le="+Inf"} 2' in body
+    )
+    assert (
+        'lipcoding_http_response_size_bytes_sum{endpoint="/api/hello",'
+        f'method="GET"}} {len(hello.content) * 2}' in body
+    )
+    assert 'lipcoding_db_queries_total{endpoint="/api/hello",method="GET"}' in body
+    # /metrics 요청 자체는 기록하지 않음
+    assert 'endpoint="/metrics"' not in body
+
+    forbidden = client.get("/metrics", REMOTE_ADDR="10.0.0.1")
+    assert forbidden.status_code == 403
+
+
+def test_metrics_shards_bounded_with_short_lived_threads():
+    import threading
+
+    from .metrics import MIN_PRUNE_SHARDS, MetricsCollector
+
+    collector = MetricsCollector()
+
+    def request():
+        collector.observe_request("/api/hello", "GET", 200, 0.002, 10, 1, 0.001)
+
+    # 연결마다 새 스레드를 만드는 서버처럼 짧게 사는 스레드 500개
+    for _ in range(50):
+        threads = [threading.Thread(target=request) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(collector._shards) <= MIN_PRUNE_SHARDS + 10
+
+    labels = (("endpoint", "/api/hello"), ("method", "GET"))
+    totals = collector.snapshot()
+    assert totals[("lipcoding_db_queries_total", labels)] == 500
+    # 종료된 스레드의 값은 _retired에 합쳐지고 shard는 남지 않는다
+    assert collector._shards == []
+
+
+def test_metrics_merge_worker_files(tmp_path, settings):
+    import os
+
+    from .metrics import MetricsCollector, _write_json, render
+
+    settings.METRICS_COMPACT_THRESHOLD = 1
+    labels = (("endpoint", "/api/hello"), ("method", "GET"))
+    collector = MetricsCollector()
+    collector.configure(str(tmp_path))
+    collector.observe_request("/api/hello", "GET", 200, 0.002, 10, 1, 0.001)
+
+    # 살아 있는 다른 워커와 이미 종료된 워커가 남긴 파일
+    other = [["lipcoding_db_queries_total", [list(label) for label in labels], 3]]
+    _write_json(str(tmp_path / f"{os.getppid()}.json"), other)
+    _write_json(str(tmp_path / "999999999.json"), other)
+
+    totals = collector.collect()
+    assert totals[("lipcoding_db_queries_total", labels)] == 7
+    # 종료된 워커 파일은 archive로 합쳐진다
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["archive.json", "compact.lock", f"{os.getpid()}.json", f"{os.getppid()}.json"]
+    )
+    assert collector.collect() == totals
+
+    body = render(totals, collector.buckets)
+    assert (
+        'lipcoding_http_request_duration_seconds_bucket{endpoint="/api/hello",'
+        'method="GET",le="+Inf"} 1' in body
+    )
+    assert (
+        'lipcoding_http_request_duration_seconds_bucket{endpoint="/api/hello",'
+        'method="GET",le="+Inf"} 1' in body
+    )
@@ -0,0 +1,157 @@
+import pytest
+
+from .models import MatchRequest, Profile, User
+
+
+def test_parse_importtime():
+    from .management.commands.profile_imports import parse_importtime
+
+    rows = parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   ninja.conf\n"
+        "import time:      1500 |       1620 | ninja\n"
+    )
+    assert rows == [
+        {"module": "ninja.conf", "self": 120, "cumulative": 120, "depth": 1},
+        {"module": "ninja", "self": 1500, "cumulative": 1620, "depth": 0},
+    ]
+
+
+def test_profile_imports_command():
+    """모듈별 import 시간과 첫 응답 시간 출력 (numpy는 첫 응답까지 불러오지 않음)"""
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    out = StringIO()
+    call_command(
+        "profile_imports", "--runs", "1", "--limit", "500", "--sort", "self", stdout=out
+    )
+    output = out.getvalue()
+    assert "(/api/hello, 200 OK" in output
+    assert "django.setup" in output
+    assert " numpy\n" not in output
+
+
+def test_loadtest_command(live_server, tmp_path):
+    """멘티/멘토 시나리오를 실행하고 엔드포인트별 결과를 JSON으로 저장"""
+    import json
+    import time
+    from datetime import datetime
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    common = ["--mentors", "2", "--mentees", "3", "--seed", "7", "--iterations", "2"]
+    out = StringIO()
+    call_command("loadtest", "--prepare", *common, stdout=out)
+    assert "새로 만든 계정 5개" in out.getvalue()
+    # 이미 있는 계정은 건너뛴다
+    out = StringIO()
+    call_command("loadtest", "--prepare", *common, stdout=out)
+    assert "새로 만든 계정 0개" in out.getvalue()
+
+    # 테스트 DB(공유 캐시 인메모리 SQLite)는 동시 쓰기 시 테이블을 잠그므로
+    # 역할별로 가상 사용자 한 명씩 차례로 실행
+    base = ["--base-url", live_server.url, "--users", "1", *common]
+    mentee_run = tmp_path / "mentee.json"
+    before_run = time.time()
+    call_command(
+        "loadtest",
+        *base,
+        "--mentor-ratio",
+        "0",
+        "--output",
+        str(mentee_run),
+        stdout=StringIO(),
+    )
+    result = json.loads(mentee_run.read_text())
+    assert result["journeys"] == 2
+    # 실행 시작 시각 (실행이 끝난 시각이 아님)
+    started_at = datetime.strptime(result["startedAt"], "%Y-%m-%dT%H:%M:%S%z")
+    assert abs(started_at.timestamp() - before_run) <= 1
+    assert result["errors"] == 0
+    endpoints = result["endpoints"]
+    assert endpoints["POST /api/login"]["statuses"] == {"200": 1}
+    assert endpoints["GET /api/mentors"]["statuses"] == {"200": 2}
+    assert endpoints["POST /api/match-requests"]["statuses"] == {"200": 2}
+    # 두 번째 시나리오는 대기 중인 첫 요청을 취소하고 다시 요청
+    assert endpoints["DELETE /api/match-requests/{request_id}"]["statuses"] == {
+        "200": 1
+    }
+    for item in endpoints.values():
+        assert 0 < item["p50"] <= item["p95"] <= item["p99"]
+
+    out = StringIO()
+    call_command(
+        "loadtest",
+        *base,
+        "--mentor-ratio",
+        "1",
+        "--accept-ratio",
+        "0",
+        "--compare",
+        str(mentee_run),
+        stdout=out,
+    )
+    output = out.getvalue()
+    assert "GET /api/match-requests/incoming" in output
+    # 이전 결과(멘티 실행)에도 있는 엔드포인트만 비교
+    assert "GET /api/me" in output.split("비교:")[1]
+    assert "incoming" not in output.split("비교:")[1]
+
+
+@pytest.mark.django_db
+def test_seed_command():
+    """같은 seed면 같은 데이터, 제약 조건과 MatchStats 일관성 유지"""
+    from io import StringIO
+
+    from django.core.management import call_command
+    from django.core.management.base import CommandError
+    from django.db.models import Count
+
+    from .models import MatchStats
+
+    args = [
+        "--mentors", "30", "--mentees", "200", "--requests", "500", "--skills", "40",
+        "--images", "5", "--image-size", "64", "--chunk", "70", "--seed", "3",
+    ]  # fmt: skip
+
+    def snapshot():
+        return sorted(
+            MatchRequest.objects.values_list("mentor__email", "mentee__email", "status")
+        )
+
+    out = StringIO()
+    call_command("seed", *args, stdout=out)
+    assert "매칭 요청: " in out.getvalue()
+    assert User.objects.filter(role="mentor").count() == 30
+    assert User.objects.filter(role="mentee").count() == 200
+    assert 400 <= MatchRequest.objects.count() <= 600
+    assert Profile.objects.exclude(image_data=None).count() == 5
+    assert Profile.skills.through.objects.count() >= 30
+    # 비밀번호 해시는 하나를 재사용
+    user = User.objects.get(email="seed-mentee-0@example.com")
+    assert user.check_password("seed-password")
+    assert User.objects.values("password").distinct().count() == 1
+
+    # 통계는 실제 상태별 개수와 같고, 수락한 멘토는 요청을 받을 수 없음
+    mentor = (
+        MatchRequest.objects.filter(status="accepted").values_list("mentor", flat=True)
+    ).first()
+    assert not Profile.objects.get(user_id=mentor).is_available
+    counts = dict(
+        MatchRequest.objects.filter(mentor=mentor)
+        .values_list("status")
+        .annotate(n=Count("id"))
+    )
+    stats = MatchStats.objects.get(user_id=mentor)
+    assert stats.accepted == counts["accepted"] == 1
+    assert stats.rejected == counts.get("rejected", 0)
+
+    first = snapshot()
+    with pytest.raises(CommandError, match="이미 있습니다"):
+        call_command("seed", *args, stdout=StringIO())
+    User.objects.all().delete()
+    call_command("seed", *args, stdout=StringIO())
+    assert snapshot() == first
@@ -0,0 +1,134 @@
+import pytest
+
+from .models import Profile, User
+from .services import ProfileService
+
+
+@pytest.mark.django_db
+def test_sqlite_pragmas_applied_on_connect():
+    """새 연결마다 운영 프로필 PRAGMA 적용"""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA busy_timeout")
+        assert cursor.fetchone()[0] == 5000
+        cursor.execute("PRAGMA synchronous")
+        assert cursor.fetchone()[0] == 1  # NORMAL
+
+
+def test_configured_pragmas_single_source(settings):
+    """기본 PRAGMA는 api.db.DEFAULT_PRAGMAS 한 곳에만 있고 설정으로만 덮어씀"""
+    from .db import DEFAULT_PRAGMAS, configured_pragmas
+
+    assert configured_pragmas() is DEFAULT_PRAGMAS
+    settings.SQLITE_PRAGMAS = {"busy_timeout": 100}
+    assert configured_pragmas() == {"busy_timeout": 100}
+
+
+def test_write_queue_fifo_and_timeout():
+    """쓰기 대기열은 도착 순서대로 실행하고, 중첩 호출은 통과, 제한 시간 초과는 실패"""
+    import threading
+    import time
+
+    from .db import WriteQueue, WriteQueueTimeout
+
+    queue = WriteQueue()
+    order = []
+    with queue.slot():
+        with queue.slot():  # 같은 스레드의 중첩 호출
+            pass
+
+        def writer(i):
+            with queue.slot(timeout=5):
+                order.append(i)
+
+        threads = []
+        for i in range(5):
+            thread = threading.Thread(target=writer, args=(i,))
+            thread.start()
+            threads.append(thread)
+            while queue.waiting < i + 2:
+                time.sleep(0.001)
+        errors = []
+
+        def impatient():
+            try:
+                with queue.slot(timeout=0.01):
+                    order.append("impatient")
+            except WriteQueueTimeout as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=impatient)
+        thread.start()
+        thread.join()
+        assert len(errors) == 1
+        assert order == []
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2, 3, 4]
+    assert queue.waiting == 0
+
+
+@pytest.mark.django_db
+def test_write_transaction_serialized(settings, monkeypatch):
+    """SQLITE_SERIALIZE_WRITES가 켜져 있으면 서비스 쓰기가 대기열을 거친다"""
+    from .db import write_queue
+
+    settings.SQLITE_SERIALIZE_WRITES = True
+    slots = []
+    original_slot = write_queue.slot
+
+    def slot(timeout=None):
+        slots.append(timeout)
+        return original_slot(timeout)
+
+    monkeypatch.setattr(write_queue, "slot", slot)
+    user = User.objects.create_user(
+        email="writer@example.com", password="password123", role="mentee"
+    )
+
+    ProfileService.update_profile(user, {"name": "작성자", "bio": "소개", "skills": []})
+
+    assert slots == [5]
+    assert Profile.objects.get(user=user).bio == "소개"
+    assert write_queue.waiting == 0
+
+
+def test_benchmark_sqlite_command():
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    out = StringIO()
+    call_command(
+        "benchmark_sqlite",
+        "--threads",
+        "2",
+        "--duration",
+        "0.2",
+        "--rows",
+        "10",
+        "--profile",
+        "wal+queue",
+        stdout=out,
+    )
+    assert "wal+queue" in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_transaction_begins_deferred():
+    """읽기 트랜잭션은 IMMEDIATE 대신 DEFERRED로 시작하고 설정을 되돌림"""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from .db import read_transaction
+
+    with CaptureQueriesContext(connection) as queries:
+        with read_transaction():
+            User.objects.count()
+        with read_transaction(), read_transaction():  # 중첩은 바깥 트랜잭션을 따름
+            pass
+
+    sql = [query["sql"] for query in queries.captured_queries]
+    assert sql.count("BEGIN DEFERRED") == 2
+    assert connection.transaction_mode == "IMMEDIATE"
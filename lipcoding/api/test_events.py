@@ -0,0 +1,34 @@
+import pytest
+
+
+def test_event_hub_delivery_and_backpressure():
+    """허브는 스레드에서 발행해도 전달하고, 큐가 넘치면 resync만 남김"""
+    import asyncio
+    import threading
+
+    from .events import EventHub, TooManyConnections
+
+    hub = EventHub(max_connections_per_user=1, max_queue=2)
+
+    async def scenario():
+        subscriber = hub.subscribe(1)
+        with pytest.raises(TooManyConnections):
+            hub.subscribe(1)
+
+        thread = threading.Thread(
+            target=hub.dispatch, args=([1, 2], {"type": "match_request", "id": 1})
+        )
+        thread.start()
+        thread.join()
+        assert (await asyncio.wait_for(subscriber.queue.get(), 1))["id"] == 1
+
+        for id_ in range(5):
+            hub.dispatch([1], {"type": "match_request", "id": id_})
+        await asyncio.sleep(0)
+        assert subscriber.queue.get_nowait() == {"type": "resync"}
+        assert subscriber.queue.empty()
+
+        hub.unsubscribe(subscriber)
+        assert hub.connection_count(1) == 0
+
+    asyncio.run(scenario())
@@ -168,6 +168,176 @@ class TestMentorList:
         assert data[0]["profile"]["name"] == "김철수"  # ㄱ이 먼저
         assert data[1]["profile"]["name"] == "홍길동"  # ㅎ이 나중
 
+    @pytest.mark.django_db
+    def test_get_mentors_multi_skill_and_facets(
+        self, client, mentee_token, mentor_profile
+    ):
+        """다중 스킬 검색 및 스킬 facet 조회"""
+        from .skill_index import skill_index
+
+        skill_index.reset()
+        response = client.get(
+            "/api/mentors?skills=React,Vue&match=all",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+        response = client.get(
+            "/api/mentors?skills=React,Django&match=all",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.json() == []
+
+        response = client.get(
+            "/api/mentors/facets", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 1,
+            "skills": [{"name": "React", "count": 1}, {"name": "Vue", "count": 1}],
+        }
+
+        response = client.get(
+            "/api/mentors?skills=React&match=xor",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.django_db
+    def test_get_mentors_available_filter(
+        self, client, mentee_token, mentor_profile, mentee_user
+    ):
+        """수락 가능 여부로 멘토 리스트 필터링"""
+        from .models import MatchRequest
+        from .services import MatchRequestService
+
+        match_request = MatchRequest.objects.create(
+            mentor=mentor_profile.user, mentee=mentee_user, message="요청"
+        )
+        MatchRequestService.accept_match_request(mentor_profile.user, match_request.id)
+
+        response = client.get(
+            "/api/mentors?available=true", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+        response = client.get(
+            "/api/mentors?available=false", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert len(response.json()) == 1
+
+        # 수락된 요청 취소 시 다시 수락 가능 상태가 됨
+        MatchRequestService.cancel_match_request(mentee_user, match_request.id)
+        response = client.get(
+            "/api/mentors?available=true", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert len(response.json()) == 1
+
+    @pytest.mark.django_db
+    def test_get_mentors_etag(self, client, mentee_token, mentor_profile):
+        """멘토 디렉터리 버전이 같으면 304, 프로필 수정 후에는 200"""
+        from .services import ProfileService
+
+        response = client.get(
+            "/api/mentors", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        etag = response["ETag"]
+
+        response = client.get(
+            "/api/mentors",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 304
+
+        # 조회 조건이 다르면 다른 ETag
+        response = client.get(
+            "/api/mentors?order_by=name",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 200
+
+        ProfileService.update_profile(
+            mentor_profile.user, {"name": "새이름", "bio": "", "skills": ["React"]}
+        )
+        response = client.get(
+            "/api/mentors",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 200
+        assert response.json()[0]["profile"]["name"] == "새이름"
+
+    @pytest.mark.django_db
+    def test_get_mentors_precompressed(
+        self, client, mentee_token, mentor_profile, django_assert_max_num_queries
+    ):
+        """같은 버전/조건이면 뷰가 목록을 다시 만들지 않고 압축 캐시를 반환"""
+        import gzip
+
+        from .middleware import compressed_variant_cache
+        from .services import ProfileService
+
+        compressed_variant_cache.clear()
+        auth = {
+            "HTTP_AUTHORIZATION": f"Bearer {mentee_token}",
+            "HTTP_ACCEPT_ENCODING": "gzip",
+        }
+        plain = client.get(
+            "/api/mentors", HTTP_AUTHORIZATION=auth["HTTP_AUTHORIZATION"]
+        )
+        first = client.get("/api/mentors", **auth)
+        assert first["Content-Encoding"] == "gzip"
+        assert gzip.decompress(first.content) == plain.content
+        assert len(compressed_variant_cache) == 1
+
+        # 인증 + 버전 조회만 하고 멘토 목록 조회/직렬화는 건너뜀
+        with django_assert_max_num_queries(2):
+            again = client.get("/api/mentors", **auth)
+        assert again.content == first.content
+        assert again["ETag"] == first["ETag"]
+
+        # 쿼리가 다르면 별도 키, 하위 경로는 캐시하지 않음
+        client.get("/api/mentors?order_by=name", **auth)
+        client.get("/api/mentors/facets", **auth)
+        client.get("/api/mentors/recommended", **auth)
+        assert len(compressed_variant_cache) == 2
+
+        # 버전이 바뀌면 새 내용으로 압축
+        ProfileService.update_profile(
+            mentor_profile.user,
+            {"name": "새이름", "bio": mentor_profile.bio, "skills": ["React", "Vue"]},
+        )
+        response = client.get("/api/mentors", **auth)
+        assert response["ETag"] != first["ETag"]
+        mentors = json.loads(gzip.decompress(response.content))
+        assert mentors[0]["profile"]["name"] == "새이름"
+
+    @pytest.mark.django_db
+    def test_get_recommended_mentors(
+        self, client, mentee_token, mentor_token, mentor_profile
+    ):
+        """멘티에게 점수와 함께 멘토 추천"""
+        from .recommender import recommender
+
+        recommender.reset()
+        response = client.get(
+            "/api/mentors/recommended?limit=5",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["id"] for m in data] == [mentor_profile.user_id]
+        assert "score" in data[0]
+
+        response = client.get(
+            "/api/mentors/recommended", HTTP_AUTHORIZATION=f"Bearer {mentor_token}"
+        )
+        assert response.status_code == 403
+
     @pytest.mark.django_db
     def test_get_mentors_mentee_only(self, client, mentor_token, mentor_profile):
         """멘토는 멘토 리스트 조회 불가"""
@@ -386,6 +556,461 @@ class TestMatchRequest:
         match_request.refresh_from_db()
         assert match_request.status == "cancelled"
 
+    @pytest.mark.django_db
+    def test_incoming_match_requests_pagination(
+        self, client, mentor_token, mentor_user
+    ):
+        """상태 필터와 커서 기반 페이지네이션"""
+        from .models import MatchRequest
+
+        for i in range(5):
+            mentee = User.objects.create_user(
+                email=f"mentee{i}@example.com", password="testpass123", role="mentee"
+            )
+            MatchRequest.objects.create(
+                mentor=mentor_user,
+                mentee=mentee,
+                message=f"요청{i}",
+                status="rejected" if i == 0 else "pending",
+            )
+
+        seen = []
+        url = "/api/match-requests/incoming?status=pending&limit=3"
+        response = client.get(url, HTTP_AUTHORIZATION=f"Bearer {mentor_token}")
+        assert response.status_code == 200
+        seen += [item["message"] for item in response.json()]
+        cursor = response["X-Next-Cursor"]
+
+        response = client.get(
+            f"{url}&cursor={cursor}", HTTP_AUTHORIZATION=f"Bearer {mentor_token}"
+        )
+        seen += [item["message"] for item in response.json()]
+        assert not response.has_header("X-Next-Cursor")
+        assert seen == ["요청4", "요청3", "요청2", "요청1"]
+
+        response = client.get(
+            "/api/match-requests/incoming?status=unknown",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+        assert response.status_code == 400
+
+        response = client.get(
+            "/api/match-requests/incoming?cursor=invalid",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.django_db
+    def test_outgoing_match_requests_since(
+        self, client, mentee_token, mentor_user, mentee_user
+    ):
+        """since 이후 변경된 요청만 조회"""
+        from .models import MatchRequest
+
+        match_request = MatchRequest.objects.create(
+            mentor=mentor_user, mentee=mentee_user, message="요청"
+        )
+        since = match_request.updated_at.isoformat().replace("+00:00", "Z")
+
+        response = client.get(
+            f"/api/match-requests/outgoing?since={since}",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.json() == []
+
+        match_request.status = "accepted"
+        match_request.save()
+        response = client.get(
+            f"/api/match-requests/outgoing?since={since}",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert [item["status"] for item in response.json()] == ["accepted"]
+
+    @pytest.mark.django_db
+    def test_incoming_match_requests_etag(
+        self, client, mentor_token, mentee_token, mentor_user, mentee_user
+    ):
+        """버전 카운터 기반 ETag로 304 응답"""
+        response = client.get(
+            "/api/match-requests/incoming", HTTP_AUTHORIZATION=f"Bearer {mentor_token}"
+        )
+        etag = response["ETag"]
+
+        response = client.get(
+            "/api/match-requests/incoming",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+        # 새 요청이 생기면 버전이 바뀌어 전체 목록을 다시 받음
+        client.post(
+            "/api/match-requests",
+            json.dumps(
+                {
+                    "mentorId": mentor_user.id,
+                    "menteeId": mentee_user.id,
+                    "message": "안녕하세요",
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        response = client.get(
+            "/api/match-requests/incoming",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert len(response.json()) == 1
+
+    @pytest.mark.django_db
+    def test_incoming_etag_changes_when_counterpart_profile_changes(
+        self, client, mentor_token, mentee_token, mentor_user, mentee_user
+    ):
+        """요청 목록에 포함된 상대방 이름이 바뀌면 304 대신 새 목록"""
+        from .models import MatchRequest
+
+        MatchRequest.objects.create(
+            mentor=mentor_user, mentee=mentee_user, message="요청"
+        )
+        response = client.get(
+            "/api/match-requests/incoming", HTTP_AUTHORIZATION=f"Bearer {mentor_token}"
+        )
+        etag = response["ETag"]
+
+        client.put(
+            "/api/profile",
+            json.dumps({"name": "새이름", "bio": "소개", "role": "mentee"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        response = client.get(
+            "/api/match-requests/incoming",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 200
+        assert response.json()[0]["counterpart"]["name"] == "새이름"
+
+        # 이름/이미지가 그대로면 버전도 그대로
+        etag = response["ETag"]
+        client.put(
+            "/api/profile",
+            json.dumps({"name": "새이름", "bio": "다른 소개", "role": "mentee"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        response = client.get(
+            "/api/match-requests/incoming",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 304
+
+    @pytest.mark.django_db
+    def test_match_request_changes(
+        self, client, mentee_token, mentor_token, mentor_user, mentee_user
+    ):
+        """변경 로그 위치를 받은 뒤 그 이후 변경분만 조회"""
+        response = client.get(
+            "/api/match-requests/changes", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert response.status_code == 200
+        start = response.json()["lastSeq"]
+
+        request_id = client.post(
+            "/api/match-requests",
+            json.dumps(
+                {
+                    "mentorId": mentor_user.id,
+                    "menteeId": mentee_user.id,
+                    "message": "요청",
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        ).json()["id"]
+        client.put(
+            f"/api/match-requests/{request_id}/accept",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+
+        response = client.get(
+            f"/api/match-requests/changes?after={start}",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(e["id"], e["status"]) for e in data["events"]] == [
+            (request_id, "pending"),
+            (request_id, "accepted"),
+        ]
+        assert data["hasMore"] is False
+
+        response = client.get(
+            f"/api/match-requests/changes?after={data['lastSeq']}",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.json()["events"] == []
+
+        response = client.get(
+            "/api/match-requests/changes?after=-1",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.django_db
+    def test_match_request_history(
+        self, client, mentee_token, mentor_user, mentee_user
+    ):
+        """보관된 요청은 요청함에서 빠지고 이력으로 조회"""
+        from django.utils import timezone
+
+        from .models import MatchRequest
+        from .services import MatchRequestArchiveService
+
+        match_request = MatchRequest.objects.create(
+            mentor=mentor_user, mentee=mentee_user, message="요청", status="cancelled"
+        )
+        MatchRequestArchiveService.archive_batch(timezone.now(), 100)
+
+        response = client.get(
+            "/api/match-requests/outgoing", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert response.json() == []
+
+        response = client.get(
+            "/api/match-requests/history", HTTP_AUTHORIZATION=f"Bearer {mentee_token}"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data] == [match_request.id]
+        assert data[0]["status"] == "cancelled"
+        assert data[0]["counterpart"]["id"] == mentor_user.id
+
+    @pytest.mark.django_db
+    def test_match_request_stats(
+        self, client, mentee_token, mentor_token, mentor_user, mentee_user
+    ):
+        """상태별 요청 수 조회"""
+        response = client.post(
+            "/api/match-requests",
+            json.dumps(
+                {
+                    "mentorId": mentor_user.id,
+                    "menteeId": mentee_user.id,
+                    "message": "요청",
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+
+        response = client.get(
+            "/api/match-requests/stats", HTTP_AUTHORIZATION=f"Bearer {mentor_token}"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "pending": 1,
+            "accepted": 0,
+            "rejected": 0,
+            "cancelled": 0,
+            "acceptedTotal": 0,
+        }
+
+    @pytest.mark.django_db
+    def test_bulk_reject_match_requests(self, client, mentor_token, mentor_user):
+        """여러 요청 일괄 거절 및 id별 결과"""
+        from .models import MatchRequest
+
+        ids = []
+        for i in range(3):
+            mentee = User.objects.create_user(
+                email=f"mentee{i}@example.com", password="testpass123", role="mentee"
+            )
+            ids.append(
+                MatchRequest.objects.create(
+                    mentor=mentor_user, mentee=mentee, message="요청"
+                ).id
+            )
+
+        response = client.post(
+            "/api/match-requests/bulk",
+            json.dumps({"ids": ids[:2] + [999], "action": "reject"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": ids[0], "status": "rejected", "error": None},
+            {"id": ids[1], "status": "rejected", "error": None},
+            {"id": 999, "status": None, "error": "Match request not found"},
+        ]
+        statuses = dict(MatchRequest.objects.values_list("id", "status"))
+        assert statuses[ids[2]] == "pending"
+
+    @pytest.mark.django_db
+    def test_bulk_accept_only_one(self, client, mentor_token, mentor_user):
+        """일괄 수락 시 첫 번째 대기 요청만 수락되고 나머지는 거절"""
+        from .models import MatchRequest
+
+        ids = []
+        for i in range(2):
+            mentee = User.objects.create_user(
+                email=f"mentee{i}@example.com", password="testpass123", role="mentee"
+            )
+            ids.append(
+                MatchRequest.objects.create(
+                    mentor=mentor_user, mentee=mentee, message="요청"
+                ).id
+            )
+
+        response = client.post(
+            "/api/match-requests/bulk",
+            json.dumps({"ids": ids, "action": "accept"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+
+        results = response.json()["results"]
+        assert results[0] == {"id": ids[0], "status": "accepted", "error": None}
+        assert results[1]["status"] == "rejected"
+        assert results[1]["error"]
+
+    @pytest.mark.django_db
+    def test_bulk_accept_tries_next_pending(
+        self, client, mentor_token, mentor_user, monkeypatch
+    ):
+        """일괄 수락에서 첫 요청 수락이 실패하면 다음 대기 요청을 수락"""
+        from .models import MatchRequest
+        from .services import MatchRequestService
+
+        ids = []
+        for i in range(3):
+            mentee = User.objects.create_user(
+                email=f"mentee{i}@example.com", password="testpass123", role="mentee"
+            )
+            ids.append(
+                MatchRequest.objects.create(
+                    mentor=mentor_user, mentee=mentee, message="요청"
+                ).id
+            )
+        accept = MatchRequestService.accept_match_request
+
+        def flaky_accept(mentor, request_id):
+            if request_id == ids[0]:
+                raise ValueError("수락 실패")
+            return accept(mentor, request_id)
+
+        monkeypatch.setattr(
+            MatchRequestService, "accept_match_request", staticmethod(flaky_accept)
+        )
+        response = client.post(
+            "/api/match-requests/bulk",
+            json.dumps({"ids": ids, "action": "accept"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+
+        assert response.json()["results"] == [
+            {"id": ids[0], "status": "rejected", "error": "수락 실패"},
+            {"id": ids[1], "status": "accepted", "error": None},
+            {
+                "id": ids[2],
+                "status": "rejected",
+                "error": "한 명의 멘티만 수락할 수 있습니다.",
+            },
+        ]
+        statuses = dict(MatchRequest.objects.values_list("id", "status"))
+        assert [statuses[id_] for id_ in ids] == ["rejected", "accepted", "rejected"]
+
+    @pytest.mark.django_db
+    def test_bulk_cancel_match_requests(
+        self, client, mentee_token, mentor_token, mentor_user, mentee_user
+    ):
+        """일괄 취소는 멘티만, 이미 거절된 요청은 취소 불가"""
+        from .models import MatchRequest
+
+        match_request = MatchRequest.objects.create(
+            mentor=mentor_user, mentee=mentee_user, message="요청", status="rejected"
+        )
+        payload = json.dumps({"ids": [match_request.id], "action": "cancel"})
+
+        response = client.post(
+            "/api/match-requests/bulk",
+            payload,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentor_token}",
+        )
+        assert response.status_code == 403
+
+        response = client.post(
+            "/api/match-requests/bulk",
+            payload,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status"] == "rejected"
+        assert "이미 취소되었거나 거절된" in response.json()["results"][0]["error"]
+
+    @pytest.mark.django_db
+    def test_solve_match_requests_admin_only(
+        self, client, mentee_token, mentor_user, mentee_user
+    ):
+        """일괄 배정은 관리자만, 기본은 dry run"""
+        from .models import MatchRequest
+
+        match_request = MatchRequest.objects.create(
+            mentor=mentor_user, mentee=mentee_user, message="요청"
+        )
+        url = "/api/admin/match-requests/solve"
+
+        response = client.post(
+            url,
+            json.dumps({"dryRun": False}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 403
+
+        User.objects.filter(id=mentee_user.id).update(is_staff=True)
+        response = client.post(
+            url,
+            json.dumps({}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dryRun"] is True
+        assert data["matched"] == 1
+        assert data["pairs"] == [
+            {
+                "id": match_request.id,
+                "mentorId": mentor_user.id,
+                "menteeId": mentee_user.id,
+            }
+        ]
+        match_request.refresh_from_db()
+        assert match_request.status == "pending"
+
+        response = client.post(
+            url,
+            json.dumps({"dryRun": False}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        match_request.refresh_from_db()
+        assert match_request.status == "accepted"
+
     @pytest.mark.django_db
     def test_match_request_not_found(self, client, mentor_token):
         """존재하지 않는 매칭 요청 처리"""
@@ -396,3 +1021,91 @@ class TestMatchRequest:
 
         assert response.status_code == 404
         assert "Match request not found" in response.json()["error"]
+
+    @pytest.mark.django_db
+    def test_match_request_events_unauthorized(self, client):
+        """토큰 없이 이벤트 스트림 구독 불가"""
+        response = client.get("/api/match-requests/events")
+
+        assert response.status_code == 401
+
+    @pytest.mark.django_db
+    def test_match_request_events_ticket(self, client, mentee_token):
+        """쿼리로는 JWT 대신 1회용 티켓만 받는다"""
+        response = client.get(f"/api/match-requests/events?token={mentee_token}")
+        assert response.status_code == 401
+
+        response = client.post(
+            "/api/match-requests/events/ticket",
+            HTTP_AUTHORIZATION=f"Bearer {mentee_token}",
+        )
+        assert response.status_code == 200
+        ticket = response.json()["ticket"]
+        assert response.json()["expiresIn"] == 60
+
+        # WSGI에서는 무한 스트림을 내려줄 수 없으므로 503 (티켓은 사용됨)
+        response = client.get(f"/api/match-requests/events?ticket={ticket}")
+        assert response.status_code == 503
+        response = client.get(f"/api/match-requests/events?ticket={ticket}")
+        assert response.status_code == 401
+
+    @pytest.mark.django_db
+    def test_match_request_events_ticket_expires(self, mentee_user):
+        """만료된 티켓은 거부되고 다음 발급 때 정리된다"""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from .models import EventStreamTicket
+        from .services import EventTicketService
+
+        key = EventTicketService.issue(mentee_user)["ticket"]
+        EventStreamTicket.objects.update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        assert EventTicketService.redeem(key) is None
+
+        EventTicketService.issue(mentee_user)
+        assert not EventStreamTicket.objects.filter(key=key).exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_match_request_events_stream(settings, mentee_user, mentee_token):
+    """ASGI에서 하트비트와 이벤트를 SSE 형식으로 스트리밍"""
+    import asyncio
+
+    from asgiref.sync import async_to_sync
+    from django.test import AsyncClient
+
+    from .events import hub
+
+    settings.MATCH_EVENTS_HEARTBEAT = 0.01
+
+    async def scenario():
+        response = await AsyncClient().get(
+            "/api/match-requests/events",
+            headers={"Authorization": f"Bearer {mentee_token}"},
+        )
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+
+        stream = aiter(response.streaming_content)
+        assert (await anext(stream)).startswith(b"retry:")
+        assert await anext(stream) == b": ping\n\n"
+
+        hub.dispatch([mentee_user.id], {"type": "match_request", "id": 7})
+        chunk = b""
+        while not chunk.startswith(b"event:"):
+            chunk = await asyncio.wait_for(anext(stream), 1)
+        assert chunk.startswith(b"event: match_request\n")
+        assert json.loads(chunk.split(b"data: ", 1)[1])["id"] == 7
+
+        # 연결이 끊기면 ASGI 핸들러가 응답 태스크를 취소한다
+        reader = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        reader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await reader
+        assert hub.connection_count(mentee_user.id) == 0
+
+    async_to_sync(scenario)()
@@ -0,0 +1,62 @@
+import pytest
+
+
+@pytest.mark.parametrize("worker_class", ["asgi", "wsgi"])
+def test_serve_command_recycles_reloads_and_drains(settings, worker_class):
+    """프리포크 서버: 요청 수 제한 교체, SIGHUP 재시작, SIGTERM 정상 종료"""
+    import re
+    import signal
+    import subprocess
+    import sys
+    import urllib.request
+
+    process = subprocess.Popen(
+        [sys.executable, "manage.py", "serve", "--port", "0", "--workers", "2"]
+        + ["--max-requests", "2", "--max-requests-jitter", "0"]
+        + ["--worker-class", worker_class],
+        cwd=settings.BASE_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+    def wait_for(pattern):
+        for line in process.stdout:
+            match = re.search(pattern, line)
+            if match:
+                return match
+        raise AssertionError(f"출력에 {pattern!r} 없음")
+
+    try:
+        port = int(wait_for(r":(\d+) 에서 대기").group(1))
+        wait_for(r"\[worker \d+\] 준비 완료 [\d.]+ms")
+        wait_for(r"\[worker \d+\] 준비 완료")
+        for _ in range(5):
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/hello") as r:
+                assert r.status == 200
+        wait_for(r"교체 \(요청 수 제한\)")
+
+        process.send_signal(signal.SIGHUP)
+        wait_for(r"재시작: 워커 2개 교체")
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/hello") as r:
+            assert r.status == 200
+
+        process.send_signal(signal.SIGTERM)
+        wait_for("종료 완료")
+        assert process.wait(10) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+
+
+def test_serve_uses_shared_events_backend_with_workers(settings):
+    """워커가 여럿이면 LocalBackend 대신 워커 사이에 공유되는 백엔드 사용"""
+    from .management.commands.serve import select_events_backend
+
+    settings.MATCH_EVENTS_BACKEND = "api.events.LocalBackend"
+    assert select_events_backend(1) is None
+    assert select_events_backend(4) == "api.events.SQLitePollingBackend"
+    # 직접 지정한 백엔드는 그대로
+    settings.MATCH_EVENTS_BACKEND = "custom.Backend"
+    assert select_events_backend(4) is None
@@ -0,0 +1,76 @@
+import pytest
+from django.test import Client
+
+from .models import User
+from .services import AuthService
+
+
+@pytest.mark.django_db
+def test_request_profile_capture(settings, tmp_path):
+    """서명된 X-Profile 요청만 프로파일/SQL을 링에 남기고 커맨드로 조회"""
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from .profiling import store
+
+    settings.PROFILING_DIR = tmp_path
+    settings.PROFILING_MAX_CAPTURES = 2
+    mentee = User.objects.create(email="mentee@example.com", name="멘티", role="mentee")
+    auth = {"HTTP_AUTHORIZATION": f"Bearer {AuthService.create_jwt_token(mentee)}"}
+    client = Client()
+
+    out = StringIO()
+    call_command("request_profiles", "--token", "--issuer", "ops", stdout=out)
+    token = out.getvalue().strip()
+
+    # 플래그가 없거나 서명이 틀리면 캡처하지 않는다
+    assert "X-Profile-Id" not in client.get("/api/mentors", **auth)
+    response = client.get("/api/mentors", HTTP_X_PROFILE=token + "x", **auth)
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response
+    assert store.ids() == []
+
+    first = client.get("/api/mentors", HTTP_X_PROFILE=token, **auth)["X-Profile-Id"]
+    second = client.get(f"/api/me?__profile={token}", **auth)["X-Profile-Id"]
+    third = client.get("/api/mentors", HTTP_X_PROFILE=token, **auth)["X-Profile-Id"]
+    # 최근 PROFILING_MAX_CAPTURES개만 남는다
+    assert store.ids() == [second, third]
+    assert not (tmp_path / f"{first}.prof").exists()
+
+    meta = store.load(second)
+    assert (meta["method"], meta["path"], meta["status"]) == ("GET", "/api/me", 200)
+    assert meta["issuer"] == "ops"
+    assert meta["query_count"] == len(meta["queries"]) > 0
+    assert any("api_user" in query["sql"] for query in meta["queries"])
+    # 사용자 데이터(이메일 등) 파라미터는 캡처 파일에 남지 않는다
+    captured = (tmp_path / f"{second}.json").read_text()
+    assert "mentee@example.com" not in captured
+    assert mentee.id in [p for q in meta["queries"] for p in q["params"] or []]
+
+    out = StringIO()
+    call_command("request_profiles", stdout=out)
+    lines = out.getvalue().splitlines()
+    assert lines[1].startswith(third) and lines[2].startswith(second)
+
+    out = StringIO()
+    call_command("request_profiles", second, "--limit", "5", "--sql", stdout=out)
+    assert "GET /api/me -> 200" in out.getvalue()
+    assert "function calls" in out.getvalue()
+    assert "api_user" in out.getvalue()
+
+
+def test_redact_params():
+    """숫자/불리언/None만 남기고 문자열·바이트 파라미터는 가림"""
+    from .profiling import _redact_params
+
+    assert _redact_params(None) is None
+    assert _redact_params([1, 2.5, True, None, "ticket-key", b"\x00"]) == [
+        1,
+        2.5,
+        True,
+        None,
+        "<redacted>",
+        "<redacted>",
+    ]
+    assert _redact_params({"key": "secret", "id": 3}) == {"key": "<redacted>", "id": 3}
@@ -0,0 +1,303 @@
+"""
+엔드포인트/서비스 메서드별 쿼리 예산과 실행 계획 테스트
+
+ROUTE_BUDGETS에 모든 API 경로의 최대 쿼리 수를 적어 둔다. 목록 조회는 결과 행 수와
+상관없이 쿼리 수가 일정해야 하므로 요청/멘토를 여러 개 만들어 두고 호출한다.
+새 경로를 추가하면 test_budget_table_covers_every_route가 실패하므로 예산도 함께 적는다.
+SAVEPOINT/RELEASE도 DB 왕복이므로 assertNumQueries와 같이 센다.
+"""
+
+import base64
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from .api import api
+from .models import MatchRequest, Profile, Skill, User
+from .query_budget import QueryBudget, scanned_table, table_aliases
+from .services import (
+    AuthService,
+    MatchRequestArchiveService,
+    MatchRequestService,
+    MentorService,
+)
+from .skill_index import skill_index
+
+# (메서드, OpenAPI 경로) -> 최대 쿼리 수
+ROUTE_BUDGETS = {
+    ("GET", "/api/hello"): 0,
+    ("POST", "/api/login"): 1,
+    ("POST", "/api/signup"): 2,
+    ("GET", "/api/me"): 3,
+    ("PUT", "/api/profile"): 18,
+    ("GET", "/api/images/{role}/{user_id}"): 3,
+    ("GET", "/api/mentors"): 4,
+    ("GET", "/api/mentors/recommended"): 9,
+    ("GET", "/api/mentors/facets"): 4,
+    ("POST", "/api/match-requests"): 13,
+    ("GET", "/api/match-requests/incoming"): 3,
+    ("GET", "/api/match-requests/outgoing"): 3,
+    ("GET", "/api/match-requests/stats"): 2,
+    ("GET", "/api/match-requests/history"): 2,
+    ("GET", "/api/match-requests/changes"): 2,
+    ("POST", "/api/match-requests/events/ticket"): 3,
+    ("PUT", "/api/match-requests/{request_id}/accept"): 19,
+    ("PUT", "/api/match-requests/{request_id}/reject"): 10,
+    ("DELETE", "/api/match-requests/{request_id}"): 10,
+    ("POST", "/api/match-requests/bulk"): 11,
+    ("POST", "/api/admin/match-requests/solve"): 21,
+}
+
+MENTORS = 4
+MENTEES = 5
+
+
+@pytest.fixture
+def dataset():
+    """멘토 여러 명(스킬 포함), 멘티 여러 명, 첫 멘토에게 들어온 대기 요청"""
+    skills = [Skill.objects.create(name=name) for name in ["React", "Vue", "Django"]]
+    mentors = []
+    for index in range(MENTORS):
+        user = User.objects.create(
+            email=f"mentor{index}@example.com", name=f"멘토{index}", role="mentor"
+        )
+        profile = Profile.objects.create(
+            user=user, bio="멘토입니다", image_data=b"\xff\xd8image"
+        )
+        profile.skills.add(*skills[: index % 3 + 1])
+        mentors.append(user)
+    mentees = []
+    for index in range(MENTEES):
+        user = User.objects.create(
+            email=f"mentee{index}@example.com", name=f"멘티{index}", role="mentee"
+        )
+        Profile.objects.create(user=user, bio="멘티입니다")
+        mentees.append(user)
+    mentees[0].set_password("testpass123")
+    mentees[0].save()
+    staff = User.objects.create(
+        email="staff@example.com", name="관리자", role="mentor", is_staff=True
+    )
+
+    # 첫 멘티는 요청 없이 남겨 두고 나머지는 첫 멘토에게 요청
+    requests = [
+        MatchRequestService.create_match_request(mentee, mentors[0].id, "요청")
+        for mentee in mentees[1:]
+    ]
+    # 스킬 인덱스는 MENTOR_SKILLS 버전이 바뀔 때 한 번만 다시 만든다.
+    # 예산은 인덱스가 최신인 상태 기준이므로 미리 채워 둔다 (테스트 순서와 무관하게)
+    skill_index.ensure_loaded()
+    return {
+        "mentors": mentors,
+        "mentees": mentees,
+        "staff": staff,
+        "requests": [item["id"] for item in requests],
+    }
+
+
+def _scenario(route, data):
+    """경로별 (호출자, 실제 경로, 본문, 기대 상태 코드)"""
+    mentor, mentee = data["mentors"][0], data["mentees"][1]
+    request_id = data["requests"][0]
+    return {
+        ("GET", "/api/hello"): (None, "/api/hello", None, 200),
+        ("POST", "/api/login"): (
+            None,
+            "/api/login",
+            {"email": "mentee0@example.com", "password": "testpass123"},
+            200,
+        ),
+        ("POST", "/api/signup"): (
+            None,
+            "/api/signup",
+            {
+                "email": "new@example.com",
+                "password": "testpass123",
+                "name": "새 멘티",
+                "role": "mentee",
+            },
+            201,
+        ),
+        ("GET", "/api/me"): (mentor, "/api/me", None, 200),
+        ("PUT", "/api/profile"): (
+            mentor,
+            "/api/profile",
+            {
+                "id": mentor.id,
+                "name": "김멘토",
+                "role": "mentor",
+                "bio": "소개",
+                "image": base64.b64encode(b"\xff\xd8new").decode(),
+                "skills": ["React", "Go"],
+            },
+            200,
+        ),
+        ("GET", "/api/images/{role}/{user_id}"): (
+            mentee,
+            f"/api/images/mentor/{mentor.id}",
+            None,
+            200,
+        ),
+        ("GET", "/api/mentors"): (mentee, "/api/mentors", None, 200),
+        ("GET", "/api/mentors/recommended"): (
+            mentee,
+            "/api/mentors/recommended",
+            None,
+            200,
+        ),
+        ("GET", "/api/mentors/facets"): (
+            mentee,
+            "/api/mentors/facets?skills=React",
+            None,
+            200,
+        ),
+        ("POST", "/api/match-requests"): (
+            data["mentees"][0],
+            "/api/match-requests",
+            {"mentorId": data["mentors"][1].id, "menteeId": 0, "message": "요청"},
+            200,
+        ),
+        ("GET", "/api/match-requests/incoming"): (
+            mentor,
+            "/api/match-requests/incoming",
+            None,
+            200,
+        ),
+        ("GET", "/api/match-requests/outgoing"): (
+            mentee,
+            "/api/match-requests/outgoing",
+            None,
+            200,
+        ),
+        ("GET", "/api/match-requests/stats"): (
+            mentor,
+            "/api/match-requests/stats",
+            None,
+            200,
+        ),
+        ("GET", "/api/match-requests/history"): (
+            mentor,
+            "/api/match-requests/history",
+            None,
+            200,
+        ),
+        ("GET", "/api/match-requests/changes"): (
+            mentor,
+            "/api/match-requests/changes?after=0",
+            None,
+            200,
+        ),
+        ("POST", "/api/match-requests/events/ticket"): (
+            mentee,
+            "/api/match-requests/events/ticket",
+            None,
+            200,
+        ),
+        ("PUT", "/api/match-requests/{request_id}/accept"): (
+            mentor,
+            f"/api/match-requests/{request_id}/accept",
+            None,
+            200,
+        ),
+        ("PUT", "/api/match-requests/{request_id}/reject"): (
+            mentor,
+            f"/api/match-requests/{request_id}/reject",
+            None,
+            200,
+        ),
+        ("DELETE", "/api/match-requests/{request_id}"): (
+            mentee,
+            f"/api/match-requests/{request_id}",
+            None,
+            200,
+        ),
+        ("POST", "/api/match-requests/bulk"): (
+            mentor,
+            "/api/match-requests/bulk",
+            {"ids": data["requests"], "action": "reject"},
+            200,
+        ),
+        ("POST", "/api/admin/match-requests/solve"): (
+            data["staff"],
+            "/api/admin/match-requests/solve",
+            {"dryRun": False},
+            200,
+        ),
+    }[route]
+
+
+def test_budget_table_covers_every_route():
+    routes = {
+        (method.upper(), path)
+        for path, operations in api.get_openapi_schema()["paths"].items()
+        for method in operations
+    }
+    assert routes == set(ROUTE_BUDGETS)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("route", list(ROUTE_BUDGETS), ids=" ".join)
+def test_route_query_budget(route, dataset):
+    user, path, body, expected_status = _scenario(route, dataset)
+    headers = {}
+    if user is not None:
+        headers["HTTP_AUTHORIZATION"] = f"Bearer {AuthService.create_jwt_token(user)}"
+    client = Client()
+    call = getattr(client, route[0].lower())
+
+    with QueryBudget(ROUTE_BUDGETS[route], " ".join(route)):
+        if body is None:
+            response = call(path, **headers)
+        else:
+            response = call(path, body, content_type="application/json", **headers)
+
+    assert response.status_code == expected_status, response.content
+
+
+@pytest.mark.django_db
+def test_service_query_budget(dataset, query_budget):
+    mentor, mentee = dataset["mentors"][0], dataset["mentees"][1]
+
+    # 목록 크기와 상관없이 쿼리 수가 일정해야 한다 (N+1 방지)
+    with query_budget(2, "MatchRequestService.get_incoming_match_requests"):
+        incoming = MatchRequestService.get_incoming_match_requests(mentor)
+    assert len(incoming) == MENTEES - 1
+
+    with query_budget(2, "MatchRequestService.get_outgoing_match_requests"):
+        MatchRequestService.get_outgoing_match_requests(mentee)
+
+    @query_budget(2, "MentorService.get_mentors")
+    def list_mentors():
+        return MentorService.get_mentors()
+
+    assert len(list_mentors()) == MENTORS
+    # 데코레이터는 호출마다 새로 센다
+    assert len(list_mentors()) == MENTORS
+
+    # 보관 대상은 (status, updated_at) 인덱스로 고르고 트랜잭션 안에서는 id로만 조회
+    cutoff = timezone.now() - timedelta(days=1)
+    MatchRequest.objects.filter(id=dataset["requests"][0]).update(
+        status="rejected", updated_at=cutoff - timedelta(days=1)
+    )
+    with query_budget(8, "MatchRequestArchiveService.archive_batch"):
+        assert MatchRequestArchiveService.archive_batch(cutoff, 100) == 1
+
+
+@pytest.mark.django_db
+def test_query_budget_reports_overrun_and_full_scan(dataset):
+    with pytest.raises(AssertionError, match="쿼리 2개 실행"), QueryBudget(1, "N+1"):
+        for request_id in dataset["requests"][:2]:
+            MatchRequest.objects.get(id=request_id)
+
+    # message에는 인덱스가 없으므로 api_matchrequest 전체 스캔
+    with pytest.raises(AssertionError, match="SCAN api_matchrequest"), QueryBudget(5):
+        list(MatchRequest.objects.filter(message="요청"))
+
+    # 서브쿼리 별칭(U0)도 원래 테이블 이름으로 판정
+    sql = 'SELECT 1 FROM "api_profile" WHERE EXISTS(SELECT 1 FROM "api_user" U0)'
+    assert table_aliases(sql) == {"U0": "api_user"}
+    assert scanned_table("SCAN U0", table_aliases(sql)) == "api_user"
+    assert scanned_table("SCAN api_user USING INDEX api_user_role") == ""
+    assert scanned_table("SEARCH api_user USING INTEGER PRIMARY KEY (rowid=?)") == ""
@@ -1,13 +1,18 @@
+import sqlite3
+from contextlib import contextmanager
+
 import pytest
 from django.test import Client
 
 from .models import User, Profile, Skill, MatchRequest
 from .services import (
     AuthService,
+    DataVersionService,
     ProfileService,
     MentorService,
     MatchRequestService,
 )
+from .skill_index import skill_index
 
 
 @pytest.mark.django_db
@@ -271,6 +276,169 @@ class TestMentorService:
         assert mentors[0]["id"] == mentor1.id
         assert "Python" in mentors[0]["profile"]["skills"]
 
+    def _create_mentor(self, email, skill_names):
+        mentor = User.objects.create_user(
+            email=email, password="password123", name=email, role="mentor"
+        )
+        profile = Profile.objects.create(user=mentor, bio="")
+        for name in skill_names:
+            skill, _ = Skill.objects.get_or_create(name=name)
+            profile.skills.add(skill)
+        return mentor
+
+    def test_get_mentors_with_multi_skill_query(self):
+        """비트맵 인덱스 기반 다중 스킬 AND/OR 검색 테스트"""
+        skill_index.reset()
+        django_mentor = self._create_mentor("a@example.com", ["Python", "Django"])
+        python_mentor = self._create_mentor("b@example.com", ["Python"])
+        react_mentor = self._create_mentor("c@example.com", ["React"])
+
+        mentors = MentorService.get_mentors(skills=["python", "Django"], match="all")
+        assert [m["id"] for m in mentors] == [django_mentor.id]
+
+        mentors = MentorService.get_mentors(skills=["Django", "React"], match="any")
+        assert [m["id"] for m in mentors] == [django_mentor.id, react_mentor.id]
+
+        mentors = MentorService.get_mentors(skills=["Python", "Go"], match="all")
+        assert mentors == []
+
+        facets = MentorService.get_skill_facets(skills=["Python"])
+        assert facets["total"] == 2
+        assert facets["skills"] == [
+            {"name": "Python", "count": 2},
+            {"name": "Django", "count": 1},
+        ]
+        assert python_mentor.id in [
+            m["id"] for m in MentorService.get_mentors(skills=["Python"])
+        ]
+
+    def test_skill_index_incremental_update(self, django_capture_on_commit_callbacks):
+        """프로필 스킬 변경 시 인덱스 증분 갱신 테스트"""
+        skill_index.reset()
+        mentor = self._create_mentor("a@example.com", ["Python"])
+        assert MentorService.get_skill_facets()["skills"] == [
+            {"name": "Python", "count": 1}
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProfileService.update_profile(
+                mentor, {"name": "멘토", "bio": "", "skills": ["Go", "Rust"]}
+            )
+
+        assert MentorService.get_skill_facets()["skills"] == [
+            {"name": "Go", "count": 1},
+            {"name": "Rust", "count": 1},
+        ]
+        assert MentorService.get_mentors(skills=["Python"]) == []
+        assert [m["id"] for m in MentorService.get_mentors(skills=["Rust"])] == [
+            mentor.id
+        ]
+
+    def test_skill_index_follows_mentor_skills_version(
+        self, django_capture_on_commit_callbacks
+    ):
+        """다른 워커의 변경(시그널 없음)은 MENTOR_SKILLS 버전이 바뀌면 반영"""
+        skill_index.reset()
+        mentor = self._create_mentor("a@example.com", ["Python"])
+        assert MentorService.get_skill_facets()["total"] == 1
+
+        # bulk_create는 시그널을 보내지 않는다 (다른 프로세스에서 바뀐 것과 같음)
+        go = Skill.objects.create(name="Go")
+        Profile.skills.through.objects.bulk_create(
+            [Profile.skills.through(profile_id=mentor.profile.id, skill_id=go.id)]
+        )
+        assert MentorService.get_mentors(skills=["Go"]) == []
+
+        DataVersionService.bump(DataVersionService.MENTOR_SKILLS)
+        assert [m["id"] for m in MentorService.get_mentors(skills=["Go"])] == [
+            mentor.id
+        ]
+
+        # 비트 위치는 가장 작은 멘토 id 기준이라 id 크기와 상관없이 작다
+        assert skill_index._mentors.bit_length() == 1
+        with django_capture_on_commit_callbacks(execute=True):
+            later = self._create_mentor("b@example.com", ["Go"])
+        assert skill_index._mentors.bit_length() == later.id - mentor.id + 1
+        total, _ = skill_index.facets(["Go"])
+        assert total == 2
+
+    def test_skill_index_local_update_skips_rebuild(
+        self, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        """같은 프로세스의 스킬 수정은 증분 반영하고 버전만 따라가서 재구성하지 않음"""
+        from django.db.models import F
+
+        from .models import DataVersion
+
+        skill_index.reset()
+        mentor = self._create_mentor("a@example.com", ["Python"])
+        assert MentorService.get_skill_facets()["total"] == 1
+
+        builds = []
+        original_build = skill_index._build
+        monkeypatch.setattr(
+            skill_index,
+            "_build",
+            lambda version: builds.append(version) or original_build(version),
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            ProfileService.update_profile(
+                mentor, {"name": "멘토", "bio": "", "skills": ["Go"]}
+            )
+        assert [m["id"] for m in MentorService.get_mentors(skills=["Go"])] == [
+            mentor.id
+        ]
+        assert MentorService.get_mentors(skills=["Python"]) == []
+        assert builds == []
+
+        # 다른 워커가 버전을 올리면 (이 프로세스의 시그널 없음) 다음 조회에서 재구성
+        DataVersion.objects.filter(key=DataVersionService.MENTOR_SKILLS).update(
+            version=F("version") + 1
+        )
+        MentorService.get_mentors(skills=["Go"])
+        assert len(builds) == 1
+
+    def test_recommend_mentors(self, django_capture_on_commit_callbacks):
+        """프로필/요청 이력과 가까운 멘토 순 추천, 변경된 멘토만 증분 반영"""
+        from .recommender import recommender
+
+        recommender.reset()
+        react_mentor = self._create_mentor("a@example.com", ["React", "TypeScript"])
+        django_mentor = self._create_mentor("b@example.com", ["Django", "Python"])
+        busy_mentor = self._create_mentor("c@example.com", ["React"])
+        Profile.objects.filter(user=busy_mentor).update(is_available=False)
+        mentee = User.objects.create_user(
+            email="mentee@example.com",
+            password="password123",
+            name="멘티",
+            role="mentee",
+        )
+        profile = Profile.objects.create(user=mentee, bio="React 프론트엔드 공부 중")
+        profile.skills.add(Skill.objects.get(name="React"))
+
+        result = MentorService.recommend_mentors(mentee, limit=2)
+        assert [m["id"] for m in result] == [react_mentor.id, django_mentor.id]
+        assert result[0]["score"] > result[1]["score"]
+        assert result[0]["profile"]["skills"] == ["React", "TypeScript"]
+
+        # 대기 중인 요청을 보낸 멘토는 제외
+        MatchRequestService.create_match_request(mentee, react_mentor.id, "요청")
+        result = MentorService.recommend_mentors(mentee, limit=2)
+        assert [m["id"] for m in result] == [django_mentor.id]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProfileService.update_profile(
+                django_mentor,
+                {"name": "멘토", "bio": "React 멘토", "skills": ["React"]},
+            )
+        new_mentor = self._create_mentor("d@example.com", ["React"])
+        recommender.mark_dirty(new_mentor.id)
+        result = MentorService.recommend_mentors(mentee, limit=5)
+        assert {m["id"] for m in result} == {django_mentor.id, new_mentor.id}
+
+        with pytest.raises(ValueError):
+            MentorService.recommend_mentors(mentee, limit=0)
+
 
 @pytest.mark.django_db
 class TestMatchRequestService:
@@ -317,6 +485,74 @@ class TestMatchRequestService:
                 message="도움을 요청합니다.",
             )
 
+    def test_create_match_request_reopens_cancelled(self):
+        """취소된 요청이 있으면 같은 행을 대기 상태로 다시 연다"""
+        mentor, requests = self._create_pending_requests(1)
+        mentee = requests[0].mentee
+        MatchRequest.objects.filter(id=requests[0].id).update(status="cancelled")
+
+        response_data = MatchRequestService.create_match_request(
+            mentee=mentee, mentor_id=mentor.id, message="다시 요청합니다."
+        )
+
+        assert response_data["id"] == requests[0].id
+        assert response_data["status"] == "pending"
+        requests[0].refresh_from_db()
+        assert requests[0].status == "pending"
+        assert requests[0].message == "다시 요청합니다."
+
+    def test_create_match_request_duplicate(self):
+        """대기/수락 상태 요청이 있으면 400 메시지로 실패"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        mentor, requests = self._create_pending_requests(1)
+        mentee = requests[0].mentee
+
+        with (
+            CaptureQueriesContext(connection) as captured,
+            pytest.raises(ValueError, match="이미 해당 멘토에게 요청을 보냈습니다"),
+        ):
+            MatchRequestService.create_match_request(
+                mentee=mentee, mentor_id=mentor.id, message="또 요청"
+            )
+        # 멘토 확인과 기존 요청 상태 조회를 한 번에 (SAVEPOINT 제외)
+        statements = [
+            query["sql"]
+            for query in captured.captured_queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE", "ROLLBACK"))
+        ]
+        assert len(statements) == 1
+
+        MatchRequest.objects.filter(id=requests[0].id).update(status="accepted")
+        with pytest.raises(ValueError, match="이미 해당 멘토와 매칭이 완료되었습니다"):
+            MatchRequestService.create_match_request(
+                mentee=mentee, mentor_id=mentor.id, message="또 요청"
+            )
+        assert MatchRequest.objects.count() == 1
+
+    def test_create_match_request_one_pending_per_mentee(self):
+        """멘티는 대기 중인 요청을 하나만 가질 수 있음 (부분 유니크 인덱스)"""
+        from django.db import IntegrityError, transaction
+
+        _, requests = self._create_pending_requests(1)
+        other_mentor = User.objects.create_user(
+            email="other@example.com",
+            password="password123",
+            name="다른멘토",
+            role="mentor",
+        )
+
+        with pytest.raises(ValueError, match="이미 대기 중인 매칭 요청이 있습니다"):
+            MatchRequestService.create_match_request(
+                mentee=requests[0].mentee, mentor_id=other_mentor.id, message="요청"
+            )
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            MatchRequest.objects.create(
+                mentor=other_mentor, mentee=requests[0].mentee, message="요청"
+            )
+
     def test_accept_match_request_success(self):
         """매칭 요청 수락 성공 테스트"""
         mentor = User.objects.create_user(
@@ -359,6 +595,481 @@ class TestMatchRequestService:
         with pytest.raises(ValueError, match="Match request not found"):
             MatchRequestService.accept_match_request(mentor, 999)
 
+    def test_incoming_match_requests_single_query(self, django_assert_num_queries):
+        """받은 요청 목록은 요청 수와 관계없이 한 번의 쿼리로 조회"""
+        mentor = User.objects.create_user(
+            email="mentor@example.com",
+            password="password123",
+            name="멘토",
+            role="mentor",
+        )
+        for i in range(5):
+            mentee = User.objects.create_user(
+                email=f"mentee{i}@example.com",
+                password="password123",
+                name=f"멘티{i}",
+                role="mentee",
+            )
+            if i == 0:
+                Profile.objects.create(user=mentee, image_version=3)
+            MatchRequest.objects.create(mentor=mentor, mentee=mentee, message="요청")
+
+        with django_assert_num_queries(1):
+            requests = MatchRequestService.get_incoming_match_requests(mentor)
+
+        assert len(requests) == 5
+        counterparts = {r["counterpart"]["name"]: r["counterpart"] for r in requests}
+        assert counterparts["멘티0"]["imageVersion"] == 3
+        assert counterparts["멘티1"]["imageVersion"] == 0
+        assert all(r["counterpart"]["id"] == r["menteeId"] for r in requests)
+
+    def _create_pending_requests(self, count):
+        mentor = User.objects.create_user(
+            email="mentor@example.com",
+            password="password123",
+            name="멘토",
+            role="mentor",
+        )
+        Profile.objects.create(user=mentor)
+        requests = []
+        for i in range(count):
+            mentee = User.objects.create_user(
+                email=f"mentee{i}@example.com",
+                password="password123",
+                name=f"멘티{i}",
+                role="mentee",
+            )
+            requests.append(
+                MatchRequest.objects.create(
+                    mentor=mentor, mentee=mentee, message="요청"
+                )
+            )
+        return mentor, requests
+
+    def test_accept_match_request_rejects_other_pending(self):
+        """수락 시 같은 멘토의 나머지 대기 요청은 일괄 거절"""
+        mentor, requests = self._create_pending_requests(3)
+
+        response_data = MatchRequestService.accept_match_request(mentor, requests[1].id)
+
+        assert response_data["status"] == "accepted"
+        assert response_data["menteeId"] == requests[1].mentee_id
+        statuses = dict(MatchRequest.objects.values_list("id", "status"))
+        assert statuses == {
+            requests[0].id: "rejected",
+            requests[1].id: "accepted",
+            requests[2].id: "rejected",
+        }
+        assert not Profile.objects.get(user=mentor).is_available
+
+    def test_accept_match_request_fails_when_already_accepted(self):
+        """이미 수락한 요청이 있으면 다른 요청 수락 불가"""
+        mentor, requests = self._create_pending_requests(2)
+        MatchRequest.objects.filter(id=requests[0].id).update(status="accepted")
+
+        with pytest.raises(ValueError, match="이미 수락한 멘티"):
+            MatchRequestService.accept_match_request(mentor, requests[1].id)
+
+        requests[1].refresh_from_db()
+        assert requests[1].status == "pending"
+
+    def test_accept_match_request_not_pending(self):
+        """대기 중이 아닌 요청은 수락 불가"""
+        mentor, requests = self._create_pending_requests(1)
+        MatchRequest.objects.filter(id=requests[0].id).update(status="cancelled")
+
+        with pytest.raises(ValueError, match="대기 중인 요청만"):
+            MatchRequestService.accept_match_request(mentor, requests[0].id)
+
+
+@contextmanager
+def file_database(path):
+    """커밋된 테스트 DB를 파일로 복사해 새 연결(다른 스레드)이 파일 DB를 쓰게 한다
+
+    테스트 DB(공유 캐시 인메모리)는 busy_timeout 대신 곧바로 "table is locked"를
+    내므로, 실제 잠금 대기 경합은 파일 DB에서만 재현된다. 현재 스레드의 인메모리
+    연결은 열린 채로 두어 테스트 DB가 사라지지 않게 한다.
+    """
+    from django.db import connection
+
+    connection.ensure_connection()
+    target = sqlite3.connect(path)
+    connection.connection.backup(target)
+    target.close()
+
+    name = connection.settings_dict["NAME"]
+    connection.settings_dict["NAME"] = str(path)
+    try:
+        yield
+    finally:
+        connection.settings_dict["NAME"] = name
+
+
+@pytest.mark.django_db(transaction=True)
+def test_accept_match_request_concurrent(settings, tmp_path):
+    """여러 스레드에서 동시에 수락하면 하나만 수락되고 나머지 요청은 거절됨"""
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    from django.db import connection
+
+    # 쓰기 대기열 없이 파일 잠금(busy_timeout)으로만 경합한다
+    settings.SQLITE_SERIALIZE_WRITES = False
+    mentor, requests = TestMatchRequestService()._create_pending_requests(8)
+    path = tmp_path / "concurrent.sqlite3"
+    barrier = Barrier(len(requests))
+
+    def accept(request_id):
+        barrier.wait()
+        try:
+            assert connection.settings_dict["NAME"] == str(path)
+            MatchRequestService.accept_match_request(mentor, request_id)
+            return True
+        except ValueError:
+            # 먼저 수락된 요청 때문에 이미 거절된 요청 (잠금 오류는 실패로 드러나야 함)
+            return False
+        finally:
+            connection.close()
+
+    with file_database(path), ThreadPoolExecutor(len(requests)) as executor:
+        results = list(executor.map(accept, [r.id for r in requests]))
+
+    assert results.count(True) == 1
+    winner = requests[results.index(True)]
+    with sqlite3.connect(path) as db:
+        statuses = dict(db.execute("SELECT id, status FROM api_matchrequest"))
+    assert statuses.pop(winner.id) == "accepted"
+    assert set(statuses.values()) == {"rejected"}
+    assert len(statuses) == len(requests) - 1
+
+
+@pytest.mark.django_db
+def test_match_events_published_on_commit(django_capture_on_commit_callbacks):
+    """수락 시 수락/자동 거절된 멘티에게 커밋 이후 이벤트 발행"""
+    import asyncio
+
+    from .events import hub
+
+    mentor, requests = TestMatchRequestService()._create_pending_requests(2)
+    loop = asyncio.new_event_loop()
+
+    async def subscribe(user_id):
+        return hub.subscribe(user_id)
+
+    accepted = loop.run_until_complete(subscribe(requests[0].mentee_id))
+    rejected = loop.run_until_complete(subscribe(requests[1].mentee_id))
+    try:
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            MatchRequestService.accept_match_request(mentor, requests[0].id)
+        assert accepted.queue.empty()
+
+        for callback in callbacks:
+            callback()
+        loop.run_until_complete(asyncio.sleep(0))
+
+        assert accepted.queue.get_nowait()["status"] == "accepted"
+        event = rejected.queue.get_nowait()
+        assert event["id"] == requests[1].id
+        assert event["status"] == "rejected"
+    finally:
+        hub.unsubscribe(accepted)
+        hub.unsubscribe(rejected)
+        loop.close()
+
+
+@pytest.mark.django_db
+class TestMatchEventService:
+    """매칭 요청 변경 로그 테스트"""
+
+    def test_transitions_recorded(self):
+        """생성/수락(자동 거절 포함)이 같은 트랜잭션에서 로그에 기록"""
+        from .services import MatchEventService
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(2)
+        start = MatchEventService.get_changes(mentor, None)["lastSeq"]
+
+        MatchRequestService.accept_match_request(mentor, requests[0].id)
+
+        changes = MatchEventService.get_changes(mentor, start)
+        assert [(e["id"], e["status"]) for e in changes["events"]] == [
+            (requests[0].id, "accepted"),
+            (requests[1].id, "rejected"),
+        ]
+        assert changes["lastSeq"] == changes["events"][-1]["seq"]
+        assert changes["hasMore"] is False
+
+        # 멘티는 자기 요청의 변경분만 받는다
+        mentee_changes = MatchEventService.get_changes(requests[1].mentee, start)
+        assert [e["status"] for e in mentee_changes["events"]] == ["rejected"]
+
+    def test_failed_transition_not_recorded(self):
+        """실패한 상태 변경은 로그에 남지 않음"""
+        from .models import MatchEvent
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(1)
+        MatchRequest.objects.filter(id=requests[0].id).update(status="cancelled")
+
+        with pytest.raises(ValueError):
+            MatchRequestService.accept_match_request(mentor, requests[0].id)
+        assert not MatchEvent.objects.exists()
+
+    def test_get_changes_paging(self):
+        """limit 단위로 나눠 받고 lastSeq로 이어서 조회"""
+        from .services import MatchEventService
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(3)
+        MatchRequestService.bulk_transition(mentor, [r.id for r in requests], "reject")
+
+        first = MatchEventService.get_changes(mentor, 0, limit=2)
+        assert len(first["events"]) == 2
+        assert first["hasMore"] is True
+        rest = MatchEventService.get_changes(mentor, first["lastSeq"], limit=2)
+        assert [e["id"] for e in first["events"] + rest["events"]] == [
+            r.id for r in requests
+        ]
+        assert rest["hasMore"] is False
+
+        with pytest.raises(ValueError):
+            MatchEventService.get_changes(mentor, -1)
+        with pytest.raises(ValueError):
+            MatchEventService.get_changes(mentor, 0, limit=0)
+
+    def test_missed_events_for_reconnect(self):
+        """SSE 재연결 시 Last-Event-ID 이후 이벤트를 다시 보냄"""
+        from .views import _missed_events
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(2)
+        MatchRequestService.reject_match_request(mentor, requests[0].id)
+        MatchRequestService.reject_match_request(mentor, requests[1].id)
+
+        missed = _missed_events(mentor, "0")
+        assert [(e["type"], e["id"]) for e in missed] == [
+            ("match_request", requests[0].id),
+            ("match_request", requests[1].id),
+        ]
+        assert _missed_events(mentor, str(missed[-1]["seq"])) == []
+        assert _missed_events(mentor, "invalid") == []
+
+
+@pytest.mark.django_db
+class TestMatchStatsService:
+    """사용자별 매칭 요청 통계 테스트"""
+
+    def _recount(self, user):
+        field = "mentor" if user.role == "mentor" else "mentee"
+        counts = dict.fromkeys(["pending", "accepted", "rejected", "cancelled"], 0)
+        for status in MatchRequest.objects.filter(**{field: user}).values_list(
+            "status", flat=True
+        ):
+            counts[status] += 1
+        return counts
+
+    def test_stats_follow_transitions(self):
+        """생성/수락/자동 거절/취소/재요청마다 카운터가 COUNT 결과와 일치"""
+        from .services import MatchStatsService
+
+        mentor = User.objects.create_user(
+            email="mentor@example.com", password="password123", role="mentor"
+        )
+        mentees = [
+            User.objects.create_user(
+                email=f"mentee{i}@example.com", password="password123", role="mentee"
+            )
+            for i in range(3)
+        ]
+        ids = [
+            MatchRequestService.create_match_request(mentee, mentor.id, "요청")["id"]
+            for mentee in mentees
+        ]
+        MatchRequestService.accept_match_request(mentor, ids[0])
+        MatchRequestService.cancel_match_request(mentees[0], ids[0])
+        MatchRequestService.create_match_request(mentees[1], mentor.id, "다시 요청")
+
+        for user in [mentor] + mentees:
+            stats = MatchStatsService.get_stats(user)
+            assert {
+                key: stats[key]
+                for key in ("pending", "accepted", "rejected", "cancelled")
+            } == self._recount(user)
+        mentor_stats = MatchStatsService.get_stats(mentor)
+        assert mentor_stats["pending"] == 1
+        assert mentor_stats["rejected"] == 1
+        assert mentor_stats["cancelled"] == 1
+        assert mentor_stats["acceptedTotal"] == 1
+
+    def test_stats_bulk_and_empty(self, caplog):
+        """일괄 거절 반영, 카운터가 음수가 될 전이는 로그를 남기고 다시 셈"""
+        from .services import MatchStatsService
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(2)
+        assert MatchStatsService.get_stats(mentor)["pending"] == 0  # 직접 생성한 행
+
+        with caplog.at_level("ERROR", logger="api.services"):
+            MatchRequestService.bulk_transition(
+                mentor, [r.id for r in requests], "reject"
+            )
+
+        assert "would go negative" in caplog.text
+        stats = MatchStatsService.get_stats(mentor)
+        assert stats["rejected"] == 2
+        assert stats["pending"] == 0
+        for mentee in [r.mentee for r in requests]:
+            assert MatchStatsService.get_stats(mentee)["rejected"] == 1
+
+    def test_recompute_repairs_drift(self):
+        """어긋난 카운터를 보관 포함 요청 행 기준으로 복구"""
+        from .models import ArchivedMatchRequest, MatchStats
+        from .services import MatchStatsService
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(2)
+        MatchRequest.objects.filter(id=requests[0].id).update(status="accepted")
+        ArchivedMatchRequest.objects.create(
+            id=10_000,
+            mentor=mentor,
+            mentee=requests[1].mentee,
+            message="보관",
+            status="cancelled",
+            created_at=requests[1].created_at,
+            updated_at=requests[1].updated_at,
+        )
+        MatchStats.objects.create(user=mentor, pending=5, accepted_total=3)
+
+        MatchStatsService.recompute([mentor.id])
+
+        stats = MatchStatsService.get_stats(mentor)
+        assert stats == {
+            "pending": 1,
+            "accepted": 1,
+            "rejected": 0,
+            "cancelled": 1,
+            "acceptedTotal": 3,
+        }
+
+    def test_mentors_order_by_popularity(self):
+        """누적 수락 수가 많은 멘토부터 정렬"""
+        from .models import MatchStats
+
+        mentors = []
+        for i in range(3):
+            mentor = User.objects.create_user(
+                email=f"popular{i}@example.com",
+                password="password123",
+                name=f"멘토{i}",
+                role="mentor",
+            )
+            Profile.objects.create(user=mentor)
+            mentors.append(mentor)
+        MatchStats.objects.create(user=mentors[1], accepted_total=5)
+        MatchStats.objects.create(user=mentors[2], accepted_total=2)
+
+        result = MentorService.get_mentors(order_by="popularity")
+
+        assert [m["id"] for m in result] == [
+            mentors[1].id,
+            mentors[2].id,
+            mentors[0].id,
+        ]
+
+
+@pytest.mark.django_db
+class TestMatchRequestArchiveService:
+    """종료된 매칭 요청 보관 테스트"""
+
+    def _age(self, requests, status, days):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        MatchRequest.objects.filter(id__in=[r.id for r in requests]).update(
+            status=status, updated_at=timezone.now() - timedelta(days=days)
+        )
+
+    def test_archive_batch_moves_only_old_terminal_requests(self):
+        """오래된 거절/취소 요청만 배치 단위로 옮기고 이력으로 조회"""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from .models import ArchivedMatchRequest
+        from .services import DataVersionService, MatchRequestArchiveService
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(5)
+        self._age(requests[:2], "rejected", 40)
+        self._age(requests[2:3], "cancelled", 40)
+        self._age(requests[3:4], "rejected", 1)  # 아직 기간이 지나지 않음
+        version = DataVersionService.get_version(
+            DataVersionService.incoming_key(mentor.id)
+        )
+        cutoff = timezone.now() - timedelta(days=30)
+
+        assert MatchRequestArchiveService.count_archivable(cutoff) == 3
+        assert MatchRequestArchiveService.archive_batch(cutoff, 2) == 2
+        assert MatchRequestArchiveService.archive_batch(cutoff, 2) == 1
+        assert MatchRequestArchiveService.archive_batch(cutoff, 2) == 0
+
+        assert set(MatchRequest.objects.values_list("id", flat=True)) == {
+            requests[3].id,
+            requests[4].id,
+        }
+        archived = ArchivedMatchRequest.objects.get(id=requests[2].id)
+        assert archived.status == "cancelled"
+        assert archived.created_at == requests[2].created_at
+        assert (
+            DataVersionService.get_version(DataVersionService.incoming_key(mentor.id))
+            > version
+        )
+
+        history = MatchRequestArchiveService.get_archived_match_requests(
+            mentor, limit=2
+        )
+        assert [item["id"] for item in history] == [requests[2].id, requests[1].id]
+        assert history[0]["counterpart"]["name"] == "멘티2"
+        mentee_history = MatchRequestArchiveService.get_archived_match_requests(
+            requests[0].mentee
+        )
+        assert [item["id"] for item in mentee_history] == [requests[0].id]
+
+    def test_archived_pair_can_request_again(self):
+        """보관된 요청의 멘티는 같은 멘토에게 새 요청을 보낼 수 있음"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        mentor, requests = TestMatchRequestService()._create_pending_requests(1)
+        self._age(requests, "cancelled", 40)
+        call_command(
+            "archive_match_requests", "--older-than-days", "30", stdout=StringIO()
+        )
+
+        response_data = MatchRequestService.create_match_request(
+            mentee=requests[0].mentee, mentor_id=mentor.id, message="다시 요청"
+        )
+
+        assert response_data["id"] != requests[0].id
+
+    def test_archive_command_resumable(self):
+        """--max-batches로 끊어서 실행해도 다음 실행에서 이어서 처리"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from .models import ArchivedMatchRequest
+
+        _, requests = TestMatchRequestService()._create_pending_requests(3)
+        self._age(requests, "rejected", 40)
+
+        out = StringIO()
+        call_command("archive_match_requests", "--dry-run", stdout=out)
+        assert "3개" in out.getvalue()
+        assert ArchivedMatchRequest.objects.count() == 0
+
+        args = ["--batch-size", "1", "--max-batches", "2", "--pause", "0"]
+        call_command("archive_match_requests", *args, stdout=StringIO())
+        assert ArchivedMatchRequest.objects.count() == 2
+        call_command("archive_match_requests", *args, stdout=StringIO())
+        assert ArchivedMatchRequest.objects.count() == 3
+        assert not MatchRequest.objects.exists()
+
 
 @pytest.mark.django_db
 class TestServicesIntegration:
@@ -0,0 +1,163 @@
+import pytest
+
+from .models import MatchRequest, Profile, User
+
+
+def test_hopcroft_karp_augments_greedy_matching():
+    """탐욕 배정으로 막힌 정점은 증가 경로로 기존 짝을 바꿔 매칭"""
+    from .matching import UNMATCHED, hopcroft_karp
+
+    # 멘티0은 멘토0을 선호하지만 멘티1은 멘토0만 가능
+    assert hopcroft_karp([[0, 1], [0]], 2) == [1, 0]
+    assert hopcroft_karp([[0], [0], []], 1) == [0, UNMATCHED, UNMATCHED]
+    # 긴 증가 경로 (0-0, 1-1, 2-2 를 모두 밀어내야 멘티3이 매칭됨)
+    assert hopcroft_karp([[0, 1], [1, 2], [2, 3], [0]], 4) == [1, 2, 3, 0]
+
+
+@pytest.mark.django_db
+class TestMatchSolverService:
+    """대기 요청 일괄 배정 테스트"""
+
+    def _user(self, email, role):
+        user = User.objects.create_user(
+            email=email, password="password123", name=email.split("@")[0], role=role
+        )
+        Profile.objects.create(user=user)
+        return user
+
+    def _setup(self):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        mentors = [self._user(f"mentor{i}@example.com", "mentor") for i in range(3)]
+        mentees = [self._user(f"mentee{i}@example.com", "mentee") for i in range(5)]
+        # 멘토2는 이미 수락한 멘티가 있어 배정 대상이 아님
+        MatchRequest.objects.create(
+            mentor=mentors[2], mentee=mentees[4], message="수락됨", status="accepted"
+        )
+        requests = [
+            MatchRequest.objects.create(mentor=mentor, mentee=mentee, message="요청")
+            for mentor, mentee in [
+                (mentors[0], mentees[0]),
+                (mentors[0], mentees[1]),
+                (mentors[1], mentees[2]),
+                (mentors[2], mentees[3]),
+            ]
+        ]
+        # 먼저 보낸 요청이 우선
+        now = timezone.now()
+        for i, request in enumerate(requests):
+            MatchRequest.objects.filter(id=request.id).update(
+                created_at=now - timedelta(minutes=10 - i)
+            )
+        return mentors, mentees, requests
+
+    def test_solve_dry_run(self):
+        from .services import MatchSolverService
+
+        mentors, mentees, requests = self._setup()
+
+        result = MatchSolverService.solve(dry_run=True)
+
+        assert result["candidates"] == 3
+        assert result["matched"] == 2
+        assert result["rejected"] == 1
+        assert result["pairs"] == [
+            {
+                "id": requests[0].id,
+                "mentorId": mentors[0].id,
+                "menteeId": mentees[0].id,
+            },
+            {
+                "id": requests[2].id,
+                "mentorId": mentors[1].id,
+                "menteeId": mentees[2].id,
+            },
+        ]
+        assert MatchRequest.objects.filter(status="pending").count() == 4
+
+    def test_solve_applies_in_one_transaction(self, django_capture_on_commit_callbacks):
+        """수락과 같은 규칙으로 반영되고 통계/변경 로그도 함께 갱신"""
+        from .models import MatchEvent
+        from .services import MatchSolverService, MatchStatsService
+
+        mentors, mentees, requests = self._setup()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            result = MatchSolverService.solve()
+
+        assert not result["dryRun"]
+        statuses = dict(MatchRequest.objects.values_list("id", "status"))
+        assert [statuses[r.id] for r in requests] == [
+            "accepted",
+            "rejected",
+            "accepted",
+            "pending",
+        ]
+        assert not Profile.objects.get(user=mentors[0]).is_available
+        assert not Profile.objects.get(user=mentors[1]).is_available
+        assert MatchStatsService.get_stats(mentors[0])["accepted"] == 1
+        assert MatchStatsService.get_stats(mentees[1])["rejected"] == 1
+        assert MatchEvent.objects.count() == 3
+        assert len(callbacks) == 3
+
+        # 다시 실행하면 배정할 요청이 없음
+        assert MatchSolverService.solve()["matched"] == 0
+
+    def test_solve_rolls_back_when_state_changed(self, monkeypatch):
+        from .services import MatchSolverService
+
+        _, _, requests = self._setup()
+        plan = MatchSolverService.plan()
+        MatchRequest.objects.filter(id=requests[2].id).update(status="cancelled")
+        monkeypatch.setattr(MatchSolverService, "plan", lambda since=None: plan)
+
+        with pytest.raises(ValueError, match="다시 실행"):
+            MatchSolverService.solve()
+        assert MatchRequest.objects.get(id=requests[0].id).status == "pending"
+
+    def test_solve_dry_run_skips_write_transaction(self, monkeypatch):
+        """dry run은 읽기 트랜잭션에서만 계산하고 쓰기 트랜잭션을 잡지 않음"""
+        from . import services
+        from .services import MatchSolverService
+
+        self._setup()
+
+        def no_write(*args, **kwargs):
+            raise AssertionError("dry run took a write transaction")
+
+        monkeypatch.setattr(services, "write_transaction", no_write)
+        assert MatchSolverService.solve(dry_run=True)["matched"] == 2
+
+    def test_solve_rolls_back_when_request_arrives(self, monkeypatch):
+        """계산과 반영 사이에 배정된 멘토에게 새 대기 요청이 오면 되돌림"""
+        from .services import MatchSolverService
+
+        mentors, _, requests = self._setup()
+        late_mentee = self._user("mentee5@example.com", "mentee")
+        apply = MatchSolverService._apply
+
+        def apply_after_request(pairs, rejected):
+            MatchRequest.objects.create(
+                mentor=mentors[1], mentee=late_mentee, message="늦은 요청"
+            )
+            apply(pairs, rejected)
+
+        monkeypatch.setattr(
+            MatchSolverService, "_apply", staticmethod(apply_after_request)
+        )
+        with pytest.raises(ValueError, match="다시 실행"):
+            MatchSolverService.solve()
+        assert MatchRequest.objects.get(id=requests[0].id).status == "pending"
+
+    def test_solve_command(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        self._setup()
+        out = StringIO()
+        call_command("solve_match_requests", "--dry-run", "--show-pairs", stdout=out)
+        assert "[dry run] 수락 2개, 자동 거절 1개" in out.getvalue()
+        assert MatchRequest.objects.filter(status="accepted").count() == 1
@@ -1 +1,111 @@
-# Create your views here.
+"""
+Ninja 라우터 밖에서 처리하는 뷰 (스트리밍 응답)
+"""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+
+from .api import GlobalAuth
+from .events import TooManyConnections, format_sse, get_backend, hub
+from .services import EventTicketService, MatchEventService
+
+
+def _missed_events(user, last_event_id: str):
+    """재연결한 클라이언트가 놓친 이벤트 (너무 많으면 resync 하나로 대체)"""
+    try:
+        after = int(last_event_id)
+    except ValueError:
+        return []
+    changes = MatchEventService.get_changes(user, max(after, 0))
+    if changes["hasMore"]:
+        return [{"type": "resync"}]
+    return [
+        {
+            "type": "match_request",
+            "seq": event["seq"],
+            "id": event["id"],
+            "status": event["status"],
+            "mentorId": event["mentorId"],
+            "menteeId": event["menteeId"],
+        }
+        for event in changes["events"]
+    ]
+
+
+async def _event_stream(subscriber, heartbeat: float, missed=()):
+    last_seq = 0
+    try:
+        yield "retry: 3000\n\n"
+        for event in missed:
+            yield format_sse(event)
+            last_seq = event.get("seq", last_seq)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                # 프록시가 유휴 연결을 끊지 않도록
+                yield ": ping\n\n"
+                continue
+            if event.get("seq", last_seq + 1) <= last_seq:
+                # 재전송한 이벤트와 중복
+                continue
+            yield format_sse(event)
+            if event["type"] == "resync":
+                # 밀린 이벤트를 버렸으므로 클라이언트가 다시 조회 후 재연결
+                break
+    finally:
+        hub.unsubscribe(subscriber)
+
+
+async def match_request_events(request):
+    """매칭 요청 변경 이벤트 스트림 (SSE)"""
+    # EventSource는 헤더를 못 붙이므로 POST /match-requests/events/ticket으로 받은
+    # 1회용 티켓을 쿼리로 받는다 (JWT는 쿼리 문자열로 받지 않는다)
+    user = None
+    auth_header = request.headers.get("Authorization", "")
+    if auth_header.startswith("Bearer "):
+        token = auth_header[len("Bearer ") :]
+        user = await sync_to_async(GlobalAuth().authenticate)(request, token)
+    elif request.GET.get("ticket"):
+        user = await sync_to_async(EventTicketService.redeem)(request.GET["ticket"])
+    if user is None:
+        return JsonResponse({"error": "Unauthorized"}, status=401)
+
+    if not isinstance(request, ASGIRequest):
+        # WSGI에서는 스트림 전체를 버퍼링하므로 무한 스트림을 내려줄 수 없다
+        return JsonResponse(
+            {"error": "이벤트 스트림은 ASGI 서버에서만 지원됩니다."}, status=503
+        )
+
+    get_backend().start()
+    try:
+        subscriber = hub.subscribe(user.id)
+    except TooManyConnections:
+        return JsonResponse({"error": "동시 연결 수를 초과했습니다."}, status=429)
+
+    # 구독을 먼저 등록한 뒤 로그를 읽어야 그 사이 변경을 놓치지 않는다
+    missed = []
+    # 티켓으로 새로 연결한 클라이언트는 헤더 대신 쿼리로 마지막 id를 보낸다
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get(
+        "lastEventId"
+    )
+    if last_event_id:
+        try:
+            missed = await sync_to_async(_missed_events)(user, last_event_id)
+        except BaseException:
+            hub.unsubscribe(subscriber)
+            raise
+
+    response = StreamingHttpResponse(
+        _event_stream(
+            subscriber, getattr(settings, "MATCH_EVENTS_HEARTBEAT", 15), missed
+        ),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -45,7 +45,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
-    "corsheaders.middleware.CorsMiddleware",  # CORS 미들웨어 (가장 먼저)
+    "api.metrics.MetricsMiddleware",  # 요청 전체 처리 시간을 재도록 가장 먼저
+    "api.profiling.ProfilingMiddleware",  # 서명된 X-Profile 요청만 cProfile 실행
+    "corsheaders.middleware.CorsMiddleware",  # CORS 미들웨어
+    "api.middleware.PrecompressedResponseMiddleware",  # 미리 압축된 응답 변형
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -82,9 +85,22 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": {
+            # 읽고 나서 쓰는 트랜잭션이 잠금 승격 중 곧바로 "database is locked"로
+            # 실패하지 않도록 시작할 때 쓰기 잠금을 잡는다
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 5,
+        },
     }
 }
 
+# 새 SQLite 연결마다 api.db.DEFAULT_PRAGMAS를 적용한다 (api.db.configure_connection).
+# 바꿔야 할 때만 SQLITE_PRAGMAS에 전체 dict를 지정한다 (빈 dict면 적용 안 함).
+# True면 프로세스 안의 쓰기 트랜잭션을 대기열 순서대로 하나씩 실행
+# (스레드가 많은 단일 워커에서 파일 잠금 경쟁 대신 사용, benchmark_sqlite로 비교)
+SQLITE_SERIALIZE_WRITES = False
+SQLITE_WRITE_QUEUE_TIMEOUT = 5  # 초
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -142,3 +158,79 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 
 CORS_ALLOW_ALL_ORIGINS = False  # 개발환경에서만 True로 설정 가능
+
+# 프론트엔드에서 읽어야 하는 응답 헤더 (조건부 요청, 페이지 커서)
+CORS_EXPOSE_HEADERS = ["ETag", "X-Next-Cursor"]
+
+# 미리 압축된 응답 변형(gzip/brotli)을 캐시해서 내려줄 경로 (정확히 일치)
+# static: 배포 중 바뀌지 않는 공개 응답, 캐시에 있으면 뷰를 실행하지 않음
+# etag: 뷰가 만든 ETag(버전 카운터)를 내용 버전으로 사용
+PRECOMPRESSED_PATHS = {
+    "/api/mentors": "etag",
+    "/api/openapi.json": "static",
+}
+PRECOMPRESSED_CACHE_SIZE = 64
+
+# 매칭 요청 변경 이벤트 스트림 (SSE)
+# manage.py serve가 워커 2개 이상으로 뜨면 LocalBackend 대신
+# "api.events.SQLitePollingBackend"를 쓴다 (워커 사이에 이벤트 공유)
+MATCH_EVENTS_BACKEND = "api.events.LocalBackend"
+MATCH_EVENTS_BACKEND_OPTIONS = {}
+MATCH_EVENTS_HEARTBEAT = 15  # 초
+MATCH_EVENTS_MAX_CONNECTIONS_PER_USER = 3
+
+# 거절/취소 후 이 기간이 지난 매칭 요청은 archive_match_requests 커맨드로 보관
+MATCH_REQUEST_ARCHIVE_AFTER_DAYS = 30
+
+# 멘토 추천 벡터 인덱스 (numpy 필요): 해시 특징 차원 수, 전체 재구성 주기(초)
+RECOMMENDER_DIMENSIONS = 256
+RECOMMENDER_TTL = 300
+
+# 엔드포인트별 지연/쿼리 메트릭 (/metrics, Prometheus 텍스트 형식)
+# METRICS_DIR: 워커 프로세스별 집계 파일을 모을 디렉터리
+# (None이면 단일 프로세스 집계, serve 커맨드는 임시 디렉터리를 만들어 사용)
+METRICS_ENABLED = True
+METRICS_DIR = None
+METRICS_ALLOWED_IPS = ["127.0.0.1", "::1"]  # None이면 모두 허용
+METRICS_LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+METRICS_FLUSH_INTERVAL = 1.0  # 초
+
+# 요청 단위 프로파일 캡처 (X-Profile 헤더 / ?__profile=, request_profiles 커맨드)
+# 토큰은 request_profiles --token으로 발급, PROFILING_DIR에는 최근 캡처만 유지
+PROFILING_ENABLED = True
+PROFILING_DIR = BASE_DIR / "profiles"
+PROFILING_MAX_CAPTURES = 50
+PROFILING_MAX_QUERIES = 500  # 캡처 하나에 남길 SQL 수
+PROFILING_TOKEN_MAX_AGE = 3600  # 초
+
+# 로깅: api.* 로그는 요청 스레드에서 큐에 넣기만 하고, 포맷/토큰 가리기/출력은
+# 리스너 스레드가 맡는다 (api/log.py). 인증 성공처럼 양이 많은 INFO 이하 로그는
+# 로거별 비율(sample)로 표본만 남긴다.
+LOGGING_CONFIG = "api.log.configure_logging"
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "standard": {"format": "%(asctime)s %(levelname)s [%(name)s] %(message)s"},
+    },
+    "filters": {
+        "redact": {"()": "api.log.RedactingFilter"},
+        "sample": {"()": "api.log.SamplingFilter", "rates": {"api.auth": 0.01}},
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "standard",
+            "filters": ["redact"],
+        },
+        "queue": {
+            "()": "api.log.QueueHandler",
+            "targets": ["console"],
+            "maxsize": 10000,
+            "filters": ["sample"],
+        },
+    },
+    "loggers": {
+        "api": {"handlers": ["queue"], "level": "INFO"},
+    },
+}
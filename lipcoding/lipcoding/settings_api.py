@@ -0,0 +1,39 @@
+"""
+JWT API 전용 경량 설정
+
+세션/메시지/admin/개발 도구 앱과 그 미들웨어를 빼서 워커 시작 시 불러오는
+모듈을 줄인다. API는 JWT(Bearer)로만 인증하고 프론트엔드 페이지는
+템플릿만 렌더링하므로 세션 기반 인증이 필요 없다.
+
+    DJANGO_SETTINGS_MODULE=lipcoding.settings_api python manage.py serve
+    python manage.py profile_imports --settings lipcoding.settings_api
+"""
+
+from .settings import *
+
+# admin 페이지와 세션 로그인, 플래시 메시지, django_extensions 개발 명령
+UNUSED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "django_extensions",
+]
+UNUSED_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in UNUSED_APPS]
+MIDDLEWARE = [name for name in MIDDLEWARE if name not in UNUSED_MIDDLEWARE]
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.request",
+            ],
+        },
+    }
+]
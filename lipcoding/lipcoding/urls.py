@@ -15,12 +15,22 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 from api.api import api
+from api.metrics import metrics_view
+from api.views import match_request_events
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
+    # SSE 스트림은 Ninja 밖의 비동기 뷰로 처리
+    path("api/match-requests/events", match_request_events),
     path("api/", api.urls),
+    path("metrics", metrics_view),  # 내부 수집용 (METRICS_ALLOWED_IPS)
     path("", include("frontend.urls")),  # Frontend 앱
 ]
+
+# 경량 설정(settings_api)에서는 admin을 빼므로 설치된 경우에만 불러온다
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
@@ -42,5 +42,8 @@ echo ""
 # 환경 변수 설정
 export DJANGO_SETTINGS_MODULE=lipcoding.settings
 
-# Django 개발 서버 실행 (8080 포트)
-python manage.py runserver 8080 &
+# 프리포크 서버 실행 (8080 포트, CPU 코어 수만큼 uvicorn 워커)
+# kill -HUP <master pid>는 워커를 순차 교체하지만, 기본(preload)에서는 마스터가
+# 이미 불러온 코드로 fork하므로 코드 변경을 반영하려면 서버를 다시 시작하거나
+# --no-preload로 띄운다
+exec python manage.py serve --port 8080